@@ -0,0 +1,128 @@
+"""
+Benchmark the construction of the Arbor recipe, without simulating.
+
+Places ``-n`` LIF cells, stores ``--indegree`` random connections onto each of them, and
+builds the recipe of an Arbor simulation. Reports the time to cache the connections of
+each rank, the time to look up the cell kind and the connections of every local gid, as
+Arbor does during its domain decomposition, and the peak resident memory of each rank:
+
+.. code-block:: bash
+
+  python benchmarks/bench_recipe.py -n 1e5
+  mpirun -n 4 python benchmarks/bench_recipe.py -n 1e6
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+from bsb import MPI, Chunk, Configuration, Scaffold, Storage
+
+from bsb_arbor import ArborAdapter
+
+
+def peak_rss():
+    # Peak resident memory of this process, in MiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build(path, args):
+    cfg = Configuration.default(
+        network={"x": 400, "y": 400, "z": 400, "chunk_size": 200},
+        partitions={"space": {"type": "layer", "thickness": 400}},
+        cell_types={"cell": {"spatial": {"radius": 1, "count": args.n}}},
+        placement={
+            "place": {
+                "strategy": "bsb.placement.RandomPlacement",
+                "cell_types": ["cell"],
+                "partitions": ["space"],
+            }
+        },
+        simulations={
+            "bench": {
+                "simulator": "arbor",
+                "duration": 1,
+                "resolution": 0.1,
+                "cell_models": {"cell": {"model_strategy": "lif"}},
+                "connection_models": {"bench": {"weight": 1, "delay": 1}},
+                "devices": {},
+            }
+        },
+    )
+    network = Scaffold(cfg, Storage("hdf5", path))
+    network.compile(clear=True)
+    if MPI.get_rank() == 0:
+        cell_type = network.cell_types.cell
+        size = network.network.chunk_size
+        stats = cell_type.get_placement_set().get_chunk_stats()
+        chunks = [(Chunk.from_id(int(id), size), n) for id, n in stats.items() if n]
+        cs = network.require_connectivity_set(cell_type, cell_type, "bench")
+        rng = np.random.default_rng(0)
+        with network.storage._engine.write_scope():
+            for dst, n_dst in chunks:
+                # Each cell of the chunk receives from random cells of random chunks.
+                count = n_dst * args.indegree
+                sources = rng.integers(len(chunks), size=count)
+                targets = np.repeat(np.arange(n_dst), args.indegree)
+                for i in np.unique(sources):
+                    src, n_src = chunks[i]
+                    mask = sources == i
+                    cs.chunk_connect(
+                        src,
+                        dst,
+                        locs(rng.integers(n_src, size=np.count_nonzero(mask))),
+                        locs(targets[mask]),
+                    )
+    MPI.barrier()
+    return network
+
+
+def locs(ids):
+    return np.column_stack((ids, np.full((len(ids), 2), -1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, default=1e5, help="cells")
+    parser.add_argument("--indegree", type=int, default=10)
+    args = parser.parse_args()
+    args.n = int(args.n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = MPI.bcast(os.path.join(tmp, "bench.hdf5"))
+        network = build(path, args)
+        simulation = network.simulations.bench
+        adapter = ArborAdapter()
+        simdata = adapter._create_simdata(simulation)
+        simdata.gid_manager = adapter.get_gid_manager(simulation, simdata)
+        simdata.populations = simdata.gid_manager.get_populations()
+        before = peak_rss()
+        MPI.barrier()
+        start = time.perf_counter()
+        recipe = adapter.get_recipe(simulation, simdata)
+        cached = time.perf_counter() - start
+        start = time.perf_counter()
+        connections = 0
+        for gid in simdata.gid_manager.all():
+            recipe.cell_kind(gid)
+            connections += len(recipe.connections_on(gid))
+        queried = time.perf_counter() - start
+        timings = MPI.gather((cached, queried, connections, before, peak_rss()))
+        MPI.barrier()
+    if MPI.get_rank() == 0:
+        print(f"{args.n} cells, {args.n * args.indegree} connections")
+        print(
+            f"{'rank':>5} {'cache (s)':>10} {'query (s)':>10} {'connections':>12}"
+            f" {'peak before (MiB)':>18} {'peak after (MiB)':>17}"
+        )
+        for rank, (cached, queried, connections, before, after) in enumerate(timings):
+            print(
+                f"{rank:>5} {cached:>10.2f} {queried:>10.2f} {connections:>12}"
+                f" {before:>18.0f} {after:>17.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from arbor import units as U
 from bsb import (
     AdapterError,
     Chunk,
+    ResultFlushController,
     SimulationData,
     SimulatorAdapter,
     UnknownGIDError,
@@ -16,6 +17,8 @@ from bsb import (
     warn,
 )
 
+from .connection import Receiver
+
 if typing.TYPE_CHECKING:  # pragma: nocover
     from .simulation import ArborSimulation
 
@@ -62,6 +65,50 @@ class SingleReceiverCollection(list):
         super().append(rcv)
 
 
+class ConnectionTable:
+    """
+    Rank-local table of connections, grouped by the gid they arrive on or depart from,
+    in compressed sparse row format: the columns are sorted by gid, and each gid points
+    to the slice of its rows.
+    """
+
+    def __init__(self, gids, keys, *columns):
+        """
+        :param gids: Sorted gids to store the connections of.
+        :type gids: numpy.ndarray
+        :param keys: Gid of each connection.
+        :type keys: numpy.ndarray
+        :param columns: Arrays with the data of each connection.
+        """
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        self._gids = gids
+        self._starts = np.searchsorted(keys, gids)
+        self._stops = np.searchsorted(keys, gids, side="right")
+        self._columns = [column[order] for column in columns]
+
+    def __len__(self):
+        return len(self._gids)
+
+    def __contains__(self, gid):
+        i = np.searchsorted(self._gids, gid)
+        return i < len(self._gids) and self._gids[i] == gid
+
+    def __getitem__(self, gid):
+        """
+        Get the rows of a gid.
+
+        :returns: The slice of each column that belongs to the gid.
+        :rtype: tuple[numpy.ndarray]
+        :raises KeyError: If the gid is not in the table.
+        """
+        i = np.searchsorted(self._gids, gid)
+        if i == len(self._gids) or self._gids[i] != gid:
+            raise KeyError(gid)
+        rows = slice(self._starts[i], self._stops[i])
+        return tuple(column[rows] for column in self._columns)
+
+
 class Population:
     """
     Represents a population of cells for the Arbor simulator.
@@ -249,6 +296,15 @@ class GIDManager:
             Population(simdata, model, offset)
             for model, offset in self._gid_offsets.items()
         ]
+        # Sorted gid ranges of all populations, and the population of each range.
+        ranges = sorted(
+            (start, stop, i)
+            for i, pop in enumerate(self._populations)
+            for start, stop in pop._ranges
+        )
+        self._starts, self._stops, self._owners = (
+            np.array(ranges, dtype=int).reshape(-1, 3).T
+        )
 
     def sort_models(self, models):
         return sorted(
@@ -267,14 +323,28 @@ class GIDManager:
         return self._lookup(gid).model
 
     def _lookup(self, gid):
-        try:
-            return next(c for c in self._populations if gid in c)
-        except StopIteration:
-            raise UnknownGIDError(f"Can't find gid {gid}.") from None
+        i = np.searchsorted(self._starts, gid, side="right") - 1
+        if i < 0 or gid >= self._stops[i]:
+            raise UnknownGIDError(f"Can't find gid {gid}.")
+        return self._populations[self._owners[i]]
 
     def all(self):
         yield from itertools.chain.from_iterable(self._populations)
 
+    def get_gids(self):
+        """
+        Get the gids of all populations, sorted.
+
+        :rtype: numpy.ndarray
+        """
+        return np.concatenate(
+            [
+                np.arange(start, stop)
+                for start, stop in zip(self._starts, self._stops, strict=True)
+            ]
+            + [np.empty(0, dtype=int)]
+        )
+
     def get_populations(self):
         return {pop.model: pop for pop in self._populations}
 
@@ -337,9 +407,15 @@ class ArborRecipe(arbor.recipe):
         return model.get_description(gid)
 
     def connections_on(self, gid):
+        # Receivers are only created for the gid that Arbor asks about, from the rows of
+        # the connection table.
+        receivers = self._simdata.gid_manager.lookup_model(gid).make_receiver_collection()
+        rows = (column.tolist() for column in self._simdata.connections_on[gid])
+        for conn_model, from_gid, loc_from, loc_on in zip(*rows, strict=True):
+            receivers.append(Receiver(conn_model, from_gid, loc_from, loc_on))
         return [
             arbor.connection(rcv.from_(), rcv.on(), rcv.weight, rcv.delay * U.ms)
-            for rcv in self._simdata.connections_on[gid]
+            for rcv in receivers
         ]
 
     def gap_junctions_on(self, gid):
@@ -448,6 +524,11 @@ class ArborAdapter(SimulatorAdapter):
             for t, checkpoint_controllers in self.get_next_checkpoint():
                 arbor_sim.run(t * U.ms, dt=simulation.resolution * U.ms)
                 self.execute_checkpoints(checkpoint_controllers)
+                if any(
+                    isinstance(c, ResultFlushController) for c in checkpoint_controllers
+                ):
+                    # The recorded spikes were streamed to the results, free them.
+                    arbor_sim.clear_samplers()
             report(f"Completed simulation. {time.time() - start:.2f}s", level=1)
             if simulation.profiling and arbor.config()["profiling"]:
                 report("printing profiler summary", level=2)
@@ -480,11 +561,9 @@ class ArborAdapter(SimulatorAdapter):
                 conn_model.create_gap_junctions_on(simdata.gap_junctions_on, conns)
 
     def _cache_connections(self, simulation, simdata):
-        simdata.connections_on = {
-            gid: simdata.gid_manager.lookup_model(gid).make_receiver_collection()
-            for gid in simdata.gid_manager.all()
-        }
-        simdata.connections_from = {gid: [] for gid in simdata.gid_manager.all()}
+        # Only the blocks of connections that arrive on or depart from our chunks are
+        # read, into tables of the gids that we simulate.
+        on, from_ = [], []
         for conn_model in simulation.connection_models.values():
             if conn_model.gap:
                 continue
@@ -495,18 +574,28 @@ class ArborAdapter(SimulatorAdapter):
                     pop_pre = simdata.populations[model]
                 if model.cell_type is conn_set.post_type:
                     pop_post = simdata.populations[model]
-            # Get the arriving connection iterator
-            conns_on = conn_set.load_connections().to(simdata.chunks).as_globals()
-            # Create the arriving connections
-            conn_model.create_connections_on(
-                simdata.connections_on, conns_on, pop_pre, pop_post
-            )
-            # Get the outgoing connection iterator
-            conns_from = conn_set.load_connections().from_(simdata.chunks).as_globals()
-            # Create the outgoing connections
-            conn_model.create_connections_from(
-                simdata.connections_from, conns_from, pop_pre, pop_post
-            )
+            conns = conn_set.load_connections().as_globals()
+            for _, pre_locs, _, post_locs in conns.to(simdata.chunks).chunk_iter():
+                on.append(
+                    (
+                        np.full(len(pre_locs), conn_model, dtype=object),
+                        pre_locs[:, 0] + pop_pre.offset,
+                        pre_locs[:, 1:],
+                        post_locs[:, 0] + pop_post.offset,
+                        post_locs[:, 1:],
+                    )
+                )
+            for _, pre_locs, _, _ in conns.from_(simdata.chunks).chunk_iter():
+                from_.append((pre_locs[:, 0] + pop_pre.offset, pre_locs[:, 1:]))
+        gids = simdata.gid_manager.get_gids()
+        models, pre_gids, pre_locs, post_gids, post_locs = _concat_columns(
+            on, [object, int, (int, 2), int, (int, 2)]
+        )
+        simdata.connections_on = ConnectionTable(
+            gids, post_gids, models, pre_gids, pre_locs, post_locs
+        )
+        pre_gids, pre_locs = _concat_columns(from_, [int, (int, 2)])
+        simdata.connections_from = ConnectionTable(gids, pre_gids, pre_locs)
 
     def _cache_devices(self, simulation, simdata):
         simdata.devices_on = {gid: [] for gid in simdata.gid_manager.all()}
@@ -527,6 +616,17 @@ class ArborAdapter(SimulatorAdapter):
         simdata.chunks = simdata.node_chunk_alloc[self.comm.get_rank()]
 
 
+def _concat_columns(blocks, dtypes):
+    # Concatenate the columns of a list of blocks of columns.
+    return [
+        np.concatenate(
+            [np.empty((0, *np.atleast_1d(dtype)[1:]), dtype=np.atleast_1d(dtype)[0])]
+            + [block[i] for block in blocks]
+        )
+        for i, dtype in enumerate(dtypes)
+    ]
+
+
 def _all_bools(arr):
     try:
         return all(np.issubdtype(type(b), np.bool_) for b in arr)
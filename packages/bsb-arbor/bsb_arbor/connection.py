@@ -1,6 +1,5 @@
 import arbor
-import tqdm
-from bsb import ConnectionModel, config, options
+from bsb import ConnectionModel, config
 
 
 class Receiver:
@@ -52,18 +51,6 @@ class ArborConnection(ConnectionModel):
             conn = Connection(pre_loc, post_loc)
             gj_on_gid.setdefault(conn.from_id, []).append(conn)
 
-    def create_connections_on(self, conns_on_gid, conns, pop_pre, pop_post):
-        for pre_loc, post_loc in tqdm.tqdm(
-            conns, total=len(conns), desc=self.name, disable=options.verbosity < 2
-        ):
-            conns_on_gid[post_loc[0] + pop_post.offset].append(
-                Receiver(self, pre_loc[0] + pop_pre.offset, pre_loc[1:], post_loc[1:])
-            )
-
-    def create_connections_from(self, conns_from_gid, conns, pop_pre, pop_post):
-        for pre_loc, _post_loc in conns:
-            conns_from_gid[int(pre_loc[0] + pop_pre.offset)].append(pre_loc[1:])
-
     def gap_junction(self, conn):
         l_ = arbor.cell_local_label(f"gap_{conn.to_compartment.id}")
         g = arbor.cell_global_label(int(conn.from_id), f"gap_{conn.from_compartment.id}")
@@ -1,7 +1,7 @@
 import unittest
 
 import numpy as np
-from bsb import MPI, get_simulation_adapter
+from bsb import MPI, UnknownGIDError, get_simulation_adapter
 from bsb_test import (
     ConfigFixture,
     MorphologiesFixture,
@@ -10,6 +10,8 @@ from bsb_test import (
     RandomStorageFixture,
 )
 
+from bsb_arbor.adapter import ConnectionTable
+
 
 @unittest.skipIf(MPI.get_size() > 1, "Skipped during parallel testing.")
 class TestArborPopulation(
@@ -76,3 +78,38 @@ class TestArborPopulation(
         float_test = np.array(list_test, dtype=np.float32)
         with self.assertRaises(ValueError):
             pop[float_test]
+
+    def test_gid_lookup(self):
+        """
+        Test that every gid is found in its population, and that unknown gids raise.
+        """
+        self.network.compile(clear=True)
+        sim = self.network.simulations.test
+        adapter = get_simulation_adapter(sim.simulator)
+        simdata = adapter.prepare(sim)
+        gid_manager = simdata.gid_manager
+        for model, pop in simdata.populations.items():
+            for gid in pop:
+                self.assertIs(model, gid_manager.lookup_model(gid))
+        gids = gid_manager.get_gids()
+        self.assertClose(sorted(gid_manager.all()), gids)
+        with self.assertRaises(UnknownGIDError):
+            gid_manager.lookup_model(-1)
+        with self.assertRaises(UnknownGIDError):
+            gid_manager.lookup_model(gids[-1] + 1)
+
+
+class TestConnectionTable(NumpyTestCase, unittest.TestCase):
+    def test_rows(self):
+        keys = np.array([3, 1, 3, 5, 1, 3])
+        table = ConnectionTable(np.array([1, 2, 3]), keys, np.arange(6), keys * 10)
+        self.assertEqual(3, len(table))
+        self.assertIn(2, table)
+        self.assertNotIn(5, table)
+        rows, values = table[1]
+        self.assertClose([1, 4], rows, "rows should keep their order")
+        self.assertClose([10, 10], values)
+        self.assertEqual(0, len(table[2][0]), "gid without connections should be empty")
+        self.assertClose([0, 2, 5], table[3][0])
+        with self.assertRaises(KeyError):
+            table[5]
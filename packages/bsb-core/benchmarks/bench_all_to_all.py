@@ -0,0 +1,78 @@
+"""
+Benchmark the peak memory of ``AllToAll`` with a low ``affinity``.
+
+Connects ``--pre`` to ``--post`` cells with probability ``--affinity``, without storing
+the connections, and reports the time and the peak memory of the strategy next to the
+memory that a Bernoulli mask over all the candidate pairs, with their pre and post
+indices, would take. The run fails if the peak memory exceeds ``--ceiling`` MB.
+
+.. code-block:: bash
+
+  python benchmarks/bench_all_to_all.py --pre 1e5 --post 1e5 --affinity 1e-3
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from bsb.connectivity import AllToAll
+
+
+class PlacementSet:
+    def __init__(self, n):
+        self._n = n
+
+    def __len__(self):
+        return self._n
+
+
+class Collection:
+    def __init__(self, n):
+        self.placement = [PlacementSet(n)]
+
+
+class CountingAllToAll(AllToAll):
+    def connect_cells(self, pre_set, post_set, src_locs, dest_locs, tag=None):
+        self.count += len(src_locs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pre", type=float, default=1e5)
+    parser.add_argument("--post", type=float, default=1e5)
+    parser.add_argument("--affinity", type=float, nargs="+", default=[1e-3])
+    parser.add_argument("--ceiling", type=float, default=256, help="peak memory (MB)")
+    args = parser.parse_args()
+    n_pre, n_post = int(args.pre), int(args.post)
+    # A bool mask, and an int64 pre and post index per candidate pair.
+    dense = n_pre * n_post * 17 / 1e6
+    print(
+        f"{'affinity':>9} {'conns':>11} {'time (s)':>9} {'conns/s':>10}"
+        f" {'peak (MB)':>10} {'mask (MB)':>10}"
+    )
+    failed = False
+    for affinity in args.affinity:
+        strategy = CountingAllToAll(
+            affinity=affinity,
+            presynaptic=dict(cell_types=[]),
+            postsynaptic=dict(cell_types=[]),
+        )
+        strategy.count = 0
+        tracemalloc.start()
+        start = time.perf_counter()
+        strategy.connect(Collection(n_pre), Collection(n_post))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        failed = failed or peak > args.ceiling
+        print(
+            f"{affinity:>9.0e} {strategy.count:>11} {elapsed:>9.2f}"
+            f" {strategy.count / elapsed:>10.0f} {peak:>10.1f} {dense:>10.0f}"
+        )
+    if failed:
+        sys.exit(f"Peak memory exceeded the ceiling of {args.ceiling} MB.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the sampling engines of ``FixedIndegree``.
+
+Connects ``-n`` postsynaptic cells to ``--indegree`` presynaptic cells each, out of
+``--pre`` presynaptic cells, and reports the best time out of ``--repeat`` runs of each
+engine, without storing the connections. Pass ``--poisson`` to draw the indegree of each
+postsynaptic cell from a Poisson distribution with mean ``--indegree`` instead.
+
+.. code-block:: bash
+
+  python benchmarks/bench_degree.py -n 1e4 1e5 1e6 --pre 1e3 1e6 --indegree 200
+"""
+
+import argparse
+import time
+
+from bsb.connectivity import FixedIndegree
+
+
+class PlacementSet:
+    def __init__(self, n):
+        self._n = n
+
+    def __len__(self):
+        return self._n
+
+
+class Collection:
+    def __init__(self, n):
+        self.placement = [PlacementSet(n)]
+
+
+class CountingFixedIndegree(FixedIndegree):
+    def connect_cells(self, pre_set, post_set, src_locs, dest_locs, tag=None):
+        self.count += len(src_locs)
+
+
+def run(strategy, n_pre, n_post, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        strategy.count = 0
+        start = time.perf_counter()
+        strategy.connect(Collection(n_pre), Collection(n_post))
+        best = min(best, time.perf_counter() - start)
+    return strategy.count, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e4, 1e5])
+    parser.add_argument("--pre", type=float, nargs="+", default=[1e3, 1e6])
+    parser.add_argument("--indegree", type=int, default=200)
+    parser.add_argument("--poisson", action="store_true")
+    parser.add_argument("--engines", nargs="+", default=["loop", "vectorized"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    indegree = args.indegree
+    if args.poisson:
+        indegree = dict(distribution="poisson", mu=args.indegree)
+    print(
+        f"{'engine':>10} {'pre':>8} {'post':>8} {'conns':>10} {'time (s)':>9}"
+        f" {'conns/s':>10}"
+    )
+    for n_pre in map(int, args.pre):
+        for n_post in map(int, args.n):
+            for engine in args.engines:
+                strategy = CountingFixedIndegree(
+                    indegree=indegree,
+                    engine=engine,
+                    presynaptic=dict(cell_types=[]),
+                    postsynaptic=dict(cell_types=[]),
+                )
+                count, elapsed = run(strategy, n_pre, n_post, args.repeat)
+                print(
+                    f"{engine:>10} {n_pre:>8} {n_post:>8} {count:>10} {elapsed:>9.2f}"
+                    f" {count / elapsed:>10.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
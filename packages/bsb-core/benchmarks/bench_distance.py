@@ -0,0 +1,115 @@
+"""
+Benchmark the ``DistanceBased`` connection strategy against ``AllToAll`` + filter.
+
+Scatters ``-n`` cells uniformly over a cube of chunks, and connects every pair of cells
+within ``--max-distance`` of each other, one presynaptic chunk at a time, as the
+connectivity jobs would. ``DistanceBased`` searches the postsynaptic cells of the chunks
+within reach with a KD-tree, ``AllToAll`` + filter generates every pair between the
+presynaptic chunk and all of the postsynaptic cells and then drops the pairs out of
+range. Reports the time, the number of connections, and the peak memory of a job.
+
+.. code-block:: bash
+
+  python benchmarks/bench_distance.py -n 1e4 1e5 1e6 1e7
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from bsb.connectivity import DistanceBased
+from bsb.storage._chunks import ChunkIndex
+
+
+class PlacementSet:
+    def __init__(self, positions):
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def load_positions(self):
+        return self._positions
+
+
+class Collection:
+    def __init__(self, positions):
+        self.placement = [PlacementSet(positions)]
+
+
+class CountingDistanceBased(DistanceBased):
+    def connect_cells(self, pre_set, post_set, src_locs, dest_locs, tag=None):
+        self.count += len(src_locs)
+
+
+def all_to_all_filter(pre_pos, post_pos, max_distance):
+    # The pairs that `AllToAll` generates, filtered on the distance of their somas.
+    fl, len_ = len(pre_pos), len(post_pos)
+    src = np.repeat(np.arange(fl), len_)
+    dest = np.tile(np.arange(len_), fl)
+    dist = np.linalg.norm(pre_pos[src] - post_pos[dest], axis=1)
+    return np.count_nonzero(dist <= max_distance)
+
+
+def run(n, args):
+    rng = np.random.default_rng(0)
+    chunk_size = np.full(3, args.chunk_size)
+    side = max(1, round((n / args.per_chunk) ** (1 / 3)))
+    positions = rng.random((n, 3)) * side * args.chunk_size
+    index = ChunkIndex(positions, chunk_size)
+    strategy = CountingDistanceBased(
+        max_distance=args.max_distance,
+        presynaptic=dict(cell_types=[]),
+        postsynaptic=dict(cell_types=[]),
+    )
+    strategy._occ_chunks = set(index.chunks)
+    results = {}
+    tracemalloc.start()
+    strategy.count = 0
+    start = time.perf_counter()
+    for chunk, rows in index:
+        post_rows = np.concatenate(
+            [index.rows_of(c) for c in strategy.get_region_of_interest(chunk)]
+        )
+        strategy.connect(Collection(positions[rows]), Collection(positions[post_rows]))
+    results["distance"] = (strategy.count, time.perf_counter() - start)
+    results["distance"] += (tracemalloc.get_traced_memory()[1],)
+    tracemalloc.reset_peak()
+    if n <= args.dense_limit:
+        count = 0
+        start = time.perf_counter()
+        for _chunk, rows in index:
+            count += all_to_all_filter(positions[rows], positions, args.max_distance)
+        results["all_to_all"] = (count, time.perf_counter() - start)
+        results["all_to_all"] += (tracemalloc.get_traced_memory()[1],)
+    tracemalloc.stop()
+    return len(index), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e4, 1e5])
+    parser.add_argument("--chunk-size", type=float, default=100)
+    parser.add_argument("--per-chunk", type=int, default=1000, help="cells per chunk")
+    parser.add_argument("--max-distance", type=float, default=30)
+    parser.add_argument(
+        "--dense-limit", type=float, default=1e4, help="largest n to run AllToAll on"
+    )
+    args = parser.parse_args()
+    print(
+        f"{'strategy':>10} {'cells':>9} {'chunks':>7} {'conns':>11} {'time (s)':>9}"
+        f" {'conns/s':>10} {'peak (MB)':>10}"
+    )
+    for n in map(int, args.n):
+        chunks, results = run(n, args)
+        for name, (count, elapsed, peak) in results.items():
+            print(
+                f"{name:>10} {n:>9} {chunks:>7} {count:>11} {elapsed:>9.2f}"
+                f" {count / elapsed:>10.0f} {peak / 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
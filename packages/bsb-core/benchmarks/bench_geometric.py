@@ -0,0 +1,159 @@
+"""
+Benchmark the intersection engines of ``ShapeToShapeIntersection`` and
+``MorphologyToShapeIntersection``.
+
+Scatters ``-n`` presynaptic and postsynaptic cells uniformly at ``--density`` cells per
+um^3, and intersects the presynaptic spheres, or random 2-branch morphologies, with the
+postsynaptic spheres, without storing the connections. The ``loop`` engine tests every
+pair of cells, so it is timed on ``--loop-n`` cells at the same density, and its time is
+extrapolated to ``-n`` cells by the number of pairs.
+
+.. code-block:: bash
+
+  python benchmarks/bench_geometric.py -n 1e4 1e5 --loop-n 1e3
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bsb.connectivity import MorphologyToShapeIntersection, ShapeToShapeIntersection
+from bsb.morphologies import Branch, Morphology, MorphologySet
+
+
+class Loader:
+    def __init__(self, morphology):
+        self._morphology = morphology
+
+    def cached_load(self, labels=None):
+        return self._morphology
+
+
+class PlacementSet:
+    cell_type = None
+
+    def __init__(self, positions, morphologies=None):
+        self._positions = positions
+        self._morphologies = morphologies
+
+    def __len__(self):
+        return len(self._positions)
+
+    def load_positions(self):
+        return self._positions
+
+    def load_morphologies(self):
+        return self._morphologies
+
+
+class Collection:
+    def __init__(self, ps):
+        self.placement = [ps]
+
+
+class Counting:
+    def connect_cells(self, pre_set, post_set, src_locs, dest_locs, tag=None):
+        self.count += len(src_locs)
+
+
+class CountingShapeToShape(Counting, ShapeToShapeIntersection):
+    pass
+
+
+class CountingMorphologyToShape(Counting, MorphologyToShapeIntersection):
+    pass
+
+
+def sphere(radius, voxel_size):
+    return {
+        "voxel_size": voxel_size,
+        "shapes": [dict(type="sphere", radius=radius, origin=[0, 0, 0])],
+        "labels": [["sphere"]],
+    }
+
+
+def morphologies(rng, n, n_morphologies, points, extent):
+    loaders = []
+    for _ in range(n_morphologies):
+        branches = [
+            Branch(
+                np.cumsum(rng.normal(0, extent / points, (points, 3)), axis=0),
+                np.ones(points),
+            )
+            for _ in range(2)
+        ]
+        loaders.append(Loader(Morphology(branches)))
+    return MorphologySet(loaders, rng.integers(n_morphologies, size=n))
+
+
+def run(strategy, kind, n, args):
+    rng = np.random.default_rng(0)
+    side = (n / args.density) ** (1 / 3)
+    pre_pos = rng.random((n, 3)) * side
+    post_pos = rng.random((n, 3)) * side
+    ms = None
+    if kind == "morphology":
+        ms = morphologies(rng, n, 20, args.points, args.pre_radius)
+    pre_ps, post_ps = PlacementSet(pre_pos, ms), PlacementSet(post_pos)
+    strategy.count = 0
+    start = time.perf_counter()
+    strategy.connect(Collection(pre_ps), Collection(post_ps))
+    return strategy.count, time.perf_counter() - start
+
+
+def make(kind, engine, args):
+    post = dict(cell_types=[], shapes_composition=sphere(args.post_radius, args.voxel))
+    if kind == "shape":
+        return CountingShapeToShape(
+            presynaptic=dict(
+                cell_types=[], shapes_composition=sphere(args.pre_radius, args.voxel)
+            ),
+            postsynaptic=post,
+            affinity=1,
+            pruning_ratio=1,
+            engine=engine,
+        )
+    return CountingMorphologyToShape(
+        presynaptic=dict(cell_types=[]),
+        postsynaptic=post,
+        affinity=1,
+        pruning_ratio=1,
+        engine=engine,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e4])
+    parser.add_argument("--loop-n", type=float, default=1e3)
+    parser.add_argument("--density", type=float, default=5e-4, help="cells per um^3")
+    parser.add_argument("--pre-radius", type=float, default=10)
+    parser.add_argument("--post-radius", type=float, default=20)
+    parser.add_argument("--voxel", type=float, default=5)
+    parser.add_argument("--points", type=int, default=50, help="points per branch")
+    parser.add_argument("--kinds", nargs="+", default=["shape", "morphology"])
+    args = parser.parse_args()
+    print(
+        f"{'strategy':>10} {'engine':>6} {'cells':>8} {'contacts':>10} {'time (s)':>10}"
+        f" {'speedup':>8}"
+    )
+    for kind in args.kinds:
+        loop_n = int(args.loop_n)
+        count, loop_time = run(make(kind, "loop", args), kind, loop_n, args)
+        per_pair = loop_time / loop_n**2
+        print(f"{kind:>10} {'loop':>6} {loop_n:>8} {count:>10} {loop_time:>10.2f}")
+        for n in [loop_n, *map(int, args.n)]:
+            count, elapsed = run(make(kind, "batch", args), kind, n, args)
+            loop_est = per_pair * n**2
+            print(
+                f"{kind:>10} {'batch':>6} {n:>8} {count:>10} {elapsed:>10.2f}"
+                f" {loop_est / elapsed:>8.0f}"
+            )
+            if n != loop_n:
+                print(f"{kind:>10} {'loop':>6} {n:>8} {'':>10} {loop_est:>9.0f}*")
+    print("* extrapolated from the loop time per pair of cells")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark the loading of NRRD volumes with and without the memory mapped NRRD cache.
+
+Runs ``--jobs`` jobs in a fresh process, like the jobs of one rank: each job selects the
+voxels of a structure from the annotation volume, like ``NrrdVoxels.get_mask`` does, and
+orients ``--positions`` positions with ``VolumetricRotations`` from the orientation
+volume. This runs once decompressing the NRRD files in every job, and twice with the
+cache: cold, converting the volumes to ``.npy`` files in a temporary cache, and warm.
+For each run it reports the time of the first job and the mean time of the other jobs,
+the peak RSS of the process, and its private memory, which every rank of a node needs on
+its own, while the memory mapped pages are shared by all the ranks of a node.
+
+Uses the Allen 25 um CCFv3 annotation volume, downloaded into the BSB cache, and an
+orientation volume given by ``--orientation``. Without ``--orientation``, or with
+``--synthetic`` for the annotation as well, it generates gzip encoded volumes of the
+same shape, scaled by ``--scale`` along each axis.
+
+.. code-block:: bash
+
+  python benchmarks/bench_nrrd.py --synthetic --jobs 10
+"""
+
+import argparse
+import multiprocessing
+import pathlib
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import nrrd
+import numpy as np
+
+# Shape of the Allen CCFv3 volumes at 25 um.
+ALLEN_SHAPE = (528, 320, 456)
+
+
+def synthetic_annotation(path, shape, rng):
+    # Blocks of 16 voxels of random structure ids.
+    blocks = rng.integers(1, 1000, [-(-s // 16) for s in shape], dtype=np.uint32)
+    data = np.kron(blocks, np.ones((16, 16, 16), dtype=np.uint32))
+    data = np.ascontiguousarray(data[: shape[0], : shape[1], : shape[2]])
+    nrrd.write(str(path), data, header=_header(data.ndim))
+
+
+def synthetic_orientation(path, shape):
+    # A smoothly varying unit vector field.
+    x, y, _ = np.ix_(*(np.linspace(0, np.pi, s, dtype=np.float32) for s in shape))
+    data = np.empty((3, *shape), dtype=np.float32)
+    data[0] = np.sin(x) * np.cos(y)
+    data[1] = np.sin(x) * np.sin(y)
+    data[2] = np.cos(x)
+    nrrd.write(str(path), data, header=_header(data.ndim))
+
+
+def _header(ndim):
+    directions = np.eye(3) * 25
+    if ndim == 4:
+        directions = np.vstack(([np.nan] * 3, directions))
+    return {
+        "space dimension": 3,
+        "space directions": directions,
+        "space origin": np.zeros(3),
+        "encoding": "gzip",
+        **({"kinds": ["vector", "domain", "domain", "domain"]} if ndim == 4 else {}),
+    }
+
+
+def memory():
+    # Peak RSS, and current private (anonymous) and file backed RSS, in MB.
+    with open("/proc/self/status") as f:
+        status = dict(line.split(":", 1) for line in f)
+    return [int(status[k].split()[0]) / 1e3 for k in ("VmHWM", "RssAnon", "RssFile")]
+
+
+def job(annotation, orientation, positions, structure):
+    from bsb.placement.distributor import VolumetricRotations
+
+    # Keep the loaded volumes alive, to measure the memory while they are in use.
+    loaded = []
+
+    def load_orientation():
+        loaded.append(orientation.load_object())
+        return loaded[-1]
+
+    start = time.perf_counter()
+    loaded.append(annotation.get_data())
+    loaded.append(np.nonzero(loaded[0].raw == structure))
+    VolumetricRotations.distribute(
+        SimpleNamespace(
+            orientation_path=SimpleNamespace(
+                load_object=load_orientation,
+                voxel_of=orientation.voxel_of,
+                default_vector=orientation.default_vector,
+            )
+        ),
+        positions,
+        None,
+    )
+    elapsed = time.perf_counter() - start
+    _, private, shared = memory()
+    return elapsed, private, shared
+
+
+def rank(annotation, orientation, memory_map, cache, args):
+    from bsb.storage._files import NrrdDependencyNode
+
+    shape = np.array(nrrd.read_header(orientation)["sizes"][1:])
+    positions = np.random.default_rng(0).random((args.positions, 3)) * shape * 25
+    with mock.patch("bsb.storage._util._cache_path", pathlib.Path(cache)):
+        annotation = NrrdDependencyNode(file=annotation, memory_map=memory_map)
+        orientation = NrrdDependencyNode(file=orientation, memory_map=memory_map)
+        _, *baseline = memory()
+        results = [
+            job(annotation, orientation, positions, args.structure)
+            for _ in range(args.jobs)
+        ]
+    times, private, shared = np.array(results).T
+    return (
+        times,
+        memory()[0],
+        private.max() - baseline[0],
+        shared.max() - baseline[1],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10)
+    parser.add_argument("--positions", type=int, default=1000)
+    parser.add_argument("--structure", type=int, default=549, help="structure id")
+    parser.add_argument("--annotation", help="path of the annotation volume")
+    parser.add_argument("--orientation", help="path of the orientation volume")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--scale", type=float, default=1)
+    args = parser.parse_args()
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as dirpath:
+        dirpath = pathlib.Path(dirpath)
+        shape = tuple(int(s * args.scale) for s in ALLEN_SHAPE)
+        rng = np.random.default_rng(0)
+        annotation, orientation = args.annotation, args.orientation
+        if args.synthetic:
+            annotation = dirpath / "annotation.nrrd"
+            synthetic_annotation(annotation, shape, rng)
+        elif annotation is None:
+            from bsb.topology.partition import AllenStructure
+
+            with AllenStructure._dl_mask().file.provide_locally() as (path, _):
+                annotation = dirpath / "annotation.nrrd"
+                annotation.write_bytes(pathlib.Path(path).read_bytes())
+        if orientation is None:
+            shape = nrrd.read_header(str(annotation))["sizes"]
+            orientation = dirpath / "orientation.nrrd"
+            synthetic_orientation(orientation, shape)
+        print(
+            f"annotation: {pathlib.Path(annotation).stat().st_size / 1e6:.0f} MB"
+            f" {nrrd.read_header(str(annotation))['sizes']},"
+            f" orientation: {pathlib.Path(orientation).stat().st_size / 1e6:.0f} MB"
+        )
+        print(
+            f"{'run':>10} {'first (s)':>10} {'next (s)':>9} {'total (s)':>10}"
+            f" {'peak RSS (MB)':>14} {'private (MB)':>13} {'mapped (MB)':>12}"
+        )
+        cache = dirpath / "cache"
+        for name, memory_map in (("decompress", False), ("cold", True), ("warm", True)):
+            with context.Pool(1) as pool:
+                times, peak, private, shared = pool.apply(
+                    rank,
+                    (
+                        str(pathlib.Path(annotation).absolute()),
+                        str(pathlib.Path(orientation).absolute()),
+                        memory_map,
+                        cache,
+                        args,
+                    ),
+                )
+            print(
+                f"{name:>10} {times[0]:>10.2f} {times[1:].mean():>9.2f}"
+                f" {times.sum():>10.2f} {peak:>14.0f} {private:>13.0f} {shared:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
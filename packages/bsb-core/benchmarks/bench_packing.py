@@ -0,0 +1,78 @@
+"""
+Benchmark the particle packing engines of the ``RandomPlacement`` volume filler.
+
+Fills a cube of voxels with equal spheres up to each ``--packing`` factor, and reports
+the rate at which each engine places cells, the packing factor that it achieves, and the
+fraction of the cells that overlap another cell. The ``uniform`` engine places the cells
+independently and lets them overlap, the ``grid`` engine packs them without overlap.
+
+.. code-block:: bash
+
+  python benchmarks/bench_packing.py --packing 0.05 0.1 0.2 0.3 --size 100
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from bsb.exceptions import PackingError, PackingWarning
+from bsb.placement.random import VolumeFiller, sphere_volume
+from bsb.voxels import VoxelSet
+
+
+def fill(engine, voxels, radius, count):
+    filler = VolumeFiller(engine=engine)
+    particles = [
+        dict(
+            name="cell",
+            voxels=list(range(len(voxels))),
+            radius=radius,
+            count=np.array([count]),
+        )
+    ]
+    start = time.perf_counter()
+    filler.fill(voxels, particles)
+    elapsed = time.perf_counter() - start
+    return filler.positions, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--packing", type=float, nargs="+", default=[0.05, 0.1, 0.2, 0.3])
+    parser.add_argument("--size", type=float, default=100, help="cube side (um)")
+    parser.add_argument("--voxels", type=int, default=4, help="voxels per side")
+    parser.add_argument("--radius", type=float, default=1)
+    parser.add_argument("--engines", nargs="+", default=["uniform", "grid"])
+    args = parser.parse_args()
+    warnings.simplefilter("ignore", PackingWarning)
+    np.random.seed(0)
+    n = args.voxels
+    grid = np.stack(np.meshgrid(*(np.arange(n),) * 3, indexing="ij"), -1).reshape(-1, 3)
+    voxels = VoxelSet(grid, args.size / n)
+    volume = args.size**3
+    print(
+        f"{'engine':>8} {'target':>7} {'cells':>9} {'time (s)':>9} {'cells/s':>10}"
+        f" {'packing':>8} {'overlap':>8}"
+    )
+    for packing in args.packing:
+        count = int(packing * volume / sphere_volume(args.radius))
+        for engine in args.engines:
+            try:
+                positions, elapsed = fill(engine, voxels, args.radius, count)
+            except PackingError as e:
+                print(f"{engine:>8} {packing:>7.2f} {count:>9} {e}")
+                continue
+            pairs = cKDTree(positions).query_pairs(2 * args.radius, output_type="ndarray")
+            overlap = len(np.unique(pairs)) / len(positions)
+            achieved = len(positions) * sphere_volume(args.radius) / volume
+            print(
+                f"{engine:>8} {packing:>7.2f} {len(positions):>9} {elapsed:>9.2f}"
+                f" {len(positions) / elapsed:>10.0f} {achieved:>8.3f} {overlap:>8.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark the memory use of in-memory and streamed simulation results.
+
+Emulates a simulation of ``--duration`` ms without a simulator: every ms, a spike
+recorder collects the spikes of ``--cells`` cells firing at ``--rate`` Hz, and a
+multimeter collects ``--traces`` voltage traces sampled every ``--resolution`` ms, like
+the devices of a simulator do. The ``memory`` run keeps all results until the end of the
+simulation, and the ``stream`` run streams them to an HDF5 file every ``--interval`` ms.
+Each run happens in a fresh process, and reports its time including the writing of the
+results, the peak memory allocated by the process during the run, and the size of the
+written file:
+
+.. code-block:: bash
+
+  python benchmarks/bench_results.py --duration 10000 --interval 100
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class Device:
+    # Buffers the data recorded since the last flush, like a simulator device.
+    def __init__(self):
+        self.events = []
+
+    def take(self):
+        events, self.events = self.events, []
+        return events
+
+
+def run(mode, path, args):
+    import quantities as pq
+    from neo import AnalogSignal, SpikeTrain
+
+    from bsb import SimulationResult
+
+    simulation = SimpleNamespace(name="bench", __tree__=lambda: {"duration": 0})
+    result = SimulationResult(simulation)
+    if mode == "stream":
+        result.stream(path)
+    spikes, traces = Device(), Device()
+    rng = np.random.default_rng(0)
+    samples = int(1 / args.resolution)
+
+    def record_spikes(segment):
+        events = spikes.take()
+        times = np.concatenate([t for t, _ in events] + [np.empty(0)])
+        senders = np.concatenate([s for _, s in events] + [np.empty(0, dtype=int)])
+        segment.spiketrains.append(
+            SpikeTrain(
+                times,
+                units="ms",
+                t_stop=args.duration,
+                array_annotations={"senders": senders},
+                device="spikes",
+            )
+        )
+
+    def record_traces(segment):
+        events = traces.take()
+        if not events:
+            return
+        signal = np.concatenate(events)
+        for cell in range(args.traces):
+            segment.analogsignals.append(
+                AnalogSignal(
+                    signal[:, cell],
+                    units="mV",
+                    sampling_period=args.resolution * pq.ms,
+                    cell_id=cell,
+                )
+            )
+
+    result.create_recorder(record_spikes)
+    result.create_recorder(record_traces)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for t in range(int(args.duration)):
+        count = rng.poisson(args.cells * args.rate / 1000)
+        spikes.events.append(
+            (t + np.sort(rng.random(count)), rng.integers(args.cells, size=count))
+        )
+        traces.events.append(rng.normal(-65, 5, (samples, args.traces)))
+        if mode == "stream" and (t + 1) % args.interval == 0:
+            result.flush()
+    result.flush()
+    result.close()
+    if mode == "memory":
+        result.write(path, "ow")
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak, os.path.getsize(path) / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=10_000, help="ms")
+    parser.add_argument("--interval", type=int, default=100, help="ms")
+    parser.add_argument("--cells", type=int, default=10_000)
+    parser.add_argument("--rate", type=float, default=10, help="Hz")
+    parser.add_argument("--traces", type=int, default=100)
+    parser.add_argument("--resolution", type=float, default=0.1, help="ms")
+    args = parser.parse_args()
+    context = multiprocessing.get_context("spawn")
+    print(f"{'run':>7} {'time (s)':>9} {'peak (MiB)':>11} {'file (MiB)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, ext in (("memory", "nio"), ("stream", "hdf5")):
+            with context.Pool(1) as pool:
+                elapsed, peak, size = pool.apply(
+                    run, (mode, os.path.join(tmp, f"{mode}.{ext}"), args)
+                )
+            print(f"{mode:>7} {elapsed:>9.2f} {peak:>11.0f} {size:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark the engines of ``VolumetricRotations``.
+
+Orients ``-n`` random positions in an orientation field with the shape of the Allen 25 um
+CCFv3 volumes, scaled by ``--scale`` along each axis, with both engines, and checks that
+they rotate the positions alike. A fraction ``--null`` of the field holds null vectors,
+and some positions lie outside of the field, which both leave the positions as is.
+
+.. code-block:: bash
+
+  python benchmarks/bench_rotations.py -n 1e4 1e5 1e6
+"""
+
+import argparse
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from bsb.placement.distributor import VolumetricRotations
+from bsb.storage._files import NrrdDependencyNode
+
+# Shape of the Allen CCFv3 volumes at 25 um.
+ALLEN_SHAPE = (528, 320, 456)
+
+
+def orientation_field(rng, shape, null):
+    field = rng.normal(size=(*shape, 3)).astype(np.float32)
+    field[rng.random(shape) < null] = 0
+    return field
+
+
+def run(engine, field, positions):
+    distributor = SimpleNamespace(
+        engine=engine,
+        orientation_path=NrrdDependencyNode(voxel_size=25),
+        get_orientation_field=lambda: field,
+    )
+    start = time.perf_counter()
+    rotations = VolumetricRotations.distribute(distributor, positions, None)
+    return np.array(rotations), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e5])
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--null", type=float, default=0.1)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    shape = tuple(int(s * args.scale) for s in ALLEN_SHAPE)
+    field = orientation_field(rng, shape, args.null)
+    print(f"{'engine':>10} {'positions':>9} {'time (s)':>9} {'speedup':>8}")
+    failed = []
+    for n in map(int, args.n):
+        # Let 10% of the positions fall outside of the field.
+        positions = rng.uniform(-0.05, 1.05, (n, 3)) * np.array(shape) * 25
+        loop, base = run("loop", field, positions)
+        print(f"{'loop':>10} {n:>9} {base:>9.2f}")
+        vectorized, elapsed = run("vectorized", field, positions)
+        print(f"{'vectorized':>10} {n:>9} {elapsed:>9.2f} {base / elapsed:>8.1f}")
+        if not np.allclose(
+            Rotation.from_euler("xyz", loop, degrees=True).as_matrix(),
+            Rotation.from_euler("xyz", vectorized, degrees=True).as_matrix(),
+            atol=1e-6,
+        ):
+            failed.append(n)
+    if failed:
+        sys.exit(f"Engines rotate differently for n={failed}")
+
+
+if __name__ == "__main__":
+    main()
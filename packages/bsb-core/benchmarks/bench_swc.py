@@ -0,0 +1,131 @@
+"""
+Benchmark the SWC parsers.
+
+Writes a corpus of ``--files`` random SWC reconstructions of each of the ``-n`` sizes,
+each a single point soma with ``--neurites`` randomly branching neurites, like the
+reconstructions on NeuroMorpho.org, and parses them with the ``loop`` and ``vectorized``
+engines of ``BsbParser``, and with ``MorphIOParser``. ``--corpus`` parses the SWC files of
+a folder instead, e.g. downloaded from NeuroMorpho.org. Checks that both engines of
+``BsbParser`` produce the same morphologies.
+
+.. code-block:: bash
+
+  python benchmarks/bench_swc.py -n 1e3 1e4 1e5
+"""
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+
+import morphio
+import numpy as np
+
+from bsb import BsbParser, MorphIOParser
+
+
+def random_swc(rng, n, neurites, branching):
+    # Grow `neurites` trees from the soma, each sample continues a random earlier sample
+    # of its neurite with a probability of `branching`, and the previous one otherwise.
+    parents = np.arange(-1, n - 1)
+    neurite = np.concatenate(([0], rng.integers(neurites, size=n - 1)))
+    for i in np.flatnonzero(rng.random(n) < branching):
+        earlier = np.flatnonzero(neurite[1:i] == neurite[i]) + 1
+        if len(earlier):
+            parents[i] = rng.choice(earlier)
+    last = {}
+    for i in range(1, n):
+        if parents[i] == i - 1 and neurite[i - 1] != neurite[i]:
+            # Continue the last sample of the own neurite, or start from the soma.
+            parents[i] = last.get(neurite[i], 0)
+        last[neurite[i]] = i
+    points = np.zeros((n, 3))
+    for i in range(1, n):
+        points[i] = points[parents[i]] + rng.normal(0, 1, 3)
+    tags = np.where(neurite % 2, 2, 3)
+    tags[0] = 1
+    return np.column_stack(
+        (np.arange(1, n + 1), tags, points, rng.uniform(0.1, 2, n), parents + 1)
+    ).tolist()
+
+
+def write_corpus(dirpath, sizes, args):
+    rng = np.random.default_rng(0)
+    corpus = {}
+    for n in sizes:
+        corpus[n] = []
+        for i in range(args.files):
+            path = dirpath / f"{n}_{i}.swc"
+            with open(path, "w") as f:
+                f.write("# Random reconstruction\n")
+                for id, tag, x, y, z, r, parent in random_swc(
+                    rng, n, args.neurites, args.branching
+                ):
+                    f.write(
+                        f"{int(id)} {int(tag)} {x:.4f} {y:.4f} {z:.4f} {r:.4f}"
+                        f" {int(parent) if parent else -1}\n"
+                    )
+            corpus[n].append(path)
+    return corpus
+
+
+def same(a, b):
+    return (
+        np.array_equal(a.points, b.points)
+        and np.array_equal(a.radii, b.radii)
+        and np.array_equal(a.labels.raw, b.labels.raw)
+        and [len(x.children) for x in a.branches] == [len(x.children) for x in b.branches]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e4], help="samples")
+    parser.add_argument("--files", type=int, default=20, help="files per size")
+    parser.add_argument("--neurites", type=int, default=6)
+    parser.add_argument("--branching", type=float, default=0.02)
+    parser.add_argument("--corpus", help="folder of SWC files to parse instead")
+    args = parser.parse_args()
+    morphio.set_maximum_warnings(0)
+    parsers = {
+        "bsb loop": BsbParser(engine="loop"),
+        "bsb vectorized": BsbParser(),
+        "morphio": MorphIOParser(),
+    }
+    failed = []
+    with tempfile.TemporaryDirectory() as dirpath:
+        if args.corpus:
+            corpus = {"corpus": sorted(pathlib.Path(args.corpus).glob("*.swc"))}
+        else:
+            corpus = write_corpus(pathlib.Path(dirpath), map(int, args.n), args)
+        print(
+            f"{'parser':>15} {'files':>8} {'samples':>8} {'time (s)':>9} {'speedup':>8}"
+        )
+        for swc_parser in parsers.values():
+            # Warm up the lazy imports and caches of the parsers.
+            swc_parser.parse(str(next(iter(corpus.values()))[0]))
+        for n, files in corpus.items():
+            results = {}
+            for name, swc_parser in parsers.items():
+                start = time.perf_counter()
+                results[name] = [swc_parser.parse(str(file)) for file in files]
+                elapsed = time.perf_counter() - start
+                base = results.setdefault("base", elapsed)
+                print(
+                    f"{name:>15} {len(files):>8} {n:>8} {elapsed:>9.2f}"
+                    f" {base / elapsed:>8.1f}"
+                )
+            if not all(
+                same(a, b)
+                for a, b in zip(
+                    results["bsb loop"], results["bsb vectorized"], strict=True
+                )
+            ):
+                failed.append(n)
+    if failed:
+        sys.exit(f"BsbParser engines differ for {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark the construction and the queries of ``BoxTree``.
+
+Builds trees of ``-n`` random boxes by inserting them one by one, by streaming them into
+rtree's bulk loader, and by bulk loading them from numpy arrays where rtree supports it.
+Then queries ``--queries`` boxes of the same size, each box at a time with ``query``,
+and all at once with ``query_many``, with a loop over the boxes and with rtree's bulk
+query where it is supported.
+
+.. code-block:: bash
+
+  python benchmarks/bench_trees.py -n 1e5 1e6
+"""
+
+import argparse
+import time
+from unittest import mock
+
+import numpy as np
+from rtree import index as rtree
+
+from bsb import trees
+from bsb.trees import BoxTree
+
+
+def random_boxes(rng, n, side, size):
+    mins = rng.random((n, 3)) * side
+    return np.column_stack((mins, mins + rng.random((n, 3)) * size))
+
+
+def insert(boxes):
+    # The previous construction: insert each box into the tree in turn.
+    tree = rtree.Index(properties=rtree.Property(dimension=3))
+    for id, box in enumerate(boxes):
+        tree.insert(id, box)
+    return tree
+
+
+def timed(f, *args):
+    start = time.perf_counter()
+    result = f(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e6])
+    parser.add_argument("--queries", type=float, default=1e5)
+    parser.add_argument("--size", type=float, default=10, help="box size (um)")
+    parser.add_argument("--density", type=float, default=1e-4, help="boxes per um^3")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    print(f"{'operation':>20} {'boxes':>8} {'time (s)':>9} {'speedup':>8}")
+    for n in map(int, args.n):
+        side = (n / args.density) ** (1 / 3)
+        boxes = random_boxes(rng, n, side, args.size)
+        _, base = timed(insert, boxes.tolist())
+        print(f"{'insert':>20} {n:>8} {base:>9.2f}")
+        with mock.patch.object(trees, "_bulk_arrays", False):
+            _, elapsed = timed(BoxTree, boxes)
+        print(f"{'bulk load (stream)':>20} {n:>8} {elapsed:>9.2f} {base / elapsed:>8.1f}")
+        if trees._bulk_arrays:
+            tree, elapsed = timed(BoxTree, boxes)
+            print(
+                f"{'bulk load (arrays)':>20} {n:>8} {elapsed:>9.2f}"
+                f" {base / elapsed:>8.1f}"
+            )
+        else:
+            tree = BoxTree(boxes)
+        queries = random_boxes(rng, int(args.queries), side, args.size)
+        found, base = timed(lambda t, q: [*t.query(q)], tree, queries)
+        print(f"{'query':>20} {len(queries):>8} {base:>9.2f}")
+        with mock.patch.object(trees, "_bulk_arrays", False):
+            (offsets, _), elapsed = timed(tree.query_many, queries)
+        assert offsets[-1] == sum(map(len, found)), "query_many should match query"
+        print(
+            f"{'query_many (loop)':>20} {len(queries):>8} {elapsed:>9.2f}"
+            f" {base / elapsed:>8.1f}"
+        )
+        if trees._bulk_arrays:
+            (offsets, _), elapsed = timed(tree.query_many, queries)
+            assert offsets[-1] == sum(map(len, found)), "query_many should match query"
+            print(
+                f"{'query_many (arrays)':>20} {len(queries):>8} {elapsed:>9.2f}"
+                f" {base / elapsed:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Benchmark the intersection engines of ``VoxelIntersection``, and check that their
+output is statistically the same.
+
+Scatters ``-n`` presynaptic and postsynaptic cells uniformly at ``--density`` cells per
+um^3, gives them one of ``--morphologies`` random morphologies and one of
+``--rotations`` random rotations per population, and intersects them with both engines
+from the same ``--seed``, without storing the connections. The engines align the voxel
+grids of the candidates differently, so the run compares the number of connected pairs
+of cells and contacts, and the distribution of the contacts over the branches of each
+morphology by their total variation distance, and fails if any differ by more than
+``--tolerance``.
+
+.. code-block:: bash
+
+  python benchmarks/bench_voxel.py -n 1000 3000
+"""
+
+import argparse
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from bsb.connectivity import VoxelIntersection
+from bsb.morphologies import Branch, Morphology, MorphologySet, RotationSet
+from bsb.storage.interfaces import PlacementSet as _PlacementSet
+from bsb.storage.interfaces import StoredMorphology
+
+
+class PlacementSet:
+    load_boxes = _PlacementSet.load_boxes
+    load_box_tree = _PlacementSet.load_box_tree
+
+    def __init__(self, name, positions, morphologies, rotations):
+        self.cell_type = SimpleNamespace(name=name)
+        self._positions = positions
+        self._morphologies = morphologies
+        self._rotations = rotations
+
+    def __len__(self):
+        return len(self._positions)
+
+    def load_positions(self):
+        return self._positions
+
+    def load_morphologies(self):
+        return self._morphologies
+
+    def load_rotations(self):
+        return self._rotations
+
+
+class Collection:
+    def __init__(self, ps):
+        self.placement = [ps]
+
+
+class RecordingVoxelIntersection(VoxelIntersection):
+    def connect_cells(self, pre_set, post_set, src_locs, dest_locs, tag=None):
+        self.src_locs.append(src_locs)
+        self.dest_locs.append(dest_locs)
+
+
+def morphology(rng, name, branches, points, extent):
+    roots = [
+        Branch(
+            np.cumsum(rng.normal(0, extent / points, (points, 3)), axis=0),
+            np.ones(points),
+        )
+        for _ in range(branches)
+    ]
+    m = Morphology(roots)
+    ldc, mdc = m.bounds
+    m = Morphology(roots, meta=dict(ldc=ldc, mdc=mdc))
+    return StoredMorphology(name, lambda: m, dict(ldc=ldc, mdc=mdc))
+
+
+def population(rng, name, n, side, args):
+    loaders = [
+        morphology(rng, f"{name}{i}", args.branches, args.points, args.extent)
+        for i in range(args.morphologies)
+    ]
+    angles = rng.uniform(0, 360, (args.rotations, 3))
+    return PlacementSet(
+        name,
+        rng.random((n, 3)) * side,
+        MorphologySet(loaders, rng.integers(args.morphologies, size=n)),
+        RotationSet(angles[rng.integers(args.rotations, size=n)]),
+    )
+
+
+def run(engine, n, args):
+    rng = np.random.default_rng(args.seed)
+    side = (n / args.density) ** (1 / 3)
+    pre = population(rng, "pre", n, side, args)
+    post = population(rng, "post", n, side, args)
+    strategy = RecordingVoxelIntersection(
+        presynaptic=dict(cell_types=[]),
+        postsynaptic=dict(cell_types=[]),
+        contacts=args.contacts,
+        engine=engine,
+    )
+    strategy.src_locs, strategy.dest_locs = [], []
+    np.random.seed(args.seed)
+    random.seed(args.seed)
+    start = time.perf_counter()
+    strategy.connect(Collection(pre), Collection(post))
+    elapsed = time.perf_counter() - start
+    src = np.concatenate(strategy.src_locs)
+    dest = np.concatenate(strategy.dest_locs)
+    return elapsed, src, dest, pre, post
+
+
+def branch_histogram(locs, ps, args):
+    # Number of contacts on each branch of each morphology.
+    morpho = ps.load_morphologies().get_indices(copy=False)[locs[:, 0]]
+    return np.bincount(
+        morpho * args.branches + locs[:, 1], minlength=args.morphologies * args.branches
+    )
+
+
+def compare(results, args):
+    (_, lsrc, ldest, pre, post), (_, bsrc, bdest, _, _) = results
+    failed = []
+    for what, loop, batch in (
+        ("pairs", _pairs(lsrc, ldest), _pairs(bsrc, bdest)),
+        ("contacts", len(lsrc), len(bsrc)),
+    ):
+        if abs(batch - loop) > args.tolerance * max(loop, 1):
+            failed.append(f"{what}: {loop} (loop) != {batch} (batch)")
+    for what, locs, ps in (("pre", (lsrc, bsrc), pre), ("post", (ldest, bdest), post)):
+        loop, batch = (branch_histogram(loc, ps, args) for loc in locs)
+        distance = (
+            np.abs(loop / max(loop.sum(), 1) - batch / max(batch.sum(), 1)).sum() / 2
+        )
+        print(f"{what}synaptic branches, total variation distance: {distance:.3f}")
+        if distance > args.tolerance:
+            failed.append(f"{what}synaptic branch distribution ({distance:.3f})")
+    return failed
+
+
+def _pairs(src, dest):
+    return len(np.unique(np.column_stack((src[:, 0], dest[:, 0])), axis=0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e3])
+    parser.add_argument("--density", type=float, default=1e-4, help="cells per um^3")
+    parser.add_argument("--morphologies", type=int, default=5)
+    parser.add_argument("--rotations", type=int, default=4)
+    parser.add_argument("--branches", type=int, default=4)
+    parser.add_argument("--points", type=int, default=30, help="points per branch")
+    parser.add_argument("--extent", type=float, default=40)
+    parser.add_argument("--contacts", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.05)
+    args = parser.parse_args()
+    failed = []
+    for n in map(int, args.n):
+        print(
+            f"{'engine':>6} {'cells':>7} {'pairs':>8} {'contacts':>9} {'time (s)':>9}"
+            f" {'speedup':>8}"
+        )
+        results = [run(engine, n, args) for engine in ("loop", "batch")]
+        for engine, (elapsed, src, dest, *_) in zip(
+            ("loop", "batch"), results, strict=True
+        ):
+            print(
+                f"{engine:>6} {n:>7} {_pairs(src, dest):>8} {len(src):>9}"
+                f" {elapsed:>9.2f} {results[0][0] / elapsed:>8.1f}"
+            )
+        failed.extend(f"n={n}, {f}" for f in compare(results, args))
+    if failed:
+        sys.exit("Engines differ:\n" + "\n".join(failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -133,6 +133,7 @@ if typing.TYPE_CHECKING:  # pragma: nocover
   import bsb.voxels
 
 AdapterError: type["bsb.exceptions.AdapterError"]
+AdjacencyIndex: type["bsb.storage.interfaces.AdjacencyIndex"]
 AfterConnectivityHook: type["bsb.postprocessing.AfterConnectivityHook"]
 AfterPlacementHook: type["bsb.postprocessing.AfterPlacementHook"]
 AllToAll: type["bsb.connectivity.general.AllToAll"]
@@ -202,6 +203,7 @@ DatasetExistsError: type["bsb.exceptions.DatasetExistsError"]
 DatasetNotFoundError: type["bsb.exceptions.DatasetNotFoundError"]
 DependencyError: type["bsb.exceptions.DependencyError"]
 DeviceModel: type["bsb.simulation.device.DeviceModel"]
+DistanceBased: type["bsb.connectivity.general.DistanceBased"]
 Distribution: type["bsb.config.Distribution"]
 DistributionCastError: type["bsb.exceptions.DistributionCastError"]
 DistributionContext: type["bsb.placement.distributor.DistributionContext"]
@@ -336,6 +338,9 @@ Relay: type["bsb.postprocessing.Relay"]
 ReportListener: type["bsb.core.ReportListener"]
 RepresentativesTargetting: type["bsb.simulation.targetting.RepresentativesTargetting"]
 RequirementError: type["bsb.exceptions.RequirementError"]
+ResultFile: type["bsb.simulation.results.ResultFile"]
+ResultFlushController: type["bsb.simulation.adapter.ResultFlushController"]
+ResultStream: type["bsb.simulation.results.ResultStream"]
 Rhomboid: type["bsb.topology.partition.Rhomboid"]
 RootCommand: type["bsb.cli.commands.RootCommand"]
 RotationDistributor: type["bsb.placement.distributor.RotationDistributor"]
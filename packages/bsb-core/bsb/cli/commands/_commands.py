@@ -110,6 +110,30 @@ class IgnoreErrors(
     pass
 
 
+class Workers(BsbOption, name="workers", cli=("workers",), env=("BSB_WORKERS",)):
+    """
+    Number of local worker processes to compile the network with, when not running
+    under MPI.
+    """
+
+    def setter(self, value):
+        return int(value)
+
+    def getter(self, value):
+        return int(value)
+
+
+class Unified(
+    BsbOption, name="unified", cli=("unified",), env=("BSB_UNIFIED_COMPILE",), flag=True
+):
+    """
+    Run placement and connectivity in a single job pool, without waiting for one phase
+    to finish before the next starts.
+    """
+
+    pass
+
+
 def _flatten_arr_args(arr):
     if arr is None:
         return arr
@@ -159,6 +183,8 @@ class BsbCompile(BaseCommand, name="compile"):
             append=context.append,
             redo=context.redo,
             fail_fast=not context.ignore_errors,
+            workers=context.workers,
+            unified=context.unified,
         )
 
     def get_options(self):
@@ -178,6 +204,8 @@ class BsbCompile(BaseCommand, name="compile"):
             "clear": Clear(),
             "output": Output(),
             "ignore_errors": IgnoreErrors(),
+            "workers": Workers(),
+            "unified": Unified(),
         }
 
     def add_parser_arguments(self, parser):
@@ -235,7 +263,8 @@ class BsbSimulate(BaseCommand, name="simulate"):
             append += ", ".join(f"'{name}'" for name in extra_simulations)
             errr.wrap(type(e), e, append=append)
         else:
-            result.write(root / f"{uuid4()}.nio", "ow")
+            if not result.streaming:
+                result.write(root / f"{uuid4()}.nio", "ow")
 
     def get_options(self):
         return {
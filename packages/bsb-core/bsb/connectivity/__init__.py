@@ -6,7 +6,13 @@ from .strategy import ConnectionStrategy
 
 # isort: on
 from .detailed import VoxelIntersection
-from .general import AllToAll, Convergence, FixedIndegree, FixedOutdegree
+from .general import (
+    AllToAll,
+    Convergence,
+    DistanceBased,
+    FixedIndegree,
+    FixedOutdegree,
+)
 from .geometric import (
     Cone,
     Cuboid,
@@ -44,12 +44,18 @@ class Intersectional:
 
     def candidate_intersection(self, target_coll, candidate_coll):
         target_cache = [
-            (tset.cell_type, tset, tset.load_boxes()) for tset in target_coll.placement
+            (tset.cell_type, tset, np.array(list(tset.load_boxes())))
+            for tset in target_coll.placement
         ]
         for cset in candidate_coll.placement:
             box_tree = cset.load_box_tree()
             for _ttype, tset, tboxes in target_cache:
-                yield (tset, cset, self._affinity_filter(box_tree.query(tboxes)))
+                offsets, hits = box_tree.query_many(tboxes)
+                query = (
+                    hits[start:stop]
+                    for start, stop in zip(offsets[:-1], offsets[1:], strict=True)
+                )
+                yield (tset, cset, self._affinity_filter(query))
 
     def _affinity_filter(self, query):
         if self.affinity == 1:
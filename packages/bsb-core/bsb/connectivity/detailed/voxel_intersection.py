@@ -1,17 +1,22 @@
 import itertools
 import random
+from dataclasses import dataclass
 
 import numpy as np
 from numpy.random import default_rng
+from scipy.spatial.transform import Rotation
 
 from ... import config
 from ..._util import ichain
 from ...config import types
 from ...reporting import warn
+from ..general import _row_blocks
 from ..strategy import ConnectionStrategy
 from .shared import Intersectional
 
 _rng = default_rng()
+# Number of candidate and target voxel pairs to test for overlap at once.
+_VOXEL_BLOCK = 2**20
 
 
 @config.node
@@ -31,6 +36,12 @@ class VoxelIntersection(Intersectional, ConnectionStrategy):
     voxels_post = config.attr(type=int, default=50)
     cache = config.attr(type=bool, default=True)
     favor_cache = config.attr(type=types.in_(["pre", "post"]), default="pre")
+    engine = config.attr(type=types.in_(["batch", "loop"]), default="batch")
+    """
+    Intersection engine. ``batch`` voxelizes each unique combination of morphology and
+    rotation once, and tests the voxels of all the candidate pairs for overlap at once.
+    ``loop`` voxelizes and tests each candidate pair in turn.
+    """
 
     def connect(self, pre, post):
         # Note on the caching terms: `targets` are the population that will be cached the
@@ -89,9 +100,14 @@ class VoxelIntersection(Intersectional, ConnectionStrategy):
                     f"{warn_message}{np.array(target_mset.names)[u_empty]}, "
                     f"assigned to {hemitype_text} cell: {target_set.cell_type.name}."
                 )
-            self._match_voxel_intersection(
-                match_itr, target_set, cand_set, target_mset, cand_mset
-            )
+            if self.engine == "loop":
+                self._match_voxel_intersection(
+                    match_itr, target_set, cand_set, target_mset, cand_mset
+                )
+            else:
+                self._match_voxel_intersection_batch(
+                    match_itr, target_set, cand_set, target_mset, cand_mset
+                )
 
     def _match_voxel_intersection(self, matches, tset, cset, tmset, cmset):
         # Soft-caching caches at the IO level and gives you a fresh copy of the morphology
@@ -161,6 +177,96 @@ class VoxelIntersection(Intersectional, ConnectionStrategy):
 
         self.connect_cells(src_set, dest_set, src_locs, dest_locs)
 
+    def _match_voxel_intersection_batch(self, matches, tset, cset, tmset, cmset):
+        cands = [np.asarray(candidates, dtype=int) for candidates in matches]
+        t_ids = np.repeat(np.arange(len(cands)), [len(c) for c in cands])
+        c_ids = np.concatenate([np.empty(0, dtype=int), *cands])
+        tlocs, clocs = [np.empty((0, 3), dtype=int)], [np.empty((0, 3), dtype=int)]
+        if len(t_ids):
+            trot = Rotation.from_euler(
+                "xyz", np.asarray(tset.load_rotations())[t_ids], degrees=True
+            )
+            crot = Rotation.from_euler(
+                "xyz", np.asarray(cset.load_rotations())[c_ids], degrees=True
+            )
+            # Place the candidates relative to the unrotated target at the origin, as in
+            # `_match_voxel_intersection`, so that the target voxels are never moved.
+            inv = trot.inv()
+            rotations = inv * crot
+            offsets = inv.apply(
+                cset.load_positions()[c_ids] - tset.load_positions()[t_ids]
+            )
+            # Voxelize each unique pair of candidate morphology and rotation only once.
+            keys = np.column_stack(
+                (
+                    cmset.get_indices(copy=False)[c_ids],
+                    rotations.as_matrix().reshape(-1, 9).round(9),
+                )
+            )
+            _, first, c_keys = np.unique(
+                keys, axis=0, return_index=True, return_inverse=True
+            )
+            cvoxels = _FlatVoxels.from_voxel_sets(
+                cmset.voxelize(c_ids[i], self._n_cvoxels, rotations[i], cache=self.cache)
+                for i in first
+            )
+            _, first, t_keys = np.unique(
+                tmset.get_indices(copy=False)[t_ids],
+                return_index=True,
+                return_inverse=True,
+            )
+            tvoxels = _FlatVoxels.from_voxel_sets(
+                tmset.voxelize(t_ids[i], self._n_tvoxels, cache=self.cache) for i in first
+            )
+            c_keys, t_keys = c_keys.reshape(-1), t_keys.reshape(-1)
+            # Move the candidates by whole voxels, so that their voxels lie on the grid
+            # anchored at the target that `_match_voxel_intersection` voxelizes them on.
+            size = cvoxels.size[c_keys]
+            snapped = np.round(offsets / np.where(size > 0, size, 1)) * size
+            offsets = np.where(size > 0, snapped, offsets)
+            sizes = cvoxels.count[c_keys] * tvoxels.count[t_keys]
+            for begin, end in _row_blocks(sizes, _VOXEL_BLOCK):
+                pair, cv, tv = _overlapping_voxels(
+                    cvoxels,
+                    tvoxels,
+                    c_keys[begin:end],
+                    t_keys[begin:end],
+                    offsets[begin:end],
+                )
+                pair, cp, tp = self._pick_locations_batch(cvoxels, tvoxels, pair, cv, tv)
+                pair += begin
+                clocs.append(np.column_stack((c_ids[pair], cvoxels.locs[cp])))
+                tlocs.append(np.column_stack((t_ids[pair], tvoxels.locs[tp])))
+        tlocs, clocs = np.concatenate(tlocs), np.concatenate(clocs)
+        if self.favor_cache == "pre":
+            self.connect_cells(tset, cset, tlocs, clocs)
+        else:
+            self.connect_cells(cset, tset, clocs, tlocs)
+
+    def _pick_locations_batch(self, cvoxels, tvoxels, pair, cv, tv):
+        # Draw the number of contacts of each pair of cells with overlapping voxels, and
+        # pick each contact with a random integer below the number of point pairs in the
+        # overlapping voxels of the cells: it selects a pair of overlapping voxels with a
+        # probability proportional to their number of point pairs, and a point in each.
+        cells, first = np.unique(pair, return_index=True)
+        if not len(cells):
+            return pair, cv, tv
+        tcount = tvoxels.points[tv]
+        weights = cvoxels.points[cv] * tcount
+        ends = np.cumsum(weights)
+        totals = np.add.reduceat(weights, first)
+        n = np.maximum(np.asarray(self.contacts.draw(len(cells))).astype(int), 0)
+        picks = np.repeat(ends[first] - weights[first], n) + (
+            np.random.random(n.sum()) * np.repeat(totals, n)
+        ).astype(int)
+        entry = np.searchsorted(ends, picks, side="right")
+        point = picks - ends[entry] + weights[entry]
+        return (
+            np.repeat(cells, n),
+            cvoxels.first_point[cv[entry]] + point // tcount[entry],
+            tvoxels.first_point[tv[entry]] + point % tcount[entry],
+        )
+
     def _pick_locations(self, tid, cid, tvoxels, cvoxels, overlap):
         n = int(self.contacts.draw(1)[0])
         if n <= 0:
@@ -182,6 +288,94 @@ class VoxelIntersection(Intersectional, ConnectionStrategy):
         return tlocs, clocs
 
 
+@dataclass
+class _FlatVoxels:
+    """
+    The voxels of several voxel sets made by :meth:`~bsb.voxels.VoxelSet.from_morphology`,
+    concatenated.
+    """
+
+    boxes: np.ndarray
+    """Box of each voxel."""
+    first: np.ndarray
+    """First voxel of each set."""
+    count: np.ndarray
+    """Number of voxels of each set."""
+    bounds: np.ndarray
+    """Box around the voxels of each set."""
+    size: np.ndarray
+    """Voxel size of each set."""
+    first_point: np.ndarray
+    """First point of each voxel."""
+    points: np.ndarray
+    """Number of points of each voxel."""
+    locs: np.ndarray
+    """Branch and point index of each point."""
+
+    @classmethod
+    def from_voxel_sets(cls, voxel_sets):
+        boxes, npoints, locs, sizes = [np.empty((0, 6))], [], [], [np.empty((0, 3))]
+        for voxels in voxel_sets:
+            boxes.append(voxels.as_boxes())
+            sizes.append(np.broadcast_to(voxels.get_size(), (1, 3)))
+            data = voxels.get_data()
+            data = (
+                np.asarray(data).reshape(-1) if data is not None else [[]] * len(voxels)
+            )
+            npoints.extend(map(len, data))
+            locs.extend(itertools.chain.from_iterable(data))
+        count = np.array([len(b) for b in boxes[1:]], dtype=int)
+        bounds = np.array(
+            [
+                np.concatenate((b[:, :3].min(axis=0), b[:, 3:].max(axis=0)))
+                if len(b)
+                else np.full(6, np.nan)
+                for b in boxes[1:]
+            ]
+        ).reshape(-1, 6)
+        npoints = np.array(npoints, dtype=int)
+        return cls(
+            np.concatenate(boxes),
+            np.cumsum(count) - count,
+            count,
+            bounds,
+            np.concatenate(sizes),
+            np.cumsum(npoints) - npoints,
+            npoints,
+            np.array(locs, dtype=int).reshape(-1, 2),
+        )
+
+
+def _overlap(a, b):
+    # Boxes that touch overlap, like in the `BoxTree` queries of the loop engine.
+    return np.all(a[:, :3] <= b[:, 3:], axis=1) & np.all(b[:, :3] <= a[:, 3:], axis=1)
+
+
+def _overlapping_voxels(cvoxels, tvoxels, c_keys, t_keys, offsets):
+    """
+    Test the voxels of each candidate against the voxels of its target.
+
+    :returns: The pair, the candidate voxel and the target voxel of each overlap.
+    :rtype: tuple[numpy.ndarray[int]]
+    """
+    # Keep the candidate voxels that overlap the box around the voxels of the target.
+    nc = cvoxels.count[c_keys]
+    pair = np.repeat(np.arange(len(nc)), nc)
+    cv = np.arange(len(pair)) + np.repeat(cvoxels.first[c_keys] - np.cumsum(nc) + nc, nc)
+    cboxes = cvoxels.boxes[cv] + np.tile(offsets[pair], 2)
+    near = _overlap(cboxes, tvoxels.bounds[t_keys[pair]])
+    pair, cv, cboxes = pair[near], cv[near], cboxes[near]
+    # Test them against each voxel of the target.
+    nt = tvoxels.count[t_keys[pair]]
+    rows = np.repeat(np.arange(len(pair)), nt)
+    tv = np.arange(len(rows)) + np.repeat(
+        tvoxels.first[t_keys[pair]] - np.cumsum(nt) + nt, nt
+    )
+    overlap = _overlap(cboxes[rows], tvoxels.boxes[tv])
+    rows = rows[overlap]
+    return pair[rows], cv[rows], tv[overlap]
+
+
 def _pairs_with_zero(iterable):
     a, b = itertools.tee(iterable)
     try:
@@ -1,17 +1,33 @@
 import typing
+from itertools import chain
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from .. import config
 from ..config import types
-from ..exceptions import ConnectivityError
+from ..exceptions import ConnectivityError, ConnectivityWarning
 from ..mixins import InvertedRoI
+from ..reporting import warn
+from ..storage._chunks import Chunk
 from .strategy import ConnectionStrategy
 
 if typing.TYPE_CHECKING:  # pragma: nocover
     from ..config import Distribution
 
 
+def _row_blocks(sizes, block_size):
+    # Split consecutive rows into blocks whose sizes sum to at most `block_size`, a row
+    # larger than `block_size` is given its own block.
+    ends = np.cumsum(sizes)
+    start = 0
+    while start < len(sizes):
+        base = ends[start - 1] if start else 0
+        stop = max(np.searchsorted(ends, base + block_size, side="right"), start + 1)
+        yield start, stop
+        start = stop
+
+
 @config.node
 class Convergence(ConnectionStrategy):
     """
@@ -35,20 +51,238 @@ class AllToAll(ConnectionStrategy):
     """
     Probability for each individual connection to be, default is 1, i.e. all connected.
     """
+    max_pairs: int = config.attr(type=types.int(min=1), default=1_000_000)
+    """
+    Maximum number of connections to generate and store at once.
+    """
 
     def connect(self, pre, post):
+        # Draw from the global random state, so that `np.random.seed` reproduces the
+        # connections.
+        rng = np.random
         for from_ps in pre.placement:
             fl = len(from_ps)
             for to_ps in post.placement:
                 len_ = len(to_ps)
-                ml = fl * len_
-                filtered_ = np.random.binomial(1, p=self.affinity, size=ml) > 0
-                ml = np.count_nonzero(filtered_)
-                src_locs = np.full((ml, 3), -1)
-                dest_locs = np.full((ml, 3), -1)
-                src_locs[:, 0] = np.repeat(np.arange(fl), len_)[filtered_]
-                dest_locs[:, 0] = np.tile(np.arange(len_), fl)[filtered_]
-                self.connect_cells(from_ps, to_ps, src_locs, dest_locs)
+                for pairs in _bernoulli_pairs(
+                    rng, fl * len_, self.affinity, self.max_pairs
+                ):
+                    src_locs = np.full((len(pairs), 3), -1)
+                    dest_locs = np.full((len(pairs), 3), -1)
+                    src_locs[:, 0], dest_locs[:, 0] = np.divmod(pairs, len_)
+                    self.connect_cells(from_ps, to_ps, src_locs, dest_locs)
+
+
+def _bernoulli_pairs(rng, n, p, block_size):
+    """
+    Select each index of ``range(n)`` with probability ``p``, and yield the selected
+    indices in ascending blocks of at most ``block_size``. Yields at least one, possibly
+    empty, block.
+
+    Instead of drawing ``n`` Bernoulli trials, the gaps between selected indices are
+    drawn from a geometric distribution, so that the work and memory scale with the
+    number of selected indices. ``rng`` is a :class:`numpy.random.Generator`, or the
+    :mod:`numpy.random` module to draw from the global random state.
+    """
+    if p == 1:
+        for start in range(0, max(n, 1), block_size):
+            yield np.arange(start, min(start + block_size, n))
+        return
+    pos = -1
+    emitted = False
+    while p > 0:
+        # Draw a few more gaps than expected to reach `n`, within the block size.
+        expected = (n - pos - 1) * p
+        size = int(min(block_size, expected + 4 * np.sqrt(expected) + 16))
+        selected = pos + np.cumsum(rng.geometric(p, size=size))
+        last = selected[-1]
+        selected = selected[selected < n]
+        if len(selected):
+            yield selected
+            emitted = True
+        if last >= n:
+            break
+        pos = last
+    if not emitted:
+        yield np.arange(0)
+
+
+@config.node
+class DistanceBased(ConnectionStrategy):
+    """
+    Connect each presynaptic cell to the postsynaptic cells whose soma lies within
+    ``max_distance`` of its soma, with a probability that can depend on the distance.
+
+    The postsynaptic cells of the chunks within reach of each presynaptic chunk are
+    indexed in a KD-tree, so that only the pairs within range are ever generated.
+    """
+
+    max_distance: float = config.attr(type=types.float(min=0), required=True)
+    """
+    Maximum distance between the somas of connected cells.
+    """
+    affinity: float = config.attr(type=types.fraction(), default=1.0)
+    """
+    Probability for each pair of cells within range to be connected.
+    """
+    kernel: typing.Callable[[np.ndarray], np.ndarray] = config.attr(
+        type=types.function_(), required=False
+    )
+    """
+    Function that maps an array of soma distances to an array of connection
+    probabilities, multiplied with the ``affinity``. By default, all pairs within range
+    are connected with probability ``affinity``.
+    """
+    max_pairs: int = config.attr(type=types.int(min=1), default=1_000_000)
+    """
+    Maximum number of candidate pairs to generate and store at once.
+    """
+
+    def get_region_of_interest(self, chunk):
+        if not hasattr(self, "_occ_chunks"):
+            self._occ_chunks = set(
+                chain.from_iterable(
+                    ct.get_placement_set().get_all_chunks()
+                    for ct in self.postsynaptic.cell_types
+                )
+            )
+        if not self._occ_chunks:
+            warn(
+                f"No {', '.join(ct.name for ct in self.postsynaptic.cell_types)} "
+                f"were placed, skipping {self.name}",
+                ConnectivityWarning,
+            )
+            return []
+        size = chunk.dimensions
+        reach = np.ceil(self.max_distance / size).astype(int)
+        offsets = np.column_stack(
+            [
+                a.reshape(-1)
+                for a in np.meshgrid(
+                    *(np.arange(-r, r + 1) for r in reach), indexing="ij"
+                )
+            ]
+        )
+        # Keep the chunks whose box lies within reach of the box of this chunk.
+        gaps = np.maximum(np.abs(offsets) - 1, 0) * size
+        offsets = offsets[np.linalg.norm(gaps, axis=1) <= self.max_distance]
+        coords = np.asarray(chunk, dtype=int) + offsets
+        return [t for c in coords if (t := Chunk(c, size)) in self._occ_chunks]
+
+    def connect(self, pre, post):
+        post_sets = post.placement
+        post_pos = [ps.load_positions() for ps in post_sets]
+        # The index of the first cell of each postsynaptic placement set in the tree.
+        offsets = np.cumsum([0] + [len(p) for p in post_pos])
+        if not offsets[-1]:
+            return
+        tree = cKDTree(np.concatenate(post_pos))
+        for pre_set in pre.placement:
+            pre_pos = pre_set.load_positions()
+            if not len(pre_pos):
+                continue
+            for rows in self._batch(tree, pre_pos):
+                pairs = cKDTree(pre_pos[rows]).sparse_distance_matrix(
+                    tree, self.max_distance, output_type="ndarray"
+                )
+                pairs = pairs[self._select(pairs["v"])]
+                set_idx = np.searchsorted(offsets, pairs["j"], side="right") - 1
+                for k, post_set in enumerate(post_sets):
+                    mask = set_idx == k
+                    src_locs = np.full((np.count_nonzero(mask), 3), -1)
+                    dest_locs = np.full((len(src_locs), 3), -1)
+                    src_locs[:, 0] = rows[pairs["i"][mask]]
+                    dest_locs[:, 0] = pairs["j"][mask] - offsets[k]
+                    self.connect_cells(pre_set, post_set, src_locs, dest_locs)
+
+    def _batch(self, tree, positions):
+        # Split the presynaptic cells into batches of at most `max_pairs` candidate pairs.
+        counts = tree.query_ball_point(positions, self.max_distance, return_length=True)
+        for start, stop in _row_blocks(counts, self.max_pairs):
+            yield np.arange(start, stop)
+
+    def _select(self, distances):
+        p = self.affinity
+        if self.kernel is not None:
+            p = p * self.kernel(distances)
+        elif p == 1:
+            return np.ones(len(distances), dtype=bool)
+        return np.random.random(len(distances)) < p
+
+
+# Number of connections to sample and store at once.
+_FIXED_DEGREE_BLOCK = 2**20
+
+
+def _draw_degrees(degree, n):
+    # Draw the degree of each of `n` cells from a constant or a distribution.
+    if isinstance(degree, int):
+        return np.full(n, degree)
+    return np.maximum(np.rint(degree.draw(n)), 0).astype(int)
+
+
+def _sample_without_replacement(rng, high, degrees, block_size=2**22):
+    """
+    Draw ``degrees[i]`` distinct integers in ``[0, high)`` for each row ``i``, and return
+    them concatenated row after row, in ascending order within each row. The rows of
+    equal degree are sampled together, in batches of about ``block_size`` samples or
+    candidates.
+    """
+    samples = np.empty(degrees.sum(), dtype=np.int64)
+    starts = np.cumsum(degrees) - degrees
+    for degree in np.unique(degrees[degrees > 0]):
+        rows = np.flatnonzero(degrees == degree)
+        dense = 8 * degree > high
+        batch = max(1, block_size // (high if dense else degree))
+        for i in range(0, len(rows), batch):
+            block = rows[i : i + batch]
+            if dense:
+                drawn = _sample_dense(rng, high, len(block), degree)
+            else:
+                drawn = _sample_sparse(rng, high, len(block), degree)
+            if block[-1] - block[0] == len(block) - 1:
+                # Consecutive rows, such as all rows of a fixed degree, are one slice.
+                start = starts[block[0]]
+                samples[start : start + drawn.size] = drawn.reshape(-1)
+            else:
+                idx = starts[block, None] + np.arange(degree)
+                samples[idx.reshape(-1)] = drawn.reshape(-1)
+    return samples
+
+
+def _sample_dense(rng, high, n, degree):
+    # Floyd's algorithm, run on all the rows at once, with a flat candidate mask. Rows
+    # that take more than half of the candidates draw the candidates to leave out.
+    left_out = 2 * degree > high
+    taken = np.zeros(n * high, dtype=bool)
+    base = np.arange(n) * high
+    for j in range(degree if left_out else high - degree, high):
+        t = rng.integers(j + 1, size=n) + base
+        hit = taken[t]
+        t[hit] = base[hit] + j
+        taken[t] = True
+    if left_out:
+        taken = ~taken
+    return (np.flatnonzero(taken) % high).reshape(n, degree)
+
+
+def _sample_sparse(rng, high, n, degree):
+    # Draw with replacement, and redraw the duplicates until there are none left. This
+    # is invariant under relabeling the candidates, so each subset is equally likely,
+    # and at most an eighth of the candidates are taken, so few rounds are needed.
+    drawn = rng.integers(high, size=(n, degree))
+    drawn.sort(axis=1)
+    rows = np.arange(n)
+    while len(rows):
+        sub = drawn[rows]
+        dupes = np.zeros(sub.shape, dtype=bool)
+        dupes[:, 1:] = sub[:, 1:] == sub[:, :-1]
+        has_dupes = dupes.any(axis=1)
+        rows, sub, dupes = rows[has_dupes], sub[has_dupes], dupes[has_dupes]
+        sub[dupes] = rng.integers(high, size=np.count_nonzero(dupes))
+        sub.sort(axis=1)
+        drawn[rows] = sub
+    return drawn
 
 
 def _connect_fixed_degree(self, pre, post, degree, is_in):
@@ -57,35 +291,49 @@ def _connect_fixed_degree(self, pre, post, degree, is_in):
     ps_counted = pre.placement if is_in else post.placement
     ps_fixed = post.placement if is_in else pre.placement
     high = sum(len(ps) for ps in ps_counted)
-    if high < degree:
+    if isinstance(degree, int) and high < degree:
         raise ConnectivityError(
             f"Number of cells for dependant population ({high}) is too small to match "
             f"required degree value {degree} for connection strategy {self.name}"
         )
     for ps in ps_fixed:
-        l_ = len(ps)
-        counted_targets = np.full((l_ * degree, 3), -1)
-        fixed_targets = np.full((l_ * degree, 3), -1)
-        ptr = 0
-        for i in range(l_):
-            fixed_targets[ptr : ptr + degree, 0] = i
-            counted_targets[ptr : ptr + degree, 0] = rng.choice(
-                high, degree, replace=False
-            )
-            ptr += degree
-        lowmux = 0
-        for ps_o in ps_counted:
-            highmux = lowmux + len(ps_o)
-            demux_idx = (counted_targets[:, 0] >= lowmux) & (
-                counted_targets[:, 0] < highmux
+        degrees = _draw_degrees(degree, len(ps))
+        if len(degrees) and degrees.max() > high:
+            raise ConnectivityError(
+                f"Number of cells for dependant population ({high}) is too small to "
+                f"match drawn degree value {degrees.max()} for connection strategy "
+                f"{self.name}"
             )
-            demuxed = counted_targets[demux_idx]
-            demuxed[:, 0] -= lowmux
-            if is_in:
-                self.connect_cells(ps_o, ps, demuxed, fixed_targets[demux_idx])
+        # Sample and store the connections of a block of fixed cells at a time.
+        for start, stop in _row_blocks(degrees, _FIXED_DEGREE_BLOCK):
+            block = degrees[start:stop]
+            total = block.sum()
+            counted_targets = np.full((total, 3), -1)
+            fixed_targets = np.full((total, 3), -1)
+            fixed_targets[:, 0] = np.repeat(np.arange(start, stop), block)
+            if self.engine == "loop":
+                ptr = 0
+                for d in block:
+                    counted_targets[ptr : ptr + d, 0] = rng.choice(high, d, replace=False)
+                    ptr += d
             else:
-                self.connect_cells(ps, ps_o, fixed_targets[demux_idx], demuxed)
-            lowmux = highmux
+                counted_targets[:, 0] = _sample_without_replacement(rng, high, block)
+            lowmux = 0
+            for ps_o in ps_counted:
+                highmux = lowmux + len(ps_o)
+                if len(ps_counted) == 1:
+                    demuxed, fixed = counted_targets, fixed_targets
+                else:
+                    demux_idx = (counted_targets[:, 0] >= lowmux) & (
+                        counted_targets[:, 0] < highmux
+                    )
+                    demuxed, fixed = counted_targets[demux_idx], fixed_targets[demux_idx]
+                    demuxed[:, 0] -= lowmux
+                if is_in:
+                    self.connect_cells(ps_o, ps, demuxed, fixed)
+                else:
+                    self.connect_cells(ps, ps_o, fixed, demuxed)
+                lowmux = highmux
 
 
 @config.node
@@ -95,9 +343,19 @@ class FixedIndegree(InvertedRoI, ConnectionStrategy):
     presynaptic cells from all the presynaptic cell types.
     """
 
-    indegree: int = config.attr(type=int, required=True)
+    indegree: "int | Distribution" = config.attr(
+        type=types.or_(int, types.distribution()), required=True
+    )
+    """
+    Number of presynaptic cells to connect to each postsynaptic cell, or a distribution
+    from which the number is drawn for each postsynaptic cell.
     """
-    Number of postsynaptic cell to connect to each presynaptic cell.
+    engine: str = config.attr(
+        type=types.in_(["vectorized", "loop"]), default="vectorized"
+    )
+    """
+    Sampling engine. ``vectorized`` draws the presynaptic cells of many postsynaptic
+    cells at once, ``loop`` draws them one postsynaptic cell at a time.
     """
 
     def connect(self, pre, post):
@@ -111,13 +369,29 @@ class FixedOutdegree(ConnectionStrategy):
     postsynaptic cells from all the postsynaptic cell types.
     """
 
-    outdegree: int = config.attr(type=int, required=True)
+    outdegree: "int | Distribution" = config.attr(
+        type=types.or_(int, types.distribution()), required=True
+    )
+    """
+    Number of postsynaptic cells to connect to each presynaptic cell, or a distribution
+    from which the number is drawn for each presynaptic cell.
+    """
+    engine: str = config.attr(
+        type=types.in_(["vectorized", "loop"]), default="vectorized"
+    )
     """
-    Number of presynaptic cell to connect to each postsynaptic cell.
+    Sampling engine. ``vectorized`` draws the postsynaptic cells of many presynaptic
+    cells at once, ``loop`` draws them one presynaptic cell at a time.
     """
 
     def connect(self, pre, post):
         _connect_fixed_degree(self, pre, post, self.outdegree, False)
 
 
-__all__ = ["AllToAll", "Convergence", "FixedIndegree", "FixedOutdegree"]
+__all__ = [
+    "AllToAll",
+    "Convergence",
+    "DistanceBased",
+    "FixedIndegree",
+    "FixedOutdegree",
+]
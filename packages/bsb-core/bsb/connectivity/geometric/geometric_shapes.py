@@ -528,6 +528,29 @@ class ShapesComposition:
         else:
             return None
 
+    def generate_point_clouds(self, n: int) -> np.ndarray[float] | None:
+        """
+        Generate ``n`` independent point clouds at once. Each cloud has as many points,
+        in the same order of shapes, as a cloud of :meth:`generate_point_cloud`.
+
+        :param int n: Number of point clouds to generate.
+        :return: A numpy.ndarray of shape ``(n, points, 3)`` containing the 3D points of
+            each cloud. If there are no shapes in the collection, it returns None.
+        :rtype: numpy.ndarray[float] | None
+        """
+        if len(self._shapes) != 0:
+            return np.concatenate(
+                [
+                    shape.generate_point_cloud(numpts * n).reshape(n, numpts, 3)
+                    for shape, numpts in zip(
+                        self._shapes, self.compute_n_points(), strict=False
+                    )
+                ],
+                axis=1,
+            )
+        else:
+            return None
+
     def generate_wireframe(
         self,
         nb_points_1=30,
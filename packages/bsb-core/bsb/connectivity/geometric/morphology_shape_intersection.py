@@ -1,10 +1,19 @@
 import numpy as np
+from scipy.spatial import cKDTree
 
 from ... import config
 from ...config import types
 from .. import ConnectionStrategy
+from ..general import _row_blocks
 from .shape_morphology_intersection import _create_geometric_conn_arrays
-from .shape_shape_intersection import ShapeHemitype
+from .shape_shape_intersection import (
+    _POINT_BLOCK,
+    ShapeHemitype,
+    _cell_locs,
+    _count_inside,
+    _overlapping_boxes,
+    _prune,
+)
 
 
 def overlap_boxes(box1_min, box1_max, box2_min, box2_max):
@@ -34,6 +43,11 @@ class MorphologyToShapeIntersection(ConnectionStrategy):
     """
     Ratio of conections to keep over the total number of apositions.
     """
+    engine = config.attr(type=types.in_(["batch", "loop"]), default="batch")
+    """
+    Intersection engine. ``batch`` tests all the candidate pairs of cells at once,
+    ``loop`` tests each pair of cells in turn.
+    """
 
     def get_region_of_interest(self, chunk):
         lpre, upre = self.presynaptic._get_rect_ext(tuple(chunk.dimensions))
@@ -54,7 +68,56 @@ class MorphologyToShapeIntersection(ConnectionStrategy):
     def connect(self, pre, post):
         for pre_ps in pre.placement:
             for post_ps in post.placement:
-                self._connect_type(pre_ps, post_ps)
+                if self.engine == "loop":
+                    self._connect_type(pre_ps, post_ps)
+                else:
+                    self._connect_type_batch(pre_ps, post_ps)
+
+    def _connect_type_batch(self, pre_ps, post_ps):
+        pre_pos = pre_ps.load_positions()
+        post_pos = post_ps.load_positions()
+        post_shapes = self.postsynaptic.shapes_composition
+        post_tree = cKDTree(post_pos.reshape(-1, 3))
+        morpho_set = pre_ps.load_morphologies()
+        # Flatten the points of each unique morphology once, and index them per cell.
+        morphos = [
+            m.flatten()
+            for m in morpho_set.iter_morphologies(unique=True, hard_cache=True)
+        ]
+        points = np.concatenate([np.empty((0, 3)), *morphos])
+        sizes = np.array([len(m) for m in morphos], dtype=int)
+        starts = np.cumsum(sizes) - sizes
+        lows = np.array([m.min(axis=0) if len(m) else np.zeros(3) for m in morphos])
+        highs = np.array([m.max(axis=0) if len(m) else np.zeros(3) for m in morphos])
+        m_ids = morpho_set.get_indices(copy=False)
+        for begin, end in _row_blocks(sizes[m_ids], _POINT_BLOCK):
+            block = pre_pos[begin:end]
+            m = m_ids[begin:end]
+            i, j = _overlapping_boxes(
+                block + lows[m],
+                block + highs[m],
+                post_tree,
+                post_shapes.get_mbb_min(),
+                post_shapes.get_mbb_max(),
+            )
+            inside = _count_inside(
+                post_shapes, points, starts[m[i]], sizes[m[i]], block[i] - post_pos[j]
+            )
+            # Keep an `affinity` fraction of the contact points, at least 1 per pair.
+            if self.affinity < 1.0:
+                inside = np.where(
+                    inside > 0,
+                    np.maximum(1, np.floor(self.affinity * inside).astype(int)),
+                    0,
+                )
+            to_connect_pre, to_connect_post = _cell_locs(
+                np.repeat(i + begin, inside), np.repeat(j, inside)
+            )
+            self.connect_cells(
+                pre_ps,
+                post_ps,
+                *_prune(self.pruning_ratio, to_connect_pre, to_connect_post),
+            )
 
     def _connect_type(self, pre_ps, post_ps):
         pre_pos = pre_ps.load_positions()
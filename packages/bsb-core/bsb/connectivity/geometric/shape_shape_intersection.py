@@ -1,12 +1,80 @@
 import numpy as np
+from scipy.spatial import cKDTree
 
 from ... import config
 from ...config import types
 from ...trees import BoxTree
 from .. import ConnectionStrategy
+from ..general import _row_blocks
 from ..strategy import Hemitype
 from .geometric_shapes import ShapesComposition
 
+# Number of points to test against the shapes at once.
+_POINT_BLOCK = 2**20
+
+
+def _overlapping_boxes(pre_min, pre_max, post_tree, post_mbb_min, post_mbb_max):
+    """
+    Find the pairs of overlapping boxes, between the presynaptic boxes
+    ``pre_min[i], pre_max[i]`` and the postsynaptic boxes, which are the bounding box of
+    the postsynaptic shapes translated to the positions of ``post_tree``.
+
+    :returns: The presynaptic and postsynaptic indices of each pair.
+    :rtype: tuple[numpy.ndarray[int], numpy.ndarray[int]]
+    """
+    # A postsynaptic box overlaps a presynaptic box when its position lies inside the
+    # presynaptic box grown by the extent of the postsynaptic shapes.
+    lo = pre_min - post_mbb_max
+    hi = pre_max - post_mbb_min
+    found = post_tree.query_ball_point(
+        (lo + hi) / 2, r=np.max(hi - lo, axis=1) / 2, p=np.inf
+    )
+    counts = np.fromiter(map(len, found), dtype=int, count=len(found))
+    pre_ids = np.repeat(np.arange(len(found)), counts)
+    post_ids = np.concatenate(found).astype(int) if counts.sum() else pre_ids.copy()
+    pos = post_tree.data[post_ids]
+    inside = np.all((pos >= lo[pre_ids]) & (pos <= hi[pre_ids]), axis=1)
+    return pre_ids[inside], post_ids[inside]
+
+
+def _count_inside(shapes, points, starts, counts, offsets):
+    """
+    Count, for each pair ``p``, the points ``points[starts[p] : starts[p] + counts[p]]``
+    that lie inside of the shapes once translated by ``offsets[p]``.
+
+    :rtype: numpy.ndarray[int]
+    """
+    result = np.zeros(len(starts), dtype=int)
+    for begin, end in _row_blocks(counts, _POINT_BLOCK):
+        c = counts[begin:end]
+        pair = np.repeat(np.arange(end - begin), c)
+        idx = np.repeat(starts[begin:end] - np.cumsum(c) + c, c) + np.arange(c.sum())
+        rel = points[idx] + offsets[begin:end][pair]
+        inside = shapes.inside_mbox(rel)
+        inside[inside] = shapes.inside_shapes(rel[inside])
+        result[begin:end] = np.bincount(pair[inside], minlength=end - begin)
+    return result
+
+
+def _prune(pruning_ratio, to_connect_pre, to_connect_post):
+    if pruning_ratio < 1 and len(to_connect_pre) > 0:
+        ids_to_select = np.random.choice(
+            len(to_connect_pre),
+            int(np.floor(pruning_ratio * len(to_connect_pre))),
+            replace=False,
+        )
+        to_connect_pre = to_connect_pre[ids_to_select]
+        to_connect_post = to_connect_post[ids_to_select]
+    return to_connect_pre, to_connect_post
+
+
+def _cell_locs(pre_ids, post_ids):
+    to_connect_pre = np.full((len(pre_ids), 3), -1, dtype=int)
+    to_connect_post = np.full((len(post_ids), 3), -1, dtype=int)
+    to_connect_pre[:, 0] = pre_ids
+    to_connect_post[:, 0] = post_ids
+    return to_connect_pre, to_connect_post
+
 
 @config.node
 class ShapeHemitype(Hemitype):
@@ -63,6 +131,11 @@ class ShapeToShapeIntersection(ConnectionStrategy):
     """
     Ratio of conections to keep over the total number of apositions.
     """
+    engine = config.attr(type=types.in_(["batch", "loop"]), default="batch")
+    """
+    Intersection engine. ``batch`` tests all the candidate pairs of cells at once,
+    ``loop`` tests each pair of cells in turn.
+    """
 
     def get_region_of_interest(self, chunk):
         # Filter postsyn chunks that overlap the presyn chunk.
@@ -78,7 +151,51 @@ class ShapeToShapeIntersection(ConnectionStrategy):
     def connect(self, pre, post):
         for pre_ps in pre.placement:
             for post_ps in post.placement:
-                self._connect_type(pre_ps.cell_type, pre_ps, post_ps.cell_type, post_ps)
+                if self.engine == "loop":
+                    self._connect_type(
+                        pre_ps.cell_type, pre_ps, post_ps.cell_type, post_ps
+                    )
+                else:
+                    self._connect_type_batch(pre_ps, post_ps)
+
+    def _connect_type_batch(self, pre_ps, post_ps):
+        pre_pos = pre_ps.load_positions()
+        post_pos = post_ps.load_positions()
+        pre_shapes = self.presynaptic.shapes_composition
+        post_shapes = self.postsynaptic.shapes_composition
+        post_tree = cKDTree(post_pos.reshape(-1, 3))
+        n_points = sum(pre_shapes.compute_n_points())
+        # Generate the point clouds of a block of presynaptic cells at a time, and test
+        # them against the postsynaptic shapes of all the overlapping boxes at once.
+        batch = max(1, _POINT_BLOCK // max(n_points, 1))
+        for start in range(0, len(pre_pos), batch):
+            block = pre_pos[start : start + batch]
+            i, j = _overlapping_boxes(
+                block + pre_shapes.get_mbb_min(),
+                block + pre_shapes.get_mbb_max(),
+                post_tree,
+                post_shapes.get_mbb_min(),
+                post_shapes.get_mbb_max(),
+            )
+            clouds = pre_shapes.generate_point_clouds(len(block)).reshape(-1, 3)
+            inside = _count_inside(
+                post_shapes,
+                clouds,
+                i * n_points,
+                np.full(len(i), n_points),
+                block[i] - post_pos[j],
+            )
+            # Keep an `affinity` fraction of the contact points, rounded at random.
+            kept = inside * self.affinity
+            synapses = np.floor(kept).astype(int) + (np.random.rand(len(kept)) < kept % 1)
+            to_connect_pre, to_connect_post = _cell_locs(
+                np.repeat(i + start, synapses), np.repeat(j, synapses)
+            )
+            self.connect_cells(
+                pre_ps,
+                post_ps,
+                *_prune(self.pruning_ratio, to_connect_pre, to_connect_post),
+            )
 
     def _connect_type(self, pre_ct, pre_ps, post_ct, post_ps):
         pre_pos = pre_ps.load_positions()
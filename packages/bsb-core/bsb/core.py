@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import itertools
+import multiprocessing
 import os
 import sys
 import time
 import typing
+import warnings
 
 import numpy as np
 
@@ -24,7 +27,11 @@ from .exceptions import (
 from .placement import PlacementStrategy
 from .reporting import report
 from .services import JobPool
-from .services._pool_listeners import NonTTYTerminalListener, TTYTerminalListener
+from .services._pool_listeners import (
+    NonTTYTerminalListener,
+    PhaseTimer,
+    TTYTerminalListener,
+)
 from .services.mpi import MPIService
 from .services.pool import Job, Workflow
 from .simulation import get_simulation_adapter
@@ -82,6 +89,14 @@ def _config_property(name):
     return prop.setter(fset)
 
 
+def _trace_phase(phase):
+    from bsb_otel.tracer import get_bsb_tracer
+
+    return get_bsb_tracer("bsb-core").trace(
+        f"compile.{phase}", attributes={"bsb.type": "compile_phase", "bsb.phase": phase}
+    )
+
+
 def _bad_flag(flag: bool):
     return flag is not None and bool(flag) is not flag
 
@@ -320,6 +335,7 @@ class Scaffold:
             if pool.is_main():
                 pool.schedule(strategies)
             pool.execute()
+        self.storage.flush()
 
     def run_placement_strategy(self, strategy):
         """
@@ -362,9 +378,19 @@ class Scaffold:
         redo=False,
         force=False,
         fail_fast=True,
+        workers=None,
+        unified=False,
     ):
         """
         Run reconstruction steps in the scaffold sequence to obtain a full network.
+
+        :param workers: Number of local worker processes to run the jobs on, when not
+          running under MPI.
+        :type workers: int
+        :param unified: Run the placement, connectivity and their hooks in a single job
+          pool, without a barrier between the phases. Each connectivity strategy starts
+          as soon as its cell types are placed. Requires MPI or ``workers``.
+        :type unified: bool
         """
         existed = self.storage.preexisted
 
@@ -405,34 +431,80 @@ class Scaffold:
         # We update the configuration saved to make sure it corresponds
         self.storage.store_active_config(self.configuration)
 
+        if (
+            unified
+            and self._comm.get_size() == 1
+            and not (
+                (workers or 1) > 1 and "fork" in multiprocessing.get_all_start_methods()
+            )
+        ):
+            # Serial pools only execute jobs once all of them are scheduled.
+            warnings.warn(
+                "Unified compilation requires MPI or local worker processes,"
+                " compiling the phases separately.",
+                stacklevel=2,
+            )
+            unified = False
         phases = ["pipelines"]
-        if not skip_placement:
-            phases.append("placement")
-        if not skip_after_placement:
-            phases.append("after_placement")
-        if not skip_connectivity:
-            phases.append("connectivity")
-        if not skip_after_connectivity:
-            phases.append("after_connectivity")
+        if unified:
+            phases.append("unified")
+        else:
+            if not skip_placement:
+                phases.append("placement")
+            if not skip_after_placement:
+                phases.append("after_placement")
+            if not skip_connectivity:
+                phases.append("connectivity")
+            if not skip_after_connectivity:
+                phases.append("after_connectivity")
         self._workflow = Workflow(phases)
+        self._workers = workers
         try:
-            self.run_pipelines(fail_fast=fail_fast)
+            with _trace_phase("pipelines"):
+                self.run_pipelines(fail_fast=fail_fast)
             self._workflow.next_phase()
-            if not skip_placement:
+            if unified:
+                report(f"Starting unified compilation: {todo_list_str}", level=2)
+                ap_hooks = [] if skip_after_placement else self.after_placement.values()
+                ac_hooks = (
+                    [] if skip_after_connectivity else self.after_connectivity.values()
+                )
+                with _trace_phase("unified") as span:
+                    durations, wall_time = self._run_unified(
+                        p_strats, c_strats, ap_hooks, ac_hooks, fail_fast=fail_fast
+                    )
+                    # Without barriers, the phases overlap: the time that they
+                    # overlap is the time saved compared to running them one by one.
+                    saved = max(sum(durations.values()) - wall_time, 0)
+                    for phase, duration in durations.items():
+                        span.set_attribute(f"bsb.compile.{phase}_time", duration)
+                    span.set_attribute("bsb.compile.wall_time", wall_time)
+                    span.set_attribute("bsb.compile.saved_time", saved)
+                report(
+                    f"Unified compilation took {wall_time:.2f}s, the phases overlapped"
+                    f" for {saved:.2f}s.",
+                    level=2,
+                )
+                self._workflow.next_phase()
+            if not unified and not skip_placement:
                 placement_todo = ", ".join(s.name for s in p_strats)
                 report(f"Starting placement strategies: {placement_todo}", level=2)
-                self.run_placement(p_strats, fail_fast=fail_fast, pipelines=False)
+                with _trace_phase("placement"):
+                    self.run_placement(p_strats, fail_fast=fail_fast, pipelines=False)
                 self._workflow.next_phase()
-            if not skip_after_placement:
-                self.run_after_placement(pipelines=False, fail_fast=fail_fast)
+            if not unified and not skip_after_placement:
+                with _trace_phase("after_placement"):
+                    self.run_after_placement(pipelines=False, fail_fast=fail_fast)
                 self._workflow.next_phase()
-            if not skip_connectivity:
+            if not unified and not skip_connectivity:
                 connectivity_todo = ", ".join(s.name for s in c_strats)
                 report(f"Starting connectivity strategies: {connectivity_todo}", level=2)
-                self.run_connectivity(c_strats, fail_fast=fail_fast, pipelines=False)
+                with _trace_phase("connectivity"):
+                    self.run_connectivity(c_strats, fail_fast=fail_fast, pipelines=False)
                 self._workflow.next_phase()
-            if not skip_after_connectivity:
-                self.run_after_connectivity(pipelines=False)
+            if not unified and not skip_after_connectivity:
+                with _trace_phase("after_connectivity"):
+                    self.run_after_connectivity(pipelines=False)
                 self._workflow.next_phase()
         finally:
             # After compilation we should flag the storage as having existed before
@@ -440,6 +512,127 @@ class Scaffold:
             # `compile` pass.
             self.storage._preexisted = True
             del self._workflow
+            del self._workers
+
+    def _run_unified(self, p_strats, c_strats, ap_hooks, ac_hooks, fail_fast=True):
+        """
+        Run placement, after placement hooks, connectivity and after connectivity hooks
+        in a single job pool. Each connectivity strategy is scheduled as soon as the
+        placement jobs and after placement hooks of its cell types have completed, and
+        each after placement hook as soon as the placement of its cell types has.
+
+        :returns: The time between the first queued and the last completed job of each
+          phase, and the wall time of the pool.
+        :rtype: tuple[dict[str, float], float]
+        """
+        from .postprocessing import AfterConnectivityHook, AfterPlacementHook
+
+        p_strats = PlacementStrategy.sort_deps(p_strats)
+        c_strats = ConnectionStrategy.sort_deps(c_strats)
+        ap_hooks = [*ap_hooks]
+        phase_types = {
+            "placement": PlacementStrategy,
+            "after_placement": AfterPlacementHook,
+            "connectivity": ConnectionStrategy,
+            "after_connectivity": AfterConnectivityHook,
+        }
+
+        def phase_of(job):
+            return next(
+                (p for p, t in phase_types.items() if isinstance(job.submitter, t)),
+                None,
+            )
+
+        timer = PhaseTimer(phase_of)
+        with self.create_job_pool(fail_fast=fail_fast, quiet=options.quiet) as pool:
+            pool.add_listener(timer)
+            start = time.perf_counter()
+            if pool.is_main():
+
+                def deferred(futures, get_jobs):
+                    # Scheduler that queues the node once the given schedulers and
+                    # the jobs of the node's inputs have completed.
+                    def scheduler(node):
+                        concurrent.futures.wait(futures)
+                        pool.await_jobs(get_jobs(node))
+                        node.queue(pool)
+
+                    return scheduler
+
+                def placement_jobs(cell_types):
+                    return [
+                        job
+                        for strategy in p_strats
+                        if cell_types is None
+                        or not cell_types.isdisjoint(strategy.cell_types)
+                        for job in pool.get_submissions_of(strategy)
+                    ]
+
+                placing = pool.schedule(
+                    p_strats, lambda s: s.queue(pool, self.network.chunk_size)
+                )
+                hook_futures = {
+                    hook: pool.schedule(
+                        [hook],
+                        deferred([placing], lambda h: placement_jobs(h.get_cell_types())),
+                    )
+                    for hook in ap_hooks
+                }
+                conn_futures = {}
+                for strategy in c_strats:
+                    cell_types = {
+                        *strategy.presynaptic.cell_types,
+                        *strategy.postsynaptic.cell_types,
+                    }
+                    hooks = [
+                        hook
+                        for hook in ap_hooks
+                        if (hook_types := hook.get_cell_types()) is None
+                        or not hook_types.isdisjoint(cell_types)
+                    ]
+                    futures = [
+                        placing,
+                        *(hook_futures[hook] for hook in hooks),
+                        # Connectivity dependencies must have queued their jobs first.
+                        *(
+                            conn_futures[d]
+                            for d in strategy.get_deps()
+                            if d in conn_futures
+                        ),
+                    ]
+
+                    def input_jobs(_, cell_types=cell_types, hooks=hooks):
+                        return [
+                            *placement_jobs(cell_types),
+                            *itertools.chain.from_iterable(
+                                map(pool.get_submissions_of, hooks)
+                            ),
+                        ]
+
+                    conn_futures[strategy] = pool.schedule(
+                        [strategy], deferred(futures, input_jobs)
+                    )
+
+                def upstream_jobs(_):
+                    return [
+                        *itertools.chain.from_iterable(
+                            map(
+                                pool.get_submissions_of, (*p_strats, *ap_hooks, *c_strats)
+                            )
+                        )
+                    ]
+
+                pool.schedule(
+                    ac_hooks,
+                    deferred(
+                        [placing, *hook_futures.values(), *conn_futures.values()],
+                        upstream_jobs,
+                    ),
+                )
+            pool.execute()
+            wall_time = time.perf_counter() - start
+        self.storage.flush()
+        return timer.durations, wall_time
 
     def run_pipelines(self, fail_fast=True, pipelines=None):
         if pipelines is None:
@@ -811,13 +1004,14 @@ class Scaffold:
             ) from None
         return cs
 
-    def create_job_pool(self, fail_fast=None, quiet=False):
+    def create_job_pool(self, fail_fast=None, quiet=False, workers=None):
         id_pool = self._comm.bcast(int(time.time()), root=0)
         pool = JobPool(
             id_pool,
             self,
             fail_fast=fail_fast,
             workflow=getattr(self, "_workflow", None),
+            workers=workers or getattr(self, "_workers", None),
         )
         try:
             # Check whether stdout is a TTY, and that it is larger than 0x0
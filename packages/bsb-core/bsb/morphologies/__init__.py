@@ -125,6 +125,35 @@ class MorphologySet:
             res = np.array([self._loaders[idx].load() for idx in data])
         return res
 
+    def voxelize(self, index, N, rotation=None, cache=True):
+        """
+        Voxelize the morphology of a cell, optionally rotated.
+
+        :param index: Index of the cell.
+        :type index: int
+        :param N: Approximate number of voxels.
+        :type N: int
+        :param rotation: Rotation to apply to the morphology before voxelizing it.
+        :type rotation: scipy.spatial.transform.Rotation
+        :param cache: Use :ref:`Soft caching<soft-caching>`, keyed by the morphology,
+            the rotation and ``N``, so that each combination is voxelized only once.
+        :type cache: bool
+        :rtype: bsb.voxels.VoxelSet
+        """
+        idx = self._m_indices[index]
+        key = (idx, N, None)
+        if rotation is not None:
+            key = (idx, N, tuple(rotation.as_matrix().round(9).reshape(-1)))
+        if cache and key in self._cached:
+            return self._cached[key]
+        morpho = self._get_one(idx, cache, False)
+        if rotation is not None:
+            morpho.rotate(rotation)
+        voxels = morpho.voxelize(N)
+        if cache:
+            self._cached[key] = voxels
+        return voxels
+
     def clear_soft_cache(self):
         self._cached = {}
 
@@ -744,6 +773,58 @@ class Morphology(SubTree):
             for branch in self.branches:
                 branch._on_mutate = self._mutnotif
 
+    @classmethod
+    def from_buffers(cls, shared_buffers, ends, parents, meta=None):
+        """
+        Create a morphology over shared buffers, without creating its branches until
+        they are needed.
+
+        :param shared_buffers: The points, radii, labels and properties of the
+          morphology, in the depth-first order of its branches.
+        :type shared_buffers: tuple
+        :param ends: Pointer to the end of each branch in the buffers.
+        :type ends: numpy.ndarray[int]
+        :param parents: Index of the parent branch of each branch, or -1 for roots.
+          Each parent must come before its children.
+        :type parents: numpy.ndarray[int]
+        :param meta: Metadata of the morphology.
+        :type meta: dict
+        """
+        morpho = cls([], meta, shared_buffers)
+        morpho._is_shared = True
+        morpho._graph = (np.asarray(ends, dtype=int), np.asarray(parents, dtype=int))
+        morpho._roots = None
+        return morpho
+
+    @property
+    def roots(self):
+        if self._roots is None:
+            self._roots = self._build_roots()
+        return self._roots
+
+    @roots.setter
+    def roots(self, value):
+        self._roots = value
+        self._graph = None
+
+    def _build_roots(self):
+        ends, parents = self._graph
+        self._graph = None
+        branches = []
+        roots = []
+        ptr = 0
+        for end, parent in zip(ends.tolist(), parents.tolist(), strict=True):
+            branch = Branch(*self._shared.get_shared(ptr, end))
+            if parent < 0:
+                roots.append(branch)
+            else:
+                branches[parent].attach_child(branch)
+            branches.append(branch)
+            ptr = end
+        for branch in branches:
+            branch._on_mutate = self._mutnotif
+        return roots
+
     @_gutil.obj_str_insert
     def __repr__(self):
         return (
@@ -866,6 +947,11 @@ class Morphology(SubTree):
         """
         Copy the morphology.
         """
+        if self._roots is None:
+            # The branches don't exist yet, copy the buffers and create them lazily.
+            return self.from_buffers(
+                self._shared.copy(), *self._graph, meta=self.meta.copy()
+            )
         # Make sure to optimize so that we use 1 shared buffer.
         self.optimize(force=False)
         # Copy that buffer into a new one
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import abc
+import io
 import itertools
 import typing
+import warnings
 from collections import deque
 from functools import reduce
 
@@ -46,6 +48,13 @@ class BsbParser(MorphologyParser, classmap_entry="bsb"):
     No point will be inferred between a child branch of a branch labelled with the given
     labels; usually used to skip points between the soma and its child branches.
     """
+    engine: str = config.attr(
+        type=types.in_(["vectorized", "loop"]), default="vectorized"
+    )
+    """
+    ``vectorized`` reads the SWC file in bulk and finds the branches of all samples at
+    once. ``loop`` reads the file line by line and walks the samples one by one.
+    """
 
     def parse(self, file: FileDependency | str):
         from ...storage._files import FileDependency
@@ -56,9 +65,25 @@ class BsbParser(MorphologyParser, classmap_entry="bsb"):
         return self.parse_content(content.decode(encoding or "utf8"))
 
     def parse_content(self, content: str):
-        data = self._swc_parse(content)
+        if self.engine == "vectorized":
+            data = self._swc_parse_vectorized(content)
+        else:
+            data = self._swc_parse(content)
         return self._swc_data_to_morpho(data)
 
+    def _swc_parse_vectorized(self, content: str):
+        try:
+            with warnings.catch_warnings():
+                # Empty files are reported by the line by line parser below.
+                warnings.simplefilter("ignore")
+                data = np.loadtxt(io.StringIO(content), comments="#", ndmin=2)
+        except ValueError:
+            data = None
+        if data is None or data.shape[1] != 7:
+            # Let the line by line parser report what is wrong with the content.
+            return self._swc_parse(content)
+        return data
+
     def _swc_parse(self, content: str):
         try:
             data = [
@@ -74,11 +99,28 @@ class BsbParser(MorphologyParser, classmap_entry="bsb"):
             raise ValueError(f"SWC incorrect on lines: {err_lines}")
         return np.array(data)
 
-    def _swc_data_to_morpho(self, data):
-        data = np.array(data, copy=False)
+    def _swc_tag_map(self):
         tag_map = {1: "soma", 2: "axon", 3: "dendrites"}
         if self.tags is not None:
             tag_map.update((int(k), v) for (k, v) in self.tags.items())
+        return tag_map
+
+    def _swc_boundaries(self, tags):
+        # The tags whose labels are all boundary labels.
+        boundaries = set()
+        if self.skip_boundary_labels:
+            tset = set(self.skip_boundary_labels)
+            for tag, labels in tags.items():
+                lset = set(labels if not isinstance(labels, str) else [labels])
+                if tset.issuperset(lset):
+                    boundaries.add(tag)
+        return boundaries
+
+    def _swc_data_to_morpho(self, data):
+        if self.engine == "vectorized":
+            return self._swc_data_to_morpho_vectorized(data)
+        data = np.array(data, copy=False)
+        tag_map = self._swc_tag_map()
         # `data` is the raw SWC data,
         # `samples` and `parents` are the graph nodes and edges.
         samples = data[:, 0].astype(int)
@@ -149,13 +191,7 @@ class BsbParser(MorphologyParser, classmap_entry="bsb"):
         return morpho
 
     def _swc_branch_dfs(self, adjacency, branches, node, data, tags):
-        boundaries = set()
-        if self.skip_boundary_labels:
-            tset = set(self.skip_boundary_labels)
-            for tag, labels in tags.items():
-                lset = set(labels if not isinstance(labels, str) else [labels])
-                if tset.issuperset(lset):
-                    boundaries.add(tag)
+        boundaries = self._swc_boundaries(tags)
         branch = []
         branch_id = len(branches)
         branches.append((None, branch))
@@ -193,6 +229,109 @@ class BsbParser(MorphologyParser, classmap_entry="bsb"):
                 child_nodes = []
                 node = None
 
+    def _swc_data_to_morpho_vectorized(self, data):
+        data = np.asarray(data, dtype=float).reshape(-1, 7)
+        tag_map = self._swc_tag_map()
+        boundaries = self._swc_boundaries(tag_map)
+        n = len(data)
+        nodes = np.arange(n)
+        # Map possibly irregular sample IDs (SWC spec allows this)
+        # to an ordered 0 to N map.
+        samples = data[:, 0].astype(int)
+        parent_ids = data[:, 6].astype(int)
+        order = np.argsort(samples, kind="stable")
+        found = np.minimum(np.searchsorted(samples, parent_ids, sorter=order), n - 1)
+        parents = order[found] if n else nodes
+        is_root = parent_ids == -1
+        unknown = ~is_root & (samples[parents] != parent_ids)
+        if np.any(unknown):
+            raise ValueError(f"SWC parents not found: {parent_ids[unknown]}")
+        parents[is_root] = -1
+        # A sample starts a new branch if it is a root, if its parent has more than one
+        # child, or if it crosses out of a boundary. Branches start with a copy of their
+        # parent sample, unless the parent is a boundary.
+        swc_tags = data[:, 1].astype(int)
+        in_boundary = np.isin(swc_tags, list(boundaries))
+        safe_parents = np.where(is_root, nodes, parents)
+        child_count = np.bincount(parents[~is_root], minlength=n)
+        starts = (
+            is_root
+            | (child_count[safe_parents] > 1)
+            | (in_boundary[safe_parents] & ~in_boundary)
+        )
+        copies = starts & ~is_root & ~in_boundary[safe_parents]
+        # Find the first sample of the branch of each sample, and its depth in the branch,
+        # by pointer jumping up the unbranching stretches of the graph.
+        head = np.where(starts, nodes, parents)
+        depth = (~starts).astype(int)
+        for _ in range(n.bit_length() + 1):
+            jump = head[head]
+            if np.array_equal(jump, head):
+                break
+            depth += depth[head]
+            head = jump
+        else:
+            raise ValueError("SWC samples form a cycle.")
+        first_samples = np.flatnonzero(starts)
+        branch_of = np.searchsorted(first_samples, head)
+        parent_branch = np.where(
+            is_root[first_samples], -1, branch_of[safe_parents[first_samples]]
+        )
+        # Order the branches depth first, with the children of each branch (and the
+        # roots) in the order of the samples.
+        children = np.argsort(parent_branch, kind="stable")
+        ptrs = np.concatenate(([0], np.cumsum(np.bincount(parent_branch + 1))))
+        ptrs = np.pad(ptrs, (0, len(first_samples) + 2 - len(ptrs)), mode="edge")
+        branch_order = []
+        stack = list(children[ptrs[0] : ptrs[1]][::-1])
+        while stack:
+            b = stack.pop()
+            branch_order.append(b)
+            stack.extend(children[ptrs[b + 1] : ptrs[b + 2]][::-1])
+        branch_order = np.array(branch_order, dtype=int)
+        # Lay out the branches one after the other, and gather the sample of each point.
+        sizes = (
+            np.bincount(branch_of, minlength=len(first_samples)) + copies[first_samples]
+        )
+        branch_ptrs = np.empty(len(first_samples), dtype=int)
+        branch_ptrs[branch_order] = np.cumsum(sizes[branch_order]) - sizes[branch_order]
+        _len = sizes.sum()
+        gather = np.empty(_len, dtype=int)
+        gather[branch_ptrs[branch_of] + copies[head] + depth] = nodes
+        copied = np.flatnonzero(copies[first_samples])
+        gather[branch_ptrs[copied]] = parents[first_samples[copied]]
+        points = data[gather, 2:5]
+        radii = data[gather, 5]
+        tags = swc_tags[gather]
+        # The first point of each branch gets the tag of the next point.
+        multi = branch_ptrs[sizes > 1]
+        tags[multi] = tags[multi + 1]
+        # Label the points, in the order that the tags first occur on the branches, so
+        # that the labelsets get the same values as they would branch by branch.
+        labels = EncodedLabels.none(_len)
+        branch_rank = np.repeat(np.arange(len(branch_order)), sizes[branch_order])
+        unique_tags, tag_idx = np.unique(tags, return_inverse=True)
+        first = np.full(len(unique_tags), _len * len(unique_tags))
+        np.minimum.at(first, tag_idx, branch_rank * len(unique_tags) + tag_idx)
+        for v in unique_tags[np.argsort(first)]:
+            u_tags = tag_map.get(v, f"tag_{v}")
+            labels.label([u_tags] if isinstance(u_tags, str) else u_tags, tags == v)
+        branches = {}
+        roots = []
+        for b in branch_order:
+            ptr = branch_ptrs[b]
+            nptr = ptr + sizes[b]
+            branch = self.branch_cls(points[ptr:nptr], radii[ptr:nptr], labels[ptr:nptr])
+            branch.set_properties(tags=tags[ptr:nptr])
+            branches[b] = branch
+            if parent_branch[b] == -1:
+                roots.append(branch)
+            else:
+                branches[parent_branch[b]].attach_child(branch)
+        morpho = self.cls(roots, shared_buffers=(points, radii, labels, {"tags": tags}))
+        assert morpho._check_shared(), "SWC import didn't result in shareable buffers."
+        return morpho
+
 
 # Wrapper to append our own attributes to morphio somas and treat it like any other branch
 class _MorphIoSomaWrapper:
@@ -8,10 +8,11 @@ from scipy.spatial.transform import Rotation
 from bsb import pool_cache
 
 from .. import config
+from ..config import types
 from ..exceptions import EmptySelectionError
 from ..morphologies import MorphologySet, RotationSet
 from ..topology.partition import Partition
-from ..voxels import voxel_rotation_of
+from ..voxels import voxel_rotation_of, voxel_rotations_of
 from .indicator import PlacementIndications
 
 
@@ -174,6 +175,20 @@ class VolumetricRotations(RotationDistributor, classmap_entry="orientation_field
     It provides a rotation for each voxel considered. Its shape should be (L, W, D, 3)
     where L, W and D are the sizes of the field.
     """
+    engine: str = config.attr(
+        type=types.in_(["vectorized", "loop"]), default="vectorized"
+    )
+    """
+    ``vectorized`` looks up the orientation vectors of all the positions, and computes
+    their rotations, at once. ``loop`` does so position by position.
+    """
+
+    @pool_cache
+    def get_orientation_field(self):
+        """
+        Load the orientation field once per process.
+        """
+        return self.orientation_path.load_object().raw
 
     def distribute(self, positions, context):
         """
@@ -191,8 +206,13 @@ class VolumetricRotations(RotationDistributor, classmap_entry="orientation_field
         :rtype: RotationSet
         """
 
-        orientation_field = self.orientation_path.load_object().raw
+        orientation_field = self.get_orientation_field()
         voxel_pos = self.orientation_path.voxel_of(positions)
+        if self.engine == "vectorized":
+            rotations = voxel_rotations_of(
+                orientation_field, voxel_pos, self.orientation_path.default_vector
+            )
+            return RotationSet(rotations.as_euler("xyz", degrees=True))
         # By default, positions outside the field should not rotate.
         rotations = []
         for voxel in voxel_pos:
@@ -281,19 +301,10 @@ class DistributorsNode:
             for m in morphologies:
                 idx = generated.setdefault(m, len(generated))
                 indices.append(idx)
-            mr = self.scaffold.morphologies
             uid = uuid.uuid4()
-            loaders = []
-            all_meta = {}
-            # Save morphologies one by one
-            for gen_morpho, i in generated.items():
-                name = f"{prefix}-{uid}-{i}"
-                # `update_metadata=False` so morphology is incompletely stored.
-                saved = mr.save(name, gen_morpho, update_meta=False)
-                all_meta[name] = saved.get_meta()
-                loaders.append(saved)
-            # Finish morphologies by bulk saving their collective metadata
-            mr.update_all_meta(all_meta)
+            names = [f"{prefix}-{uid}-{i}" for i in generated.values()]
+            # Save all generated morphologies, and their metadata, in one go.
+            loaders = self.scaffold.morphologies.save_many(names, generated.keys())
             morphologies = MorphologySet(loaders, indices)
         if not isinstance(morphologies, MorphologySet) and morphologies is not None:
             morphologies = MorphologySet(loaders, morphologies)
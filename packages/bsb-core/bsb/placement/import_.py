@@ -4,7 +4,6 @@ import abc
 import csv
 import io
 import typing
-from collections import defaultdict
 
 import numpy as np
 import psutil
@@ -15,7 +14,7 @@ from ..config import refs
 from ..exceptions import ConfigurationError
 from ..mixins import NotParallel
 from ..reporting import report
-from ..storage._chunks import Chunk
+from ..storage._chunks import ChunkIndex
 from .strategy import PlacementStrategy
 
 if typing.TYPE_CHECKING:  # pragma: nocover
@@ -63,7 +62,6 @@ class CsvImportPlacement(ImportPlacement):
 
     def parse_source(self, indicators):
         self._reset_cache()
-        chunk_size = np.array(self.scaffold.network.chunk_size)
         with self.source.provide_stream() as (fp, encoding):
             text = io.TextIOWrapper(fp, encoding=encoding, newline="")
             reader = csv.reader(text)
@@ -82,15 +80,12 @@ class CsvImportPlacement(ImportPlacement):
             if self.progress_bar:
                 reader = tqdm(reader, desc="imported", unit=" lines")
             for i, line in enumerate(reader):
-                ct_cache = self._cache[line[type_col] if type_col is not None else name]
-                coords = [_safe_float(line[c]) for c in coord_cols]
-                others = [_safe_float(line[c]) for c in other_cols]
-                cache = ct_cache[tuple(coords // chunk_size)]
-                cache[0].append(coords)
-                cache[1].append(others)
+                cache = self._cache[line[type_col] if type_col is not None else name]
+                cache[0].append([_safe_float(line[c]) for c in coord_cols])
+                cache[1].append([_safe_float(line[c]) for c in other_cols])
 
                 if i % 10000 == 0:
-                    est_memsize = (len(others) + 3) * i * 8
+                    est_memsize = (len(other_cols) + 3) * i * 8
                     av_mem = psutil.virtual_memory().available
                     if est_memsize > av_mem / 10:
                         report(
@@ -103,13 +98,11 @@ class CsvImportPlacement(ImportPlacement):
         return self.cell_types or self.scaffold.cell_types.values()
 
     def _reset_cache(self):
-        self._cache = {
-            ct.name: defaultdict(lambda: [[], []])
-            for ct in self.get_considered_cell_types()
-        }
+        self._cache = {ct.name: ([], []) for ct in self.get_considered_cell_types()}
 
     def _flush(self, indicators):
         cell_types = self.get_considered_cell_types()
+        chunk_size = self.scaffold.network.chunk_size
         iter = zip(cell_types, self._cache.values(), strict=False)
         if self.progress_bar:
             iter = tqdm(
@@ -117,28 +110,32 @@ class CsvImportPlacement(ImportPlacement):
                 desc="cell types",
                 total=len(cell_types),
             )
-        for ct, chunked_cache in iter:
-            inner = ((Chunk(c, None), data) for c, data in chunked_cache.items())
+        for ct, (coords, others) in iter:
+            positions = np.array(coords, dtype=float).reshape(-1, 3)
+            additional = np.array(others, dtype=float).reshape(
+                len(positions), len(self._other_colnames)
+            )
+            index = ChunkIndex(positions, chunk_size)
+            inner = index
             if self.progress_bar:
                 inner = tqdm(
-                    inner,
+                    index,
                     desc="saved",
-                    total=len(chunked_cache),
+                    total=len(index),
                     bar_format=(
                         "{l_bar}{bar} [ {n_fmt}/{total_fmt} time left: {remaining}, "
                         "time spent: {elapsed}]"
                     ),
                 )
-            for chunk, data in inner:
-                additional = np.array(data[1], dtype=float).T
+            for chunk, rows in inner:
                 self.place_cells(
                     indicators[ct.name],
-                    np.array(data[0]),
+                    positions[rows],
                     chunk,
                     additional={
                         name: col
                         for name, col in zip(
-                            self._other_colnames, additional, strict=False
+                            self._other_colnames, additional[rows].T, strict=False
                         )
                     },
                 )
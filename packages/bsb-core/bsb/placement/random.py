@@ -1,6 +1,6 @@
 import numpy as np
 
-from .. import config
+from .. import config, types
 from ..exceptions import PackingError, PackingWarning
 from ..reporting import report, warn
 from ..voxels import VoxelSet
@@ -29,22 +29,19 @@ class _VoxelBasedFiller:
             for name, indicator in indicators.items()
         ]
         # Create and fill the particle system.
-        system = VolumeFiller(track_displaced=False, scaffold=self.scaffold, strat=self)
+        system = VolumeFiller(
+            track_displaced=False, scaffold=self.scaffold, strat=self, engine=self.engine
+        )
         system.fill(voxels, particles, check_pack=check_pack)
         return system
 
     def _extract_system(self, system, chunk, indicators):
-        if len(system.particles) == 0:
-            return
-
         for pt in system.particle_types:
             cell_type = self.scaffold.cell_types[pt["name"]]
             indicator = indicators[pt["name"]]
-            particle_positions = [p.position for p in system.particles if p.type is pt]
-            if len(particle_positions) == 0:
+            positions = system.get_positions(pt)
+            if len(positions) == 0:
                 continue
-            positions = np.empty((len(particle_positions), 3))
-            positions[:] = particle_positions
             report(f"Placing {len(positions)} {cell_type.name} in {chunk}", level=3)
             self.place_cells(indicator, positions, chunk)
 
@@ -55,6 +52,14 @@ class RandomPlacement(PlacementStrategy, _VoxelBasedFiller):
     Place cells in random positions.
     """
 
+    engine: str = config.attr(type=types.in_(["uniform", "grid"]), default="uniform")
+    """
+    Engine that generates the positions. The ``uniform`` engine draws each position
+    independently, so cells may overlap. The ``grid`` engine packs the cells without
+    overlap within each chunk, by rejecting candidates that collide with the cells of
+    neighbouring cells of a spatial hash grid.
+    """
+
     def place(self, chunk, indicators):
         system = self._fill_system(chunk, indicators, check_pack=True)
         self._extract_system(system, chunk, indicators)
@@ -103,6 +108,103 @@ class Neighbourhood:
         return False
 
 
+class _SphereIndex:
+    """
+    Spheres sorted by the flat index of their grid cell, with the offset of the first
+    sphere of each grid cell.
+    """
+
+    def __init__(self, positions, radii, order, starts):
+        self.positions = positions
+        self.radii = radii
+        self.order = order
+        self.starts = starts
+
+
+class _PackingGrid:
+    """
+    Uniform spatial hash grid, with a cell size of the largest diameter, that finds the
+    overlapping spheres of batches of candidate spheres in the 27 neighbouring cells.
+    """
+
+    # Number of candidates to look up at once, bounds the memory of the neighbour cells.
+    batch_size = 8192
+
+    def __init__(self, origin, extent, max_radius):
+        self.origin = np.asarray(origin, dtype=float)
+        # Overlapping spheres are less than 2 max radii apart, so in neighbouring cells.
+        self.cell_size = 2 * max_radius
+        self.shape = np.maximum(np.ceil(extent / self.cell_size).astype(int), 1)
+        reach = np.arange(-1, 2)
+        self._offsets = np.stack(
+            np.meshgrid(*(reach,) * len(self.shape), indexing="ij"), axis=-1
+        ).reshape(-1, len(self.shape))
+
+    def _cells(self, positions):
+        cells = np.floor((positions - self.origin) / self.cell_size).astype(int)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def index(self, positions, radii):
+        """
+        Sort spheres into the grid.
+
+        :rtype: _SphereIndex
+        """
+        flat = np.ravel_multi_index(self._cells(positions).T, self.shape)
+        starts = np.zeros(np.prod(self.shape) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(flat, minlength=len(starts) - 1), out=starts[1:])
+        return _SphereIndex(positions, radii, np.argsort(flat, kind="stable"), starts)
+
+    def overlaps(self, index, positions, radii):
+        """
+        Find the pairs of overlapping candidate and indexed spheres.
+
+        :param _SphereIndex index: Indexed spheres.
+        :param numpy.ndarray positions: Candidate positions.
+        :param numpy.ndarray radii: Candidate radii.
+        :returns: The candidate and indexed sphere index of each pair.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        pairs = [
+            self._overlaps(index, positions[i : i + self.batch_size], radii, i)
+            for i in range(0, len(positions), self.batch_size)
+        ]
+        if not pairs:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+        return tuple(np.concatenate(p) for p in zip(*pairs, strict=True))
+
+    def _overlaps(self, index, positions, radii, offset):
+        neighbours = self._cells(positions)[:, None, :] + self._offsets
+        valid = np.all((neighbours >= 0) & (neighbours < self.shape), axis=2)
+        candidates, stencil = np.nonzero(valid)
+        flat = np.ravel_multi_index(neighbours[candidates, stencil].T, self.shape)
+        starts = index.starts[flat]
+        counts = index.starts[flat + 1] - starts
+        # Expand each candidate into a pair with each sphere of its neighbour cells.
+        candidates = np.repeat(candidates, counts)
+        within = np.arange(len(candidates)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        spheres = index.order[np.repeat(starts, counts) + within]
+        distance2 = np.sum(
+            (positions[candidates] - index.positions[spheres]) ** 2, axis=1
+        )
+        overlap = distance2 < (radii[candidates + offset] + index.radii[spheres]) ** 2
+        return candidates[overlap] + offset, spheres[overlap]
+
+
+def _first_of_groups(groups, limits):
+    """
+    Mask that keeps the first ``limits[g]`` elements of each group ``g``.
+    """
+    order = np.argsort(groups, kind="stable")
+    ordered = groups[order]
+    rank = np.arange(len(groups)) - np.searchsorted(ordered, ordered)
+    mask = np.empty(len(groups), dtype=bool)
+    mask[order] = rank < limits[ordered]
+    return mask
+
+
 class ParticleVoxel:
     def __init__(self, origin, dimensions):
         self.origin = np.array(origin)
@@ -110,12 +212,23 @@ class ParticleVoxel:
 
 
 class VolumeFiller:
-    def __init__(self, track_displaced=False, scaffold=None, strat=None):
+    # Consecutive rounds of candidates without any fit before the grid engine gives up.
+    max_stalled_rounds = 50
+    # Minimum number of candidates that the grid engine generates per voxel and round.
+    min_candidates = 32
+    # Lower bound of the estimated fraction of candidates that fit, limits round sizes.
+    min_fit_rate = 1e-3
+
+    def __init__(
+        self, track_displaced=False, scaffold=None, strat=None, engine="uniform"
+    ):
         self.particle_types = []
         self.voxels = []
+        self.particles = []
         self.track_displaced = track_displaced
         self.scaffold = scaffold
         self.strat = strat
+        self.engine = engine
 
     def fill(self, voxels, particles, check_pack=True):
         """
@@ -131,7 +244,7 @@ class VolumeFiller:
         :param bool check_pack: If True, will check the packing factor before placing
             particles in the voxels.
         :raise PackingError: If check_pack is True and the resulting packing factor is
-            greater than 0.4.
+            greater than 0.4, or if the ``grid`` engine can't fit all the particles.
         """
         # Amount of spatial dimensions
         self.dimensions = voxels.get_raw(copy=False).shape[1]
@@ -177,6 +290,9 @@ class VolumeFiller:
                 )
         # Reset particles
         self.particles = []
+        if self.engine == "grid":
+            self._pack()
+            return
         for particle_type in self.particle_types:
             count = particle_type["count"]
             if count.size == 1:
@@ -217,8 +333,100 @@ class VolumeFiller:
             # Store the particle object
             self.add_particle(radius, particle_position, type=particle_type)
 
+    def _pack(self):
+        origins = np.array([v.origin for v in self.voxels], dtype=float)
+        sizes = np.array([v.size for v in self.voxels], dtype=float)
+        origin = origins.min(axis=0)
+        grid = _PackingGrid(
+            origin, (origins + sizes).max(axis=0) - origin, self.max_radius
+        )
+        positions = np.empty((0, self.dimensions))
+        radii = np.empty(0)
+        packed = grid.index(positions, radii)
+        # Pack the largest particles first, while there is most room for them.
+        for particle_type in sorted(self.particle_types, key=lambda pt: -pt["radius"]):
+            count = np.asarray(particle_type["count"], dtype=int).reshape(-1)
+            if count.size != 1 and count.size != len(self.voxels):
+                raise Exception(
+                    f"Particle system voxel mismatch. "
+                    f"Given {count.size} expected {len(self.voxels)}"
+                )
+            radius = particle_type["radius"]
+            # A global count is spread over random voxels each round, a per voxel count
+            # is grouped per voxel.
+            remaining = count.copy()
+            placed = []
+            stalled = 0
+            # Fraction of the candidates that fit, to generate enough candidates to fit
+            # the remaining particles in about a round.
+            fit_rate = 1.0
+            while remaining.sum() and stalled < self.max_stalled_rounds:
+                tries = np.where(
+                    remaining > 0,
+                    np.maximum(
+                        np.ceil(remaining * 1.5 / fit_rate).astype(int),
+                        self.min_candidates,
+                    ),
+                    0,
+                )
+                if count.size == 1:
+                    groups = np.zeros(tries[0], dtype=int)
+                    voxel_ids = np.random.randint(len(self.voxels), size=tries[0])
+                else:
+                    groups = voxel_ids = np.repeat(np.arange(len(self.voxels)), tries)
+                candidates = origins[voxel_ids] + (
+                    np.random.rand(len(voxel_ids), self.dimensions) * sizes[voxel_ids]
+                )
+                candidate_radii = np.full(len(candidates), radius)
+                # Reject the candidates that overlap packed particles, then the later
+                # candidates of any overlapping pair of candidates.
+                fits = np.ones(len(candidates), dtype=bool)
+                fits[grid.overlaps(packed, candidates, candidate_radii)[0]] = False
+                candidates, candidate_radii, groups = (
+                    candidates[fits],
+                    candidate_radii[fits],
+                    groups[fits],
+                )
+                first, second = grid.overlaps(
+                    grid.index(candidates, candidate_radii), candidates, candidate_radii
+                )
+                fits = np.ones(len(candidates), dtype=bool)
+                fits[first[second < first]] = False
+                fit_rate = max(np.count_nonzero(fits) / len(voxel_ids), self.min_fit_rate)
+                fits &= _first_of_groups(groups, remaining)
+                accepted = candidates[fits]
+                remaining -= np.bincount(groups[fits], minlength=len(remaining))
+                stalled = 0 if len(accepted) else stalled + 1
+                placed.append(accepted)
+                positions = np.concatenate((positions, accepted))
+                radii = np.concatenate((radii, candidate_radii[fits]))
+                packed = grid.index(positions, radii)
+            particle_type["placed"] = particle_type.get("placed", 0) + count.sum()
+            if remaining.sum():
+                raise PackingError(
+                    f"Could only pack {count.sum() - remaining.sum()} out of"
+                    f" {count.sum()} '{particle_type['name']}' particles."
+                )
+            particle_type["positions"] = np.concatenate(
+                (np.empty((0, self.dimensions)), *placed)
+            )
+
+    def get_positions(self, particle_type):
+        """
+        Return the positions of the particles of a type.
+
+        :param dict particle_type: One of the particle types of the system.
+        :rtype: numpy.ndarray
+        """
+        if "positions" in particle_type:
+            return particle_type["positions"]
+        positions = [p.position for p in self.particles if p.type is particle_type]
+        return np.array(positions, dtype=float).reshape(-1, self.dimensions)
+
     @property
     def positions(self):
+        if self.engine == "grid":
+            return np.concatenate([self.get_positions(pt) for pt in self.particle_types])
         x = np.array([p.position for p in self.particles])
         return x
 
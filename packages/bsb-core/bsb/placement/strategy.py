@@ -12,7 +12,7 @@ from ..exceptions import DistributorError, EmptySelectionError
 from ..mixins import HasDependencies
 from ..reporting import warn
 from ..services import pool_cache
-from ..storage._chunks import Chunk
+from ..storage._chunks import Chunk, ChunkIndex
 from ..voxels import VoxelSet
 from .distributor import DistributorsNode
 from .indicator import PlacementIndications, PlacementIndicator
@@ -168,10 +168,22 @@ class FixedPositions(PlacementStrategy):
         if not len(self.positions):
             warn(f"No positions given to {self.get_node_name()}.")
             return
-        for indicator in indicators.values():
+        index = self.get_chunk_index()
+        if np.array_equal(index.chunk_size, chunk.dimensions):
+            inside_chunk = index.rows_of(chunk)
+        else:
             inside_chunk = VoxelSet([chunk], chunk.dimensions).inside(self.positions)
+        for indicator in indicators.values():
             self.place_cells(indicator, self.positions[inside_chunk], chunk)
 
+    @pool_cache
+    def get_chunk_index(self):
+        """
+        Bucket the positions per chunk once, so that each placement job slices out the
+        positions of its own chunk.
+        """
+        return ChunkIndex(self.positions, self.scaffold.network.chunk_size)
+
     def guess_cell_count(self):
         if self.positions is None:
             raise ValueError(f"Please set `.positions` on '{self.name}'.")
@@ -186,8 +198,8 @@ class FixedPositions(PlacementStrategy):
                 *(pool.get_submissions_of(strat) for strat in self.get_deps())
             )
         )
-        for chunk in VoxelSet.fill(self.positions, chunk_size):
-            pool.queue_placement(self, Chunk(chunk, chunk_size), deps=deps)
+        for chunk in ChunkIndex(self.positions, chunk_size).chunks:
+            pool.queue_placement(self, chunk, deps=deps)
 
 
 @config.node
@@ -20,15 +20,31 @@ if typing.TYPE_CHECKING:  # pragma: nocover
     from .cell_types import CellType
 
 
+def _run_after_placement(scaffold, name):
+    return scaffold.after_placement[name].postprocess()
+
+
+def _run_after_connectivity(scaffold, name):
+    return scaffold.after_connectivity[name].postprocess()
+
+
 @config.dynamic(attr_name="strategy")
 class AfterPlacementHook(abc.ABC):
     name: str = config.attr(key=True)
 
     def queue(self, pool):
-        def static_function(scaffold, name):
-            return scaffold.after_placement[name].postprocess()
+        pool.queue(_run_after_placement, (self.name,), submitter=self)
+
+    def get_cell_types(self):
+        """
+        Return the cell types whose placement this hook processes, so that it only has
+        to wait for their placement. Hooks without ``cell_types`` wait for all of the
+        placement.
 
-        pool.queue(static_function, (self.name,), submitter=self)
+        :rtype: set[bsb.cell_types.CellType] | None
+        """
+        cell_types = getattr(self, "cell_types", None)
+        return set(cell_types) if cell_types else None
 
     @abc.abstractmethod
     def postprocess(self):  # pragma: nocover
@@ -40,10 +56,7 @@ class AfterConnectivityHook(abc.ABC):
     name: str = config.attr(key=True)
 
     def queue(self, pool):
-        def static_function(scaffold, name):
-            return scaffold.after_connectivity[name].postprocess()
-
-        pool.queue(static_function, (self.name,), submitter=self)
+        pool.queue(_run_after_connectivity, (self.name,), submitter=self)
 
     @abc.abstractmethod
     def postprocess(self):  # pragma: nocover
@@ -27,6 +27,40 @@ class Listener(abc.ABC):
         pass
 
 
+class PhaseTimer(Listener):
+    """
+    Measures the time from the first queued to the last finished job of each phase of a
+    pool that runs several workflow phases at once.
+
+    :param phase_of: Function that returns the phase of a job, or ``None`` to ignore it.
+    """
+
+    def __init__(self, phase_of):
+        self._phase_of = phase_of
+        self._start = {}
+        self._end = {}
+
+    def __call__(self, progress: PoolProgress):
+        if progress.reason != PoolProgressReason.JOB_STATUS_CHANGE:
+            return
+        progress = cast(PoolJobUpdateProgress, progress)
+        phase = self._phase_of(progress.job)
+        if phase is None or progress.status == JobStatus.PENDING:
+            return
+        self._start.setdefault(phase, progress.time)
+        if progress.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+            self._end[phase] = progress.time
+
+    @property
+    def durations(self):
+        """
+        Time in seconds that each phase had jobs on the queue.
+
+        :rtype: dict[str, float]
+        """
+        return {phase: self._end[phase] - self._start[phase] for phase in self._end}
+
+
 class NonTTYTerminalListener(Listener):
     def __call__(self, progress: PoolProgress):
         if progress.reason == PoolProgressReason.JOB_STATUS_CHANGE:
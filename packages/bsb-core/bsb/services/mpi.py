@@ -2,6 +2,8 @@ import contextlib
 import functools
 import os
 
+import numpy as np
+
 from ..exceptions import DependencyError
 from ._util import MockModule
 
@@ -56,6 +58,30 @@ class MPIService:
             return self._comm.allgather(obj)
         return [obj]
 
+    def alltoallv(self, arrays):
+        """
+        Send an array to each rank, and receive the arrays that each rank sent to this
+        one.
+
+        :param arrays: One array per rank, all with the same dtype and the same shape
+          beyond their first axis.
+        :type arrays: list[numpy.ndarray]
+        :returns: The received arrays, concatenated in the order of the sending ranks.
+        :rtype: numpy.ndarray
+        """
+        send = np.concatenate(arrays)
+        if not self._comm or self.get_size() == 1:
+            return send
+        row = int(np.prod(send.shape[1:]))
+        send_counts = np.array([len(array) * row for array in arrays], dtype=np.int64)
+        recv_counts = np.empty_like(send_counts)
+        self._comm.Alltoall(send_counts, recv_counts)
+        recv = np.empty(
+            (int(np.sum(recv_counts)) // max(row, 1), *send.shape[1:]), dtype=send.dtype
+        )
+        self._comm.Alltoallv([send, send_counts.tolist()], [recv, recv_counts.tolist()])
+        return recv
+
     def window(self, buffer):
         if self._comm and self.get_size() > 1:
             from mpi4py.MPI import INFO_NULL, Win
@@ -55,6 +55,27 @@ class MockedWindowController:
             return fence
 
 
+class ProcessLockController(MockedWindowController):
+    """
+    Lock controller shared by the processes of a local job pool. Every read and write
+    acquires the same reentrant process lock, so that a single process accesses the
+    storage at a time.
+    """
+
+    def __init__(self, lock, comm=None, master=0):
+        super().__init__(comm, master)
+        self._process_lock = lock
+
+    def read(self):
+        return _ProcessLock(self._process_lock)
+
+    def write(self):
+        return _ProcessLock(self._process_lock)
+
+    def single_write(self, handle=None, rank=None):
+        return _ProcessLock(self._process_lock, handle=handle, fence=Fence(True))
+
+
 class _NoopLock:
     def __init__(self, handle=None, fence=None):
         self._locked = 0
@@ -79,6 +100,20 @@ class _NoopLock:
         self._locked -= 1
 
 
+class _ProcessLock(_NoopLock):
+    def __init__(self, lock, handle=None, fence=None):
+        super().__init__(handle=handle, fence=fence)
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire()
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        self._lock.release()
+
+
 class Fence:
     def __init__(self, access):
         self._access = access
@@ -31,6 +31,14 @@ scaffold:
         indicators = placement.get_indicators()
         return f(placement, *args[1:], indicators, **kwargs)
 
+Without MPI, a pool created with ``workers > 1`` runs its jobs on a local
+:class:`concurrent.futures.ProcessPoolExecutor` instead. The worker processes are forked
+from the main process when the pool is opened, before any scheduler threads are started,
+so they inherit the scaffold just like MPI workers each hold their own copy of it. The
+storage engine's lock is replaced by a process lock while the pool is open, so that a
+single process accesses the storage at a time, and the arguments and results of the jobs
+must be picklable.
+
 A job has a couple of display variables that can be set: ``_cname`` for the
 class name, ``_name`` for the job name and ``_c`` for the chunk. These are used
 to display what the workers are doing during parallel execution. This is an experimental
@@ -38,12 +46,15 @@ API and subject to sudden change in the future.
 """
 
 import abc
+import collections
 import concurrent.futures
 import contextlib
 import contextvars
 import functools
 import logging
+import multiprocessing
 import pickle
+import queue
 import tempfile
 import threading
 import time
@@ -64,6 +75,7 @@ from ..exceptions import (
     JobSchedulingError,
 )
 from ._util import ErrorModule, MockModule
+from .mpilock import ProcessLockController
 
 if typing.TYPE_CHECKING:  # pragma: nocover
     from mpipool import MPIExecutor
@@ -96,6 +108,16 @@ class JobStatus(Enum):
     ABORTED = "aborted"
 
 
+# Statuses of the jobs that have yet to be put on, or are still on the queue.
+_WAITING_STATUSES = (JobStatus.PENDING, JobStatus.QUEUED)
+# Statuses of the jobs that may still need their cache items.
+_CACHING_STATUSES = (JobStatus.PENDING, JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+# Result file of the jobs that returned `None`, which are not written to disk.
+_NONE_RESULT = object()
+
+
 class PoolStatus(Enum):
     # Pool has been initialized and jobs can be scheduled.
     SCHEDULING = "scheduling"
@@ -178,6 +200,8 @@ class PoolJobUpdateProgress(PoolProgress):
         super().__init__(pool, PoolProgressReason.JOB_STATUS_CHANGE)
         self._job = job
         self._old_status = old_status
+        # Listeners are notified later, from the main loop.
+        self._time = time.perf_counter()
 
     @property
     def job(self):
@@ -187,6 +211,13 @@ class PoolJobUpdateProgress(PoolProgress):
     def old_status(self):
         return self._old_status
 
+    @property
+    def time(self):
+        """
+        Performance counter time at which the job changed status.
+        """
+        return self._time
+
     @property
     def status(self):
         return self._job.status
@@ -218,6 +249,20 @@ class _MPIPoolModule(MockModule):
 _MPIPool = _MPIPoolModule("mpipool")
 
 
+class _ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+    """
+    Local process pool that offers the part of the ``MPIExecutor`` interface that the
+    :class:`.JobPool` uses.
+    """
+
+    @property
+    def open(self):
+        return not self._shutdown_thread
+
+    def is_worker(self):
+        return False
+
+
 def dispatcher(pool_id, job_args):
     """
     The dispatcher is the function that gets pickled on main, and unpacked "here" on the
@@ -320,6 +365,8 @@ class Job(abc.ABC):
         self._res_file = None
         self._error = None
         self._cache_items: list[int] = [] if cache_items is None else cache_items
+        # Whether the pool tracks this job in its indexed scheduler state.
+        self._indexed = False
 
         # Snapshot `self._deps`: registering against an already-completed dep
         # makes `on_completion` fire `_dep_completed` inline, which discards
@@ -357,6 +404,8 @@ class Job(abc.ABC):
 
     @property
     def result(self):
+        if self._res_file is _NONE_RESULT:
+            return None
         try:
             with open(self._res_file, "rb") as f:
                 return pickle.load(f)
@@ -430,6 +479,11 @@ class Job(abc.ABC):
         cb(self)
 
     def set_result(self, value):
+        if value is None:
+            # Most jobs write to the storage and return nothing, spare them the file.
+            self._res_file = _NONE_RESULT
+            self.change_status(JobStatus.SUCCESS)
+            return
         dirname = JobPool.get_tmp_folder(self.pool_id)
         try:
             with tempfile.NamedTemporaryFile(
@@ -490,12 +544,12 @@ class Job(abc.ABC):
             # registered) `self._pool` isn't set yet. Skip enqueuing here: the
             # `_put` -> `_enqueue` call that immediately follows construction
             # sees the now-empty `self._deps` and submits us.
-            if (
-                not self._deps
-                and self._comm.get_size() > 1
-                and getattr(self, "_pool", None) is not None
-            ):
-                self._enqueue(self._pool)
+            #
+            # The pool submits us from its ready queue, so that completion handling only
+            # costs as many steps as the completed job has dependents.
+            pool = getattr(self, "_pool", None)
+            if not self._deps and pool is not None and pool._executor is not None:
+                pool._ready.append(self)
 
     def _enqueue(self, pool):
         if not self._deps and self._status is JobStatus.PENDING:
@@ -503,7 +557,7 @@ class Job(abc.ABC):
             # The dispatcher is run on the remote worker and unpacks the data required
             # to execute the job contents.
             self.change_status(JobStatus.QUEUED)
-            self._future = pool._submit(dispatcher, self.pool_id, self.serialize())
+            pool._submit(self, dispatcher, self.pool_id, self.serialize())
         else:
             # We have unfinished dependencies and should wait until we can enqueue
             # ourselves when our dependencies haved all notified us of their completion.
@@ -533,6 +587,7 @@ class Job(abc.ABC):
         except KeyError:
             pass
         else:
+            pool._index_status(self, old_status)
             progress = PoolJobUpdateProgress(pool, self, old_status)
             pool.add_notification(progress)
 
@@ -607,15 +662,36 @@ class JobPool:
     _pool_owners = {}
     _tmp_folders = {}
 
-    def __init__(self, id, scaffold, fail_fast=False, workflow: "Workflow" = None):
+    def __init__(
+        self,
+        id,
+        scaffold,
+        fail_fast=False,
+        workflow: "Workflow" = None,
+        workers: int | None = None,
+    ):
         self._schedulers: list[concurrent.futures.Future] = []
         self.id: int = id
         self._scaffold = scaffold
         self._comm = scaffold._comm
         self._unhandled_errors = []
-        self._running_futures: list[concurrent.futures.Future] = []
-        self._mpipool: MPIExecutor | None = None
+        self._done_futures: queue.SimpleQueue[concurrent.futures.Future] = (
+            queue.SimpleQueue()
+        )
+        self._executor: MPIExecutor | _ProcessPoolExecutor | None = None
         self._job_queue: list[Job] = []
+        # Indexed scheduler state, so that the main loop never has to scan the queue:
+        # the done futures, the jobs of each submitter, the job of each submitted
+        # future, the jobs whose dependencies have completed, the number of jobs still
+        # waiting to run, and the number of unfinished jobs that require each cache
+        # item.
+        self._submissions: dict[int, list[Job]] = collections.defaultdict(list)
+        self._future_jobs: dict[concurrent.futures.Future, Job] = {}
+        self._ready: collections.deque[Job] = collections.deque()
+        self._waiting = 0
+        self._cache_refs: collections.Counter[int] = collections.Counter()
+        self._cache_changed = False
+        self._index_lock = threading.Lock()
         self._listeners = []
         self._max_wait = 60
         self._status: PoolStatus = None
@@ -623,8 +699,13 @@ class JobPool:
         self._workers_raise_unhandled = False
         self._fail_fast = fail_fast
         self._workflow = workflow
+        self._workers = workers or 1
         self._cache_buffer = np.zeros(1000, dtype=np.uint64)
         self._cache_window = self._comm.window(self._cache_buffer)
+        self._shared_cache = None
+        self._processes: _ProcessPoolExecutor | None = None
+        self._job_waiters: set[threading.Event] = set()
+        self._closed = False
 
     def __enter__(self):
         self._context = ExitStack()
@@ -639,13 +720,31 @@ class JobPool:
             # Pass if listener is not a context manager
             with contextlib.suppress(TypeError, AttributeError):
                 self._context.enter_context(listener)
+        if not self.parallel and self._workers > 1:
+            if "fork" in multiprocessing.get_all_start_methods():
+                self._start_processes()
+            else:
+                warnings.warn(
+                    "Local worker processes require the 'fork' start method,"
+                    " executing the jobs serially.",
+                    stacklevel=2,
+                )
         self.change_status(PoolStatus.SCHEDULING)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._context.__exit__(exc_type, exc_val, exc_tb)
+        # Release any schedulers still awaiting jobs that will never complete.
+        with self._index_lock:
+            self._closed = True
+            waiters = [*self._job_waiters]
+        for waiter in waiters:
+            waiter.set()
         # Clean up pool/job references
         self._job_queue = []
+        self._submissions.clear()
+        self._future_jobs.clear()
+        self._ready.clear()
         del JobPool._pools[self.id]
         del JobPool._pool_owners[self.id]
         del JobPool._tmp_folders[self.id]
@@ -671,6 +770,13 @@ class JobPool:
     def parallel(self):
         return self._comm.get_size() > 1
 
+    @property
+    def workers(self):
+        """
+        Number of local worker processes used when the pool is not parallel.
+        """
+        return self._workers
+
     @classmethod
     def get_owner(cls, id):
         return cls._pool_owners[id]
@@ -687,28 +793,36 @@ class JobPool:
         return self._comm.get_rank() == 0
 
     def get_submissions_of(self, submitter):
-        return [job for job in self._job_queue if job.submitter is submitter]
+        return [*self._submissions.get(id(submitter), ())]
 
     def _put(self, job):
         """
         Puts a job onto our internal queue.
         """
-        if self._mpipool and not self._mpipool.open:
+        if self._executor and not self._executor.open:
             raise JobPoolError("No job pool available for job submission.")
         else:
             self.add_notification(PoolJobAddedProgress(self, job))
             self._job_queue.append(job)
-            if self._mpipool:
-                # This job was scheduled after the MPIPool was opened, so immediately
-                # put it on the MPIPool's queue.
+            # The submitter is kept alive by the job, so its id can't be reused.
+            self._submissions[id(job.submitter)].append(job)
+            job._indexed = True
+            self._index_status(job, None)
+            if self._executor:
+                # This job was scheduled after the executor was opened, so immediately
+                # put it on the executor's queue.
                 job._enqueue(self)
 
-    def _submit(self, fn, *args, **kwargs):
-        if not self._mpipool or not self._mpipool.open:
+    def _submit(self, job, fn, *args, **kwargs):
+        if not self._executor or not self._executor.open:
             raise JobPoolError("No job pool available for job submission.")
         else:
-            future = self._mpipool.submit(fn, *args, **kwargs)
-            self._running_futures.append(future)
+            future = self._executor.submit(fn, *args, **kwargs)
+            # The job must be findable by its future before the future can report itself
+            # as done, or a job that finishes right away would never be completed.
+            job._future = future
+            self._future_jobs[future] = job
+            future.add_done_callback(self._done_futures.put)
             return future
 
     def _schedule(self, future: concurrent.futures.Future, nodes, scheduler):
@@ -752,6 +866,43 @@ class JobPool:
             target=ctx.run, args=(self._schedule, future, nodes, scheduler)
         )
         thread.start()
+        return future
+
+    def await_jobs(self, jobs):
+        """
+        Block until the given jobs have completed. Meant for schedulers that can only
+        queue their jobs once other jobs of the same pool have completed, which requires
+        the jobs to be executed in parallel with the schedulers.
+
+        :raises JobPoolError: if the pool closed before the jobs completed.
+        """
+        jobs = [*jobs]
+        if not jobs:
+            return
+        remaining = len(jobs)
+        lock = threading.Lock()
+        completed = threading.Event()
+
+        def countdown(_):
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if not remaining:
+                    completed.set()
+
+        with self._index_lock:
+            if self._closed:
+                raise JobPoolError("The job pool closed before the jobs completed.")
+            self._job_waiters.add(completed)
+        try:
+            for job in jobs:
+                job.on_completion(countdown)
+            completed.wait()
+        finally:
+            with self._index_lock:
+                self._job_waiters.discard(completed)
+        if remaining:
+            raise JobPoolError("The job pool closed before the jobs completed.")
 
     @property
     def scheduling(self):
@@ -778,7 +929,9 @@ class JobPool:
 
         In serial execution this runs all the jobs in the queue in First In First Out
         order. In parallel execution this enqueues all jobs into the MPIPool unless they
-        have dependencies that need to complete first.
+        have dependencies that need to complete first. Without MPI, but with more than
+        one :attr:`workers`, the jobs are enqueued in the same way into a local process
+        pool.
         """
 
         if self.id is None:
@@ -786,6 +939,8 @@ class JobPool:
 
         if self.parallel:
             self._execute_parallel()
+        elif self._processes is not None:
+            self._execute_processes()
         else:
             self._execute_serial()
 
@@ -803,11 +958,11 @@ class JobPool:
         if bsb.options.debug_pool:
             _MPIPool.enable_serde_logging()
         # Create the MPI pool
-        self._mpipool = _MPIPool.MPIExecutor(
+        self._executor = _MPIPool.MPIExecutor(
             loglevel=logging.DEBUG if bsb.options.debug_pool else logging.CRITICAL
         )
 
-        if self._mpipool.is_worker():
+        if self._executor.is_worker():
             # The workers will return out of the pool constructor when they receive
             # the shutdown signal from the master, they return here skipping the
             # master logic.
@@ -826,66 +981,7 @@ class JobPool:
             return
 
         try:
-            # Tell the listeners execution is running
-            self.change_status(PoolStatus.EXECUTING)
-            # Kickstart the workers with the queued jobs
-            for job in self._job_queue:
-                job._enqueue(self)
-            # Add the scheduling futures to the running futures, to await them.
-            self._running_futures.extend(self._schedulers)
-            # Start tracking cached items
-            self._update_cache_window()
-
-            # Keep executing as long as any of the schedulers or jobs aren't done yet.
-            while self.scheduling or any(
-                job.status == JobStatus.PENDING or job.status == JobStatus.QUEUED
-                for job in self._job_queue
-            ):
-                # `concurrent.futures.wait([], timeout=X)` returns immediately
-                # with empty sets: the timeout does not apply when there are no
-                # futures to await. When nothing is running yet (jobs still
-                # waiting on deps, or schedulers still producing) sleep briefly
-                # instead of busy-spinning on `wait([])`. Either way we fall
-                # through to `ping()`/`notify()` below, so cancellations and
-                # unhandled errors are still processed every iteration (skipping
-                # `notify()` here would hang the error/cancellation paths).
-                done = set()
-                if self._running_futures:
-                    try:
-                        done, not_done = concurrent.futures.wait(
-                            self._running_futures,
-                            timeout=self._max_wait,
-                            return_when="FIRST_COMPLETED",
-                        )
-                    except ValueError:
-                        # Sometimes a ValueError is raised here, perhaps because we
-                        # modify the list below?
-                        continue
-
-                    # Complete any jobs that are done
-                    for job in self._job_queue:
-                        if job._future in done:
-                            job._completed()
-
-                    # If a job finished, update the required cache items
-                    if len(done):
-                        self._update_cache_window()
-
-                    # Remove running futures that are done
-                    for future in done:
-                        self._running_futures.remove(future)
-                else:
-                    time.sleep(self._max_wait if self._max_wait else 0.1)
-                # If nothing finished, post a timeout notification.
-                if not len(done):
-                    self.ping()
-                # Notify all the listeners, and store/raise any unhandled errors
-                self.notify()
-
-            # Notify listeners that execution is over
-            self.change_status(PoolStatus.CLOSING)
-            # Raise any unhandled errors
-            self.raise_unhandled()
+            self._execute_on_main()
         except:
             # If any exception (including SystemExit and KeyboardInterrupt) happen on main
             # we should broadcast the abort to all worker nodes.
@@ -893,10 +989,97 @@ class JobPool:
             raise
         finally:
             # Shut down our internal pool
-            self._mpipool.shutdown(wait=False, cancel_futures=True)
+            self._executor.shutdown(wait=False, cancel_futures=True)
             # Broadcast whether the worker nodes should raise an unhandled error.
             self._comm.bcast(self._workers_raise_unhandled)
 
+    def _start_processes(self):
+        context = multiprocessing.get_context("fork")
+        # Share the required cache items with the workers, like the MPI cache window.
+        self._shared_cache = context.Array("Q", len(self._cache_buffer))
+        # Let a single process at a time access the storage.
+        engine = self.owner.storage._engine
+        engine_lock = engine.lock
+        engine.set_lock(ProcessLockController(context.RLock()))
+        self._processes = _ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=context
+        )
+        self._context.callback(self._stop_processes, engine, engine_lock)
+        # Fork the workers right away: once scheduler threads run, forking is unsafe.
+        self._processes.submit(int).result()
+
+    def _stop_processes(self, engine, engine_lock):
+        # Wait for running jobs, so that none of them still write to the storage
+        # once the pool is closed.
+        self._processes.shutdown(wait=True, cancel_futures=True)
+        engine.set_lock(engine_lock)
+
+    def _execute_processes(self):
+        self._executor = self._processes
+        try:
+            self._execute_on_main()
+        finally:
+            self._processes.shutdown(wait=True, cancel_futures=True)
+
+    def _execute_on_main(self):
+        # Tell the listeners execution is running
+        self.change_status(PoolStatus.EXECUTING)
+        # Kickstart the workers with the queued jobs
+        for job in self._job_queue:
+            job._enqueue(self)
+        # Await the scheduling futures as well.
+        for future in self._schedulers:
+            future.add_done_callback(self._done_futures.put)
+        # Start tracking cached items
+        self._cache_changed = True
+        self._update_cache_window()
+
+        # Keep executing as long as any of the schedulers or jobs aren't done yet.
+        while self.scheduling or self._waiting:
+            # Futures report themselves on the done queue when they finish, so that
+            # awaiting them doesn't cost a step per running future, as
+            # `concurrent.futures.wait` does. Either way we fall through to
+            # `ping()`/`notify()` below, so cancellations and unhandled errors are
+            # still processed every iteration (skipping `notify()` here would hang
+            # the error/cancellation paths).
+            done = self._collect_done_futures()
+
+            # Complete any jobs that are done
+            for future in done:
+                job = self._future_jobs.pop(future, None)
+                if job is not None:
+                    job._completed()
+
+            # If a job finished, update the required cache items
+            if len(done):
+                self._update_cache_window()
+            # Submit the jobs whose dependencies have all completed.
+            while self._ready:
+                self._ready.popleft()._enqueue(self)
+            # If nothing finished, post a timeout notification.
+            if not len(done):
+                self.ping()
+            # Notify all the listeners, and store/raise any unhandled errors
+            self.notify()
+
+        # Notify listeners that execution is over
+        self.change_status(PoolStatus.CLOSING)
+        # Raise any unhandled errors
+        self.raise_unhandled()
+
+    def _collect_done_futures(self):
+        """
+        Wait for the next done future, and collect any other futures that are done.
+        """
+        try:
+            done = [self._done_futures.get(timeout=self._max_wait or 0.1)]
+        except queue.Empty:
+            return []
+        with contextlib.suppress(queue.Empty):
+            while True:
+                done.append(self._done_futures.get_nowait())
+        return done
+
     def _execute_serial(self):
         # Wait for jobs to finish scheduling
         while concurrent.futures.wait(
@@ -982,15 +1165,33 @@ class JobPool:
         :return: set of cache function name
         :rtype: set[int]
         """
-        items = set()
-        for job in self._job_queue:
-            if (
-                job.status == JobStatus.QUEUED
-                or job.status == JobStatus.PENDING
-                or job.status == JobStatus.RUNNING
-            ):
-                items.update(job._cache_items)
-        return items
+        with self._index_lock:
+            return set(self._cache_refs)
+
+    def _index_status(self, job, old_status):
+        """
+        Update the waiting job count and the cache item reference counts for a job that
+        changed from the ``old_status`` to its current status.
+        """
+        if not job._indexed:
+            return
+        status = job.status
+        with self._index_lock:
+            self._waiting += (status in _WAITING_STATUSES) - (
+                old_status in _WAITING_STATUSES
+            )
+            caching = status in _CACHING_STATUSES
+            if caching == (old_status in _CACHING_STATUSES):
+                return
+            for item in job._cache_items:
+                if caching:
+                    self._cache_refs[item] += 1
+                    self._cache_changed |= self._cache_refs[item] == 1
+                else:
+                    self._cache_refs[item] -= 1
+                    if not self._cache_refs[item]:
+                        del self._cache_refs[item]
+                        self._cache_changed = True
 
     def _update_cache_window(self):
         """
@@ -999,6 +1200,9 @@ class JobPool:
 
         Only call on main.
         """
+        if not self._cache_changed:
+            return
+        self._cache_changed = False
         # Create a new cache window buffer
         new_buffer = np.zeros(1000, dtype=int)
         for i, item in enumerate(self.get_required_cache_items()):
@@ -1007,6 +1211,11 @@ class JobPool:
         # If there are actual cache requirement differences, lock the window
         # and transfer the buffer
         if np.any(new_buffer != self._cache_buffer):
+            if self._shared_cache is not None:
+                with self._shared_cache.get_lock():
+                    self._shared_cache[:] = new_buffer.tolist()
+                    self._cache_buffer[:] = new_buffer
+                return
             self._cache_window.Lock(0)
             self._cache_buffer[:] = new_buffer
             self._cache_window.Unlock(0)
@@ -1017,6 +1226,10 @@ class JobPool:
 
         Only call on workers.
         """
+        if self._shared_cache is not None:
+            with self._shared_cache.get_lock():
+                return set(self._shared_cache)
+
         from mpi4py.MPI import UINT64_T
 
         self._cache_window.Lock(0)
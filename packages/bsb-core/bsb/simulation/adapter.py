@@ -65,6 +65,27 @@ class FixedStepProgressController:
         self._status = self._adapter.current_checkpoint
 
 
+class ResultFlushController:
+    """
+    Flushes the results of the simulations every ``step`` milliseconds, so that streamed
+    results are written to disk as the simulation progresses.
+    """
+
+    def __init__(self, results, adapter, step):
+        self._status = 0
+        self._results = results
+        self._adapter = adapter
+        self._step = step
+
+    def get_next_checkpoint(self):
+        return self._status + self._step
+
+    def run_checkpoint(self):
+        self._status = self._adapter.current_checkpoint
+        for result in self._results:
+            result.flush()
+
+
 class SimulationData:
     def __init__(self, simulation: "Simulation", result=None):
         self.chunks = None
@@ -117,6 +138,7 @@ class SimulatorAdapter(abc.ABC):
                 alldata.append(data)
                 for hook in simulation.post_prepare:
                     hook(self, simulation, data)
+            self._stream_results(simulations, alldata)
             if post_prepare:
                 post_prepare(self, simulations, alldata)
             results = self.run(*simulations)
@@ -152,13 +174,13 @@ class SimulatorAdapter(abc.ABC):
                 controller.get_next_checkpoint() for controller in self._controllers
             ]
             # Filter out invalid "regressive" checkpoints,
-            # and default to the end of the simulation
+            # and never step past the end of the simulation
             chkp_noregressive = [
                 checkpoint
                 for checkpoint in checkpoints
                 if checkpoint > self.current_checkpoint
             ]
-            self.current_checkpoint = min(chkp_noregressive, default=self._duration)
+            self.current_checkpoint = min([*chkp_noregressive, self._duration])
             participants = [
                 self._controllers[i]
                 for i, checkpoint in enumerate(checkpoints)
@@ -179,8 +201,33 @@ class SimulatorAdapter(abc.ABC):
         """
         for result in results:
             result.flush()
+            result.close()
         return results
 
+    def _stream_results(self, simulations, alldata):
+        # Open the result streams of the simulations that have one, one file per rank,
+        # and flush them at the shortest of their intervals.
+        streamed = [
+            (simulation, data)
+            for simulation, data in zip(simulations, alldata, strict=True)
+            if simulation.stream is not None
+        ]
+        if not streamed:
+            return
+        for simulation, data in streamed:
+            path = simulation.stream
+            if self.comm.get_size() > 1:
+                root, ext = os.path.splitext(path)
+                path = f"{root}.{self.comm.get_rank()}{ext}"
+            data.result.stream(path)
+        self._controllers.append(
+            ResultFlushController(
+                [data.result for _, data in streamed],
+                self,
+                min(simulation.stream_interval for simulation, _ in streamed),
+            )
+        )
+
     def implement_components(self, simulation):
         simdata = self.simdata[simulation]
         for component in simulation.get_components():
@@ -200,6 +247,7 @@ class SimulatorAdapter(abc.ABC):
 
 __all__ = [
     "FixedStepProgressController",
+    "ResultFlushController",
     "SimulationData",
     "SimulatorAdapter",
 ]
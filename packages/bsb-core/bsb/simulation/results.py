@@ -1,6 +1,10 @@
 import contextlib
+import json
 import traceback
 import typing
+from collections.abc import Sequence
+
+import numpy as np
 
 from ..reporting import warn
 
@@ -17,15 +21,28 @@ class SimulationResult:
             del tree["post_prepare"]
         self.block = Block(name=simulation.name, config=tree)
         self.recorders = []
+        self._stream = None
+        self._file = None
 
     @property
     def spiketrains(self):
+        if self._file is not None:
+            return self._file.spiketrains
         return self.block.segments[0].spiketrains
 
     @property
     def analogsignals(self):
+        if self._file is not None:
+            return self._file.analogsignals
         return self.block.segments[0].analogsignals
 
+    @property
+    def streaming(self):
+        """
+        Whether the results are streamed to a file, rather than kept in memory.
+        """
+        return self._stream is not None or self._file is not None
+
     def add(self, recorder):
         self.recorders.append(recorder)
 
@@ -35,22 +52,57 @@ class SimulationResult:
         self.add(recorder)
         return recorder
 
+    def stream(self, filename, compression="gzip"):
+        """
+        Stream the results to an HDF5 file. From now on, every flush appends the data
+        that the recorders collected since the previous flush to the file, and the
+        data is no longer kept in memory. Recorders should only hand over new data on
+        each flush, and the same signals in the same order.
+
+        :param filename: Path of the HDF5 file to create.
+        :type filename: str
+        :param compression: HDF5 compression filter of the datasets.
+        :type compression: str
+        """
+        self._stream = ResultStream(
+            filename, self.block.name, self.block.annotations, compression
+        )
+
     def flush(self):
         from neo import Segment
 
-        segment = Segment()
-        self.block.segments.append(segment)
-        for recorder in self.recorders:
+        if self._stream is None:
+            segment = Segment()
+            self.block.segments.append(segment)
+        for i, recorder in enumerate(self.recorders):
+            if self._stream is not None:
+                segment = Segment()
             try:
                 recorder.flush(segment)
             except Exception:
                 traceback.print_exc()
                 warn("Recorder errored out!")
+            else:
+                if self._stream is not None:
+                    self._stream.append(i, segment)
+        if self._stream is not None:
+            self._stream.flush()
+
+    def close(self):
+        """
+        Close the stream of the results, if any. The streamed results remain available,
+        and are read from the file when accessed.
+        """
+        if self._stream is not None:
+            self._stream.close()
+            self._file = ResultFile(self._stream.filename)
+            self._stream = None
 
     def write(self, filename, mode):
         from neo import io
 
-        io.NixIO(filename, mode=mode).write(self.block)
+        block = self._file.read_block() if self._file is not None else self.block
+        io.NixIO(filename, mode=mode).write(block)
 
 
 class SimulationRecorder:
@@ -58,4 +110,207 @@ class SimulationRecorder:
         raise NotImplementedError("Recorders need to implement the `flush` function.")
 
 
-__all__ = ["SimulationResult", "SimulationRecorder"]
+class ResultStream:
+    """
+    Appends the spike trains and analog signals of each flush to chunked, compressed
+    HDF5 datasets, so that only the data recorded since the previous flush is held in
+    memory. Each signal is identified by the recorder that produced it, and its
+    position among the signals of that recorder.
+    """
+
+    def __init__(self, filename, name=None, annotations=None, compression="gzip"):
+        import h5py
+
+        self.filename = filename
+        self._compression = compression
+        self._file = h5py.File(filename, "w", track_order=True)
+        self._file.attrs["name"] = name or ""
+        self._file.attrs["annotations"] = _dump_json(annotations or {})
+        self._file.create_group("spiketrains", track_order=True)
+        self._file.create_group("analogsignals", track_order=True)
+        # Groups or datasets, and units, of the signals that were already created.
+        self._open = {}
+
+    def append(self, key, segment: "neo.core.Segment"):
+        """
+        Append the signals that a recorder flushed into a segment.
+
+        :param key: Identifier of the recorder.
+        :param segment: Segment with the new data of the recorder.
+        """
+        for i, spiketrain in enumerate(segment.spiketrains):
+            self._append_spiketrain(f"{key}_{i}", spiketrain)
+        for i, signal in enumerate(segment.analogsignals):
+            self._append_analogsignal(f"{key}_{i}", signal)
+
+    def flush(self):
+        """
+        Write the appended data to disk.
+        """
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def _append_spiketrain(self, name, spiketrain):
+        try:
+            group, units = self._open[("spiketrains", name)]
+        except KeyError:
+            group = self._file["spiketrains"].create_group(name)
+            units = spiketrain.units
+            group.attrs["units"] = units.dimensionality.string
+            group.attrs["t_start"] = float(spiketrain.t_start.rescale(units))
+            self._set_common_attrs(group, spiketrain)
+            self._create_dataset(group, "times", np.empty(0))
+            for key, value in spiketrain.array_annotations.items():
+                self._create_dataset(group.require_group("array_annotations"), key, value)
+            self._open[("spiketrains", name)] = group, units
+        group.attrs["t_stop"] = float(spiketrain.t_stop.rescale(units))
+        self._extend(group["times"], _magnitude(spiketrain, units))
+        for key, value in spiketrain.array_annotations.items():
+            self._extend(group["array_annotations"][key], value)
+
+    def _append_analogsignal(self, name, signal):
+        try:
+            dataset, units = self._open[("analogsignals", name)]
+        except KeyError:
+            group = self._file["analogsignals"].create_group(name)
+            units = signal.units
+            group.attrs["units"] = units.dimensionality.string
+            group.attrs["t_start"] = float(signal.t_start.rescale("ms"))
+            group.attrs["sampling_period"] = float(signal.sampling_period.rescale("ms"))
+            group.attrs["array_annotations"] = _dump_json(signal.array_annotations)
+            self._set_common_attrs(group, signal)
+            dataset = self._create_dataset(
+                group, "signal", np.empty((0, signal.shape[1]))
+            )
+            self._open[("analogsignals", name)] = dataset, units
+        self._extend(dataset, _magnitude(signal, units))
+
+    def _set_common_attrs(self, group, obj):
+        group.attrs["name"] = obj.name or ""
+        group.attrs["annotations"] = _dump_json(obj.annotations)
+
+    def _create_dataset(self, group, name, data):
+        data = np.asarray(data)
+        return group.create_dataset(
+            name,
+            shape=(0, *data.shape[1:]),
+            maxshape=(None, *data.shape[1:]),
+            dtype=data.dtype if data.dtype != object else float,
+            chunks=True,
+            compression=self._compression,
+        )
+
+    def _extend(self, dataset, data):
+        data = np.asarray(data)
+        if not len(data):
+            return
+        start = len(dataset)
+        dataset.resize(start + len(data), axis=0)
+        dataset[start:] = data
+
+
+class ResultFile:
+    """
+    Results that were streamed to an HDF5 file by a :class:`ResultStream`. The neo
+    objects are only read from the file when they are accessed.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    @property
+    def spiketrains(self) -> Sequence["neo.SpikeTrain"]:
+        return _LazySignals(self, "spiketrains", _read_spiketrain)
+
+    @property
+    def analogsignals(self) -> Sequence["neo.AnalogSignal"]:
+        return _LazySignals(self, "analogsignals", _read_analogsignal)
+
+    def read_block(self) -> "neo.Block":
+        """
+        Read all results into a neo block with a single segment.
+        """
+        from neo import Block, Segment
+
+        with self._open() as file:
+            block = Block(
+                name=file.attrs["name"] or None, **json.loads(file.attrs["annotations"])
+            )
+        segment = Segment()
+        segment.spiketrains.extend(self.spiketrains)
+        segment.analogsignals.extend(self.analogsignals)
+        block.segments.append(segment)
+        return block
+
+    def _open(self):
+        import h5py
+
+        return h5py.File(self.filename, "r")
+
+
+class _LazySignals(Sequence):
+    def __init__(self, file, group, reader):
+        self._file = file
+        self._group = group
+        self._reader = reader
+        with file._open() as f:
+            self._names = list(f[group].keys())
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        with self._file._open() as f:
+            return self._reader(f[self._group][self._names[item]])
+
+
+def _read_spiketrain(group):
+    from neo import SpikeTrain
+
+    array_annotations = {
+        key: dataset[()] for key, dataset in group.get("array_annotations", {}).items()
+    }
+    return SpikeTrain(
+        group["times"][()],
+        units=group.attrs["units"],
+        t_start=group.attrs["t_start"],
+        t_stop=group.attrs["t_stop"],
+        name=group.attrs["name"] or None,
+        array_annotations=array_annotations,
+        **json.loads(group.attrs["annotations"]),
+    )
+
+
+def _read_analogsignal(group):
+    from neo import AnalogSignal
+    from quantities import ms
+
+    return AnalogSignal(
+        group["signal"][()],
+        units=group.attrs["units"],
+        t_start=group.attrs["t_start"] * ms,
+        sampling_period=group.attrs["sampling_period"] * ms,
+        name=group.attrs["name"] or None,
+        array_annotations=json.loads(group.attrs["array_annotations"]),
+        **json.loads(group.attrs["annotations"]),
+    )
+
+
+def _magnitude(quantity, units):
+    if quantity.units != units:
+        quantity = quantity.rescale(units)
+    return quantity.magnitude
+
+
+def _dump_json(obj):
+    # Annotations may contain numpy values, store them as their Python equivalents.
+    return json.dumps(
+        obj, default=lambda o: o.tolist() if hasattr(o, "tolist") else str(o)
+    )
+
+
+__all__ = ["ResultFile", "ResultStream", "SimulationResult", "SimulationRecorder"]
@@ -54,6 +54,16 @@ class Simulation:
     """
     Dictionary linking the device name to its model.
     """
+    stream: str = config.attr(type=str)
+    """
+    Path of an HDF5 file to stream the results to while the simulation runs, instead of
+    keeping them in memory until it ends. Each MPI rank writes to its own file, with the
+    rank inserted before the file extension.
+    """
+    stream_interval: float = config.attr(type=float, default=100.0)
+    """
+    Interval in milliseconds at which the recorded data is appended to the stream.
+    """
     post_prepare: cfglist[typing.Callable[[Simulation, typing.Any], None]] = config.list(
         type=cfgtypes.function_()
     )
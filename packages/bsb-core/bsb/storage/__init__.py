@@ -387,6 +387,12 @@ class Storage:
     def clear_connectivity(self):
         self._engine.clear_connectivity()
 
+    def flush(self):
+        """
+        :guilabel:`collective` Let the engine finalize any postponed writes.
+        """
+        self._engine.flush()
+
     def read_only(self):
         return self._engine.read_only()
 
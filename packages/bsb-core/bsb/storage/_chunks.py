@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+import numpy.typing
 
 from ..exceptions import ChunkError
 
@@ -110,6 +111,58 @@ def chunklist(chunks) -> list[Chunk]:
     return sorted(set(c if isinstance(c, Chunk) else Chunk(c, None) for c in chunks))
 
 
+class ChunkIndex:
+    """
+    Index of the rows of a position array per chunk. The positions are bucketed by
+    integer division by the chunk size once, so that the rows of a chunk can be sliced
+    out without filtering all the positions.
+    """
+
+    def __init__(self, positions, chunk_size):
+        self.chunk_size = np.array(chunk_size, dtype=float)
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        coords = np.floor(positions / self.chunk_size).astype(np.int64)
+        ids = _chunk_ids(coords)
+        self._order = np.argsort(ids, kind="stable")
+        self._ids, starts = np.unique(ids[self._order], return_index=True)
+        self._offsets = np.append(starts, len(ids))
+        self._coords = coords[self._order[starts]]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        """
+        Iterate over the chunks and the indices of their rows.
+        """
+        for coords, start, stop in zip(
+            self._coords, self._offsets[:-1], self._offsets[1:], strict=True
+        ):
+            yield Chunk(coords, self.chunk_size), self._order[start:stop]
+
+    @property
+    def chunks(self) -> list[Chunk]:
+        """
+        The chunks that contain any of the positions, sorted by chunk id.
+        """
+        return [Chunk(coords, self.chunk_size) for coords in self._coords]
+
+    def rows_of(self, chunk: Chunk) -> np.ndarray:
+        """
+        Return the indices of the rows inside of the chunk, in their original order.
+        """
+        i = np.searchsorted(self._ids, chunk.id)
+        if i == len(self._ids) or self._ids[i] != chunk.id:
+            return np.empty(0, dtype=np.int64)
+        return self._order[self._offsets[i] : self._offsets[i + 1]]
+
+
+def _chunk_ids(coords):
+    # Vectorized `Chunk.id` of chunk coordinates.
+    coords = coords.astype(np.int16).astype(np.uint16).astype(np.uint64)
+    return np.sum(coords << np.arange(0, 48, 16, dtype=np.uint64), axis=1)
+
+
 def _safe_ids(self, other):
     return (
         np.array(self, copy=False).view(Chunk)._safe_id(),
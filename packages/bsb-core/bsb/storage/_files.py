@@ -6,6 +6,7 @@ import datetime as _dt
 import email.utils as _eml
 import functools as _ft
 import hashlib as _hl
+import json as _json
 import os
 import pathlib as _pl
 import tempfile as _tf
@@ -505,6 +506,12 @@ class NrrdDependencyNode(FilePipelineMixin, FileDependencyNode, classmap_entry="
         type=types.ndarray(),
     )
     """Default orientation vector of each position."""
+    memory_map: bool = config.attr(type=bool, default=True)
+    """
+    Convert the data to a ``.npy`` file in the BSB cache, keyed by the hash of the file
+    content and of the pipeline, and memory map it read-only, instead of decompressing
+    the NRRD file on every load.
+    """
 
     @config.property(type=int)
     def voxel_size(self):
@@ -520,11 +527,51 @@ class NrrdDependencyNode(FilePipelineMixin, FileDependencyNode, classmap_entry="
             return _nrrd.read_header(path)
 
     def get_data(self):
-        with self.file.provide_locally() as (path, encoding):
-            return VoxelData.load_nrrd(path)
+        """
+        Load the data of the NRRD file, without applying the pipeline.
+
+        If :attr:`memory_map` is set, the data is read-only.
+
+        :rtype: voxcell.voxel_data.VoxelData
+        """
+        return self._load(pipe=False)
 
     def load_object(self):
-        return self.pipe(self.get_data())
+        """
+        Load the data of the NRRD file and apply the pipeline to it.
+
+        If :attr:`memory_map` is set, the data is read-only.
+        """
+        return self._load(pipe=True)
+
+    def _load(self, pipe):
+        with self.file.provide_locally() as (path, encoding):
+            if not self.memory_map:
+                return self._read(path, pipe)
+            stat = os.stat(path)
+            key = _nrrd_key(
+                path,
+                stat.st_size,
+                stat.st_mtime_ns,
+                _json.dumps(
+                    [op.__tree__() for op in self.pipeline] if pipe else [],
+                    sort_keys=True,
+                    default=str,
+                ),
+            )
+            cached = _load_nrrd_cache(key)
+            if cached is None:
+                data = self._read(path, pipe)
+                if type(data) is not VoxelData:
+                    # Pipelines may return other objects, which we can't cache.
+                    return data
+                _store_nrrd_cache(key, data)
+                cached = _load_nrrd_cache(key)
+            return cached
+
+    def _read(self, path, pipe):
+        data = VoxelData.load_nrrd(path)
+        return self.pipe(data) if pipe else data
 
     def voxel_of(self, point):
         """
@@ -556,6 +603,60 @@ class NrrdDependencyNode(FilePipelineMixin, FileDependencyNode, classmap_entry="
         )
 
 
+def _nrrd_cache_path():
+    from ._util import _cache_path
+
+    return _cache_path / "nrrd"
+
+
+@_ft.cache
+def _nrrd_key(path, size, mtime_ns, pipeline):
+    # The size and modification time only make sure that the file is hashed again
+    # when it changes within the lifetime of this process.
+    md5 = _hl.new("md5", usedforsecurity=False)
+    with open(path, "rb") as f:
+        while chunk := f.read(2**24):
+            md5.update(chunk)
+    md5.update(pipeline.encode())
+    return md5.hexdigest()
+
+
+def _load_nrrd_cache(key):
+    path = _nrrd_cache_path() / f"{key}.npy"
+    try:
+        with open(path.with_suffix(".json")) as f:
+            meta = _json.load(f)
+        # A plain array view still shares the read-only memory map.
+        raw = np.load(path, mmap_mode="r").view(np.ndarray)
+    except FileNotFoundError:
+        return None
+    return VoxelData(raw, meta["voxel_dimensions"], meta["offset"])
+
+
+def _store_nrrd_cache(key, data):
+    # Each file is written to a temporary file first and then moved into place, so that
+    # processes that convert the same NRRD file at the same time never see a partial
+    # file. The data file is moved last, as its presence marks the entry as complete.
+    root = _nrrd_cache_path()
+    root.mkdir(parents=True, exist_ok=True)
+    meta = {
+        "voxel_dimensions": data.voxel_dimensions.tolist(),
+        "offset": data.offset.tolist(),
+    }
+    for suffix, write in (
+        (".json", lambda f: f.write(_json.dumps(meta).encode())),
+        (".npy", lambda f: np.save(f, data.raw)),
+    ):
+        fd, tmp = _tf.mkstemp(dir=root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, root / f"{key}{suffix}")
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+
 class MorphologyOperationCallable(OperationCallable):
     """
     Hello.
@@ -62,6 +62,7 @@ class Engine(Interface):
     def __init__(self, root, comm):
         self._root = comm.bcast(root, root=0)
         self._comm = comm
+        self._lock = None
         self._readonly = False
 
     def __eq__(self, other):
@@ -91,6 +92,20 @@ class Engine(Interface):
         """
         self._comm = comm
 
+    @property
+    def lock(self):
+        """
+        The lock controller that synchronizes access to the storage.
+        """
+        return self._lock
+
+    def set_lock(self, lock):
+        """
+        Set a new lock controller to synchronize access to the storage, for example with
+        the worker processes of a local :class:`~bsb.services.pool.JobPool`.
+        """
+        self._lock = lock
+
     @property
     def format(self):
         """
@@ -196,6 +211,14 @@ class Engine(Interface):
         """
         pass
 
+    def flush(self):
+        """
+        :guilabel:`collective` Called when a reconstruction phase that wrote data has
+        finished, so that the engine can finalize data it had postponed writing, such as
+        compacting connectivity. The default implementation does nothing.
+        """
+        pass
+
     def read_only(self):
         """
         A context manager that enters the engine into readonly mode.
@@ -727,6 +750,24 @@ class PlacementSet(Interface):
         """
         pass
 
+    def count_in_chunks(self, chunks):
+        """
+        Return how many cells were placed in each of the given chunks.
+
+        :param chunks: Chunks to count the cells of.
+        :type chunks: list[~bsb.storage._chunks.Chunk]
+        :returns: Cell count of each chunk, in the order they were given.
+        :rtype: numpy.ndarray[int]
+        """
+        stats = self.get_chunk_stats()
+        return np.array(
+            [
+                stats.get(str((c if isinstance(c, Chunk) else Chunk(c, None)).id), 0)
+                for c in chunks
+            ],
+            dtype=int,
+        )
+
     def load_boxes(self, morpho_cache=None):
         """
         Load the cells as axis aligned bounding box rhomboids matching the extension,
@@ -837,6 +878,26 @@ class MorphologyRepository(Interface, engine_key="morphologies"):
         """
         pass
 
+    def save_many(self, names, morphologies, overwrite=False):
+        """
+        Store several morphologies. Engines should override this to store them all in
+        a single write operation.
+
+        :param names: Keys to store the morphologies under.
+        :type names: list[str]
+        :param morphologies: Morphologies to store
+        :type morphologies: list[bsb.morphologies.Morphology]
+        :param overwrite: Overwrite any stored morphology that already exists under one
+            of the names
+        :type overwrite: bool
+        :returns: The stored morphologies
+        :rtype: list[~bsb.storage.interfaces.StoredMorphology]
+        """
+        return [
+            self.save(name, morphology, overwrite=overwrite)
+            for name, morphology in zip(names, morphologies, strict=True)
+        ]
+
     @abc.abstractmethod
     def has(self, name):  # pragma: nocover
         """
@@ -1104,6 +1165,123 @@ class ConnectivitySet(Interface):
         """
         return ConnectivityIterator(self, "out")
 
+    def get_adjacency(self, direction="out"):
+        """
+        Get the compressed sparse row index of the cells connected by this set. Rows are
+        the presynaptic cells for the ``out`` direction, and the postsynaptic cells for
+        the ``inc`` direction. Cell ids are global placement set ids.
+
+        The default implementation builds the index in memory on every call, engines
+        can persist it instead.
+
+        :param direction: Either ``out`` or ``inc``.
+        :type direction: str
+        :rtype: AdjacencyIndex
+        """
+        return AdjacencyIndex.build(self, direction)
+
+    def in_degree(self, ids=None):
+        """
+        Return the number of incoming connections of the given postsynaptic cells, or
+        of all of them.
+        """
+        return self.get_adjacency("inc").degree(ids)
+
+    def out_degree(self, ids=None):
+        """
+        Return the number of outgoing connections of the given presynaptic cells, or of
+        all of them.
+        """
+        return self.get_adjacency("out").degree(ids)
+
+    def neighbours(self, ids, direction="out"):
+        """
+        Return the ids of the cells connected to the given cells. See
+        :meth:`.AdjacencyIndex.neighbours`.
+        """
+        return self.get_adjacency(direction).neighbours(ids)
+
+
+class AdjacencyIndex:
+    """
+    Compressed sparse row index of a connectivity set: the neighbours of row cell ``i``
+    are ``indices[indptr[i]:indptr[i + 1]]``, in the order the connections are
+    iterated.
+    """
+
+    def __init__(self, indptr, indices, direction):
+        self.indptr = indptr
+        self.indices = indices
+        self.direction = direction
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @classmethod
+    def build(cls, cs: ConnectivitySet, direction):
+        """
+        Build the index from the global connection locations of a connectivity set, in
+        2 streaming passes: one to count the degree of each cell, and one to fill in
+        the neighbours.
+
+        :param cs: Connectivity set, with its ``pre_type`` and ``post_type`` set.
+        :type cs: ConnectivitySet
+        :param direction: Either ``out`` or ``inc``.
+        :type direction: str
+        """
+        if direction not in ("inc", "out"):
+            raise ValueError(f"Unknown direction '{direction}', choose 'inc' or 'out'.")
+        row_type = cs.pre_type if direction == "out" else cs.post_type
+        itr = ConnectivityIterator(cs, direction, scoped=False)
+
+        def blocks():
+            for _, pre_locs, _, post_locs in itr.chunk_iter():
+                if direction == "out":
+                    yield pre_locs[:, 0], post_locs[:, 0]
+                else:
+                    yield post_locs[:, 0], pre_locs[:, 0]
+
+        degree = np.zeros(len(row_type.get_placement_set()), dtype=int)
+        for rows, _ in blocks():
+            ids, counts = np.unique(rows, return_counts=True)
+            degree[ids] += counts
+        indptr = np.concatenate(([0], np.cumsum(degree)))
+        indices = np.empty(indptr[-1], dtype=int)
+        cursor = indptr[:-1].copy()
+        for rows, cols in blocks():
+            order = np.argsort(rows, kind="stable")
+            rows = rows[order]
+            starts = np.flatnonzero(np.diff(rows, prepend=-1))
+            counts = np.diff(starts, append=len(rows))
+            rank = np.arange(len(rows)) - np.repeat(starts, counts)
+            indices[cursor[rows] + rank] = cols[order]
+            cursor[rows[starts]] += counts
+        return cls(indptr, indices, direction)
+
+    def degree(self, ids=None):
+        """
+        Return the number of connections of the given cells, or of all cells.
+        """
+        degree = np.diff(self.indptr)
+        return degree if ids is None else degree[ids]
+
+    def neighbours(self, ids):
+        """
+        Return the neighbours of the given cells, concatenated in the order of ``ids``.
+        Use :meth:`.degree` to split the result per cell.
+
+        :param ids: Cell id or ids.
+        :type ids: int | numpy.ndarray[int]
+        :rtype: numpy.ndarray[int]
+        """
+        ids = np.atleast_1d(ids)
+        return self._load_rows(self.indptr[ids], self.indptr[ids + 1])
+
+    def _load_rows(self, starts, ends):
+        lens = ends - starts
+        offsets = np.repeat(starts - np.cumsum(lens) + lens, lens)
+        return self.indices[np.arange(np.sum(lens)) + offsets]
+
 
 class ConnectivityIterator:
     def __init__(
@@ -1118,7 +1296,7 @@ class ConnectivityIterator:
     def __copy__(self):
         lchunks = self._lchunks.copy() if self._lchunks is not None else None
         gchunks = self._gchunks.copy() if self._gchunks is not None else None
-        return ConnectivityIterator(self._cs, self._dir, lchunks, gchunks)
+        return ConnectivityIterator(self._cs, self._dir, lchunks, gchunks, self._scoped)
 
     def __len__(self):
         return len(self.all()[0])
@@ -1273,6 +1451,7 @@ class GeneratedMorphology(StoredMorphology):
 
 
 __all__ = [
+    "AdjacencyIndex",
     "ConnectivityIterator",
     "ConnectivitySet",
     "Engine",
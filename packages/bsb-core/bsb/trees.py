@@ -4,9 +4,15 @@ problems.
 """
 
 import abc
+import ctypes
 
+import numpy as np
+from rtree import core
 from rtree import index as rtree
 
+# Bulk loading from, and querying with, numpy arrays was added in rtree 1.1.
+_bulk_arrays = hasattr(rtree.Index, "intersection_v")
+
 
 class BoxTreeInterface(abc.ABC):
     """
@@ -24,6 +30,15 @@ class BoxTreeInterface(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def query_many(self, boxes):  # pragma: nocover
+        """
+        Should return the intersecting IDs of all query boxes at once, as a pair of
+        ``(offsets, hits)`` arrays, with the IDs intersecting box ``i`` in
+        ``hits[offsets[i] : offsets[i + 1]]``.
+        """
+        pass
+
     @abc.abstractmethod
     def __len__(self):  # pragma: nocover
         pass
@@ -35,9 +50,24 @@ class _BoxRTree(BoxTreeInterface):
     """
 
     def __init__(self, boxes):
-        self._rtree = rtree.Index(properties=rtree.Property(dimension=3))
-        for id, box in enumerate(boxes):
-            self._rtree.insert(id, box)
+        boxes = np.array(boxes, dtype=float).reshape(-1, 6)
+        properties = rtree.Property(dimension=3)
+        if not len(boxes):
+            self._rtree = rtree.Index(properties=properties)
+            return
+        # Bulk load the boxes, so that libspatialindex packs the tree bottom-up
+        # (Sort-Tile-Recursive) instead of inserting them one by one. From numpy arrays
+        # if the installed rtree supports it, else from a stream.
+        if _bulk_arrays:
+            self._rtree = rtree.Index(
+                (np.arange(len(boxes)), boxes[:, :3], boxes[:, 3:]),
+                properties=properties,
+            )
+        else:
+            self._rtree = rtree.Index(
+                ((id, tuple(box), None) for id, box in enumerate(boxes.tolist())),
+                properties=properties,
+            )
 
     def __len__(self):
         return len(self._rtree)
@@ -66,6 +96,66 @@ class _BoxRTree(BoxTreeInterface):
         else:
             yield from all_
 
+    def query_many(self, boxes):
+        """
+        Given an array of ``(min_x, min_y, min_z, max_x, max_y, max_z)`` boxes, find all
+        the boxes that intersect with them, in a single call.
+
+        :param boxes: Boxes to look for intersections with.
+        :type boxes: numpy.ndarray
+        :returns: The ``offsets`` and ``hits``, the IDs of the boxes that intersect
+            ``boxes[i]`` are ``hits[offsets[i] : offsets[i + 1]]``.
+        :rtype: tuple[numpy.ndarray[int], numpy.ndarray[int]]
+        """
+        boxes = np.array(boxes, dtype=float).reshape(-1, 6)
+        if not len(boxes) or not len(self):
+            return np.zeros(len(boxes) + 1, dtype=int), np.empty(0, dtype=int)
+        if _bulk_arrays:
+            hits, counts = _intersection_v(self._rtree, boxes)
+        else:
+            found = [
+                np.fromiter(self._rtree.intersection(box, objects=False), dtype=int)
+                for box in boxes.tolist()
+            ]
+            counts = np.fromiter(map(len, found), dtype=int, count=len(found))
+            hits = np.concatenate(found)
+        offsets = np.zeros(len(boxes) + 1, dtype=int)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets, hits.astype(int)
+
+
+def _intersection_v(tree, boxes, buffer_size=4096):
+    # Counterpart of `rtree.Index.intersection_v`, which grows its result buffer with a
+    # float size under numpy 1. libspatialindex answers the queries in order until the
+    # buffer is full, so the remaining queries are resumed into a buffer that fits at
+    # least the hits of the query that didn't fit.
+    mins = np.ascontiguousarray(boxes[:, :3])
+    maxs = np.ascontiguousarray(boxes[:, 3:])
+    n = len(boxes)
+    ids = np.empty(max(buffer_size, 2 * n), dtype=np.int64)
+    counts = np.empty(n, dtype=np.uint64)
+    done = ctypes.c_int64(0)
+    offn = offi = 0
+    while True:
+        core.rt.Index_Intersects_id_v(
+            tree.handle,
+            n - offn,
+            3,
+            len(ids) - offi,
+            3,
+            1,
+            mins[offn:].ctypes.data,
+            maxs[offn:].ctypes.data,
+            ids[offi:].ctypes.data,
+            counts[offn:].ctypes.data,
+            ctypes.byref(done),
+        )
+        offi += int(counts[offn : offn + done.value].sum())
+        offn += done.value
+        if offn == n:
+            return ids[:offi], counts.astype(int)
+        ids.resize(2 * len(ids) + int(counts[offn]), refcheck=False)
+
 
 # Cheapo provider pattern.
 class BoxTree(_BoxRTree):
@@ -696,6 +696,42 @@ def voxel_rotation_of(orientation_field, voxel, default_vector=None):
     )
 
 
+def voxel_rotations_of(orientation_field, voxels, default_vector=None):
+    """
+    Retrieve the rotations to apply at many voxel locations at once to orient points
+    towards the orientation field. Voxels outside of the field, or where the field holds
+    a null or NaN vector, are not rotated.
+    :param numpy.ndarray orientation_field: brain orientation field
+    :param numpy.ndarray voxels: list of voxel coordinates
+    :param numpy.ndarray default_vector: Reference vector from which the rotations
+        will be computed.
+    :return: Rotation to apply at each voxel to match the orientation field.
+    :rtype: scipy.spatial.transform.Rotation
+    """
+    if default_vector is None:
+        default_vector = np.array([0.0, -1.0, 0.0])
+    a = np.asarray(default_vector, dtype=float).reshape(3)
+    a = a / np.linalg.norm(a)
+    voxels = np.asarray(voxels, dtype=int).reshape(-1, 3)
+    inside = is_within(voxels, orientation_field)
+    b = np.zeros((len(voxels), 3))
+    b[inside] = -np.asarray(orientation_field)[tuple(voxels[inside].T)]
+    norm = np.linalg.norm(b, axis=-1)
+    valid = ~np.isnan(norm) & (norm != 0)
+    b[valid] /= norm[valid, np.newaxis]
+    # Rotate about `a x b` by the angle between `a` and `b`, like
+    # `rotation_matrix_from_vectors`, which also leaves (anti)parallel vectors as is.
+    axes = np.cross(a, b[valid])
+    turns = np.any(axes, axis=-1)
+    axes = axes[turns]
+    angles = np.arccos(np.clip(b[valid][turns] @ a, -1, 1))
+    rotvecs = np.zeros((len(voxels), 3))
+    rotvecs[np.flatnonzero(valid)[turns]] = (
+        axes / np.linalg.norm(axes, axis=-1, keepdims=True) * angles[:, np.newaxis]
+    )
+    return Rotation.from_rotvec(rotvecs)
+
+
 def crosses_voxel(voxel, last_voxel):
     """
     Check if the distance of one voxel is separating two voxels.
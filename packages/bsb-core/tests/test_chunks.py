@@ -10,7 +10,8 @@ from bsb_test import (
     timeout,
 )
 
-from bsb import Chunk
+from bsb import Chunk, VoxelSet
+from bsb.storage._chunks import ChunkIndex
 
 
 class TestChunks(unittest.TestCase, NumpyTestCase):
@@ -70,6 +71,22 @@ class TestChunks(unittest.TestCase, NumpyTestCase):
                 )
 
 
+class TestChunkIndex(unittest.TestCase, NumpyTestCase):
+    def test_rows_of(self):
+        positions = np.random.default_rng(0).uniform(-250, 250, size=(1000, 3))
+        index = ChunkIndex(positions, [100, 100, 100])
+        chunks = VoxelSet.fill(positions, [100, 100, 100])
+        self.assertEqual(len(chunks), len(index), "should index every occupied chunk")
+        self.assertEqual(sorted(index.chunks), index.chunks, "should sort chunks by id")
+        for chunk in index.chunks:
+            with self.subTest(chunk=chunk):
+                inside = VoxelSet([chunk], chunk.dimensions).inside(positions)
+                self.assertClose(np.nonzero(inside)[0], index.rows_of(chunk))
+        self.assertEqual(0, len(index.rows_of(Chunk([5, 5, 5], [100, 100, 100]))))
+        rows = np.concatenate([rows for _, rows in index])
+        self.assertClose(np.arange(1000), np.sort(rows), "should cover each row once")
+
+
 class TestChunkedPS(
     RandomStorageFixture,
     NetworkFixture,
@@ -3,8 +3,12 @@ import inspect
 import json
 import os.path
 import sys
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
+import nrrd
 import numpy as np
 from bsb_test import (
     RandomStorageFixture,
@@ -13,6 +17,7 @@ from bsb_test import (
     list_test_configs,
 )
 from bsb_test.configs import get_test_config_module
+from voxcell import VoxelData
 
 from bsb import (
     AttributeOrderError,
@@ -1412,6 +1417,31 @@ class TestTypes(unittest.TestCase):
         d = Test(c="test.nrrd", _parent=TestRoot())
         self.assertRaises(FileNotFoundError, d.c.load_object)
 
+    def test_nrrd_memory_map(self):
+        path = get_data_path("orientations", "toy_annotations.nrrd")
+        expected, _ = nrrd.read(path)
+        with (
+            tempfile.TemporaryDirectory() as dirpath,
+            mock.patch("bsb.storage._util._cache_path", Path(dirpath)),
+        ):
+            node = NrrdDependencyNode(file=path)
+            raw = node.load_object().raw
+            self.assertTrue(np.array_equal(expected, raw))
+            self.assertFalse(raw.flags.writeable, "cached data should be read-only")
+            with mock.patch.object(
+                VoxelData, "load_nrrd", wraps=VoxelData.load_nrrd
+            ) as load_nrrd:
+                self.assertTrue(np.array_equal(expected, node.get_data().raw))
+                piped = NrrdDependencyNode(
+                    file=path, pipeline=[{"func": "copy.deepcopy"}]
+                ).load_object()
+            self.assertEqual(
+                1, load_nrrd.call_count, "only the piped data should be read again"
+            )
+            self.assertTrue(np.array_equal(expected, piped.raw))
+            raw = NrrdDependencyNode(file=path, memory_map=False).load_object().raw
+            self.assertTrue(raw.flags.writeable, "uncached data should be writable")
+
     def test_mutexcl_required(self):
         """
         Test the types.mut_excl function.
@@ -1,3 +1,4 @@
+import math
 import unittest
 from collections import defaultdict
 
@@ -100,6 +101,79 @@ class TestAllToAll(
             "This test should fail only once in every 1000 trials",
         )
 
+    def test_max_pairs(self):
+        # test that connections stored in blocks are all unique
+        self.cfg.connectivity["all_to_all"].max_pairs = 7
+        self.cfg.connectivity["all_to_all"].affinity = 0.5
+        self.network = Scaffold(self.cfg, self.storage)
+        self.network.compile(redo=True, only=["all_to_all"])
+        pre_locs, post_locs = (
+            self.network.get_connectivity_set("all_to_all").load_connections().all()
+        )
+        pairs = np.unique(np.column_stack((pre_locs[:, 0], post_locs[:, 0])), axis=0)
+        self.assertEqual(len(pre_locs), len(pairs), "duplicate connections")
+        self.assertLess(abs(len(pairs) - 5000) / np.sqrt(2500), 3.27)
+
+    def test_seed(self):
+        # test that the global random state reproduces the connections
+        self.cfg.connectivity["all_to_all"].affinity = 0.5
+        self.network = Scaffold(self.cfg, self.storage)
+        runs = []
+        for _ in range(2):
+            np.random.seed(42)
+            self.network.compile(redo=True, only=["all_to_all"])
+            pre_locs, post_locs = (
+                self.network.get_connectivity_set("all_to_all").load_connections().all()
+            )
+            runs.append(np.column_stack((pre_locs[:, 0], post_locs[:, 0])))
+        self.assertClose(runs[0], runs[1], "same seed should give the same pairs")
+
+
+class TestDistanceBased(
+    FixedPosConfigFixture,
+    RandomStorageFixture,
+    NumpyTestCase,
+    unittest.TestCase,
+    engine_name="hdf5",
+):
+    def setUp(self):
+        super().setUp()
+        self.cfg.connectivity.add(
+            "distance",
+            dict(
+                strategy="bsb.connectivity.DistanceBased",
+                presynaptic=dict(cell_types=["test_cell"]),
+                postsynaptic=dict(cell_types=["test_cell"]),
+                max_distance=50,
+                max_pairs=100,
+            ),
+        )
+        self.network = Scaffold(self.cfg, self.storage)
+
+    def _expected_pairs(self, max_distance):
+        pos = self.network.get_placement_set("test_cell").load_positions()
+        dist = np.linalg.norm(pos[:, None] - pos[None], axis=-1)
+        return set(zip(*np.nonzero(dist <= max_distance), strict=True)), dist
+
+    def test_within_distance(self):
+        self.network.compile(clear=True)
+        pre_locs, post_locs = (
+            self.network.get_connectivity_set("distance").load_connections().all()
+        )
+        pairs = list(zip(pre_locs[:, 0], post_locs[:, 0], strict=True))
+        self.assertEqual(len(pairs), len(set(pairs)), "duplicate connections")
+        expected, _ = self._expected_pairs(50)
+        self.assertEqual(expected, set(pairs), "expected all pairs within range")
+
+    def test_kernel(self):
+        self.cfg.connectivity.distance.kernel = lambda d: d < 20
+        self.network.compile(clear=True)
+        pre_locs, post_locs = (
+            self.network.get_connectivity_set("distance").load_connections().all()
+        )
+        expected, _ = self._expected_pairs(20)
+        self.assertEqual(expected, set(zip(pre_locs[:, 0], post_locs[:, 0], strict=True)))
+
 
 class TestConnectivitySet(
     FixedPosConfigFixture,
@@ -598,6 +672,23 @@ class TestVoxelIntersection(
         ):
             self.fail("expected specific overlap")
 
+    def test_loop_engine(self):
+        # The engines only differ in the alignment of the voxel grid of the candidates,
+        # which these morphologies are not sensitive to.
+        counts = {}
+        for engine in ("loop", "batch"):
+            self.network.connectivity.intersect.engine = engine
+            self.network.compile(redo=True)
+            cs = self.network.get_connectivity_set("intersect")
+            pre_locs, post_locs = cs.load_connections().all()
+            counts[engine] = len(pre_locs)
+            self.assertClose(
+                [[0, 0], [1, 0]],
+                np.unique(np.column_stack((pre_locs[:, 0], post_locs[:, 0])), axis=0),
+                f"expected the same connected cells with the {engine} engine",
+            )
+        self.assertEqual(counts["loop"], counts["batch"], "expected same contacts")
+
     def test_single_voxel_labelled(self):
         # Tests whether a morpho with labels is mapped back to the original points
         self.network.connectivity.intersect.presynaptic.morphology_labels = ["tip"]
@@ -712,6 +803,57 @@ class TestFixedIndegree(
                 total += this
             self.assertTrue(np.all(total == 50), "Not all cells have indegree 50")
 
+    def test_indegree_distribution(self):
+        self.network.connectivity.indegree.indegree = dict(distribution="poisson", mu=20)
+        self.network.compile()
+        cs = self.network.get_connectivity_set("indegree")
+        pre_locs, post_locs = cs.load_connections().all()
+        ps = self.network.get_placement_set("inhibitory")
+        pairs = np.unique(np.column_stack((pre_locs[:, 0], post_locs[:, 0])), axis=0)
+        self.assertEqual(len(pre_locs), len(pairs), "Cells were sampled twice")
+        degrees = np.bincount(post_locs[:, 0], minlength=len(ps))
+        # The mean of the Poisson indegrees should be within 4 standard errors of 20.
+        self.assertLess(abs(degrees.mean() - 20), 4 * np.sqrt(20 / len(ps)))
+
+    def test_loop_engine(self):
+        self.network.connectivity.indegree.engine = "loop"
+        self.test_indegree()
+
+
+class TestDegreeSampler(unittest.TestCase):
+    def sample(self, high, degrees, **kwargs):
+        from bsb.connectivity.general import _sample_without_replacement
+
+        rng = np.random.default_rng(0)
+        degrees = np.asarray(degrees)
+        samples = _sample_without_replacement(rng, high, degrees, **kwargs)
+        return np.split(samples, np.cumsum(degrees)[:-1])
+
+    def test_distinct(self):
+        for high, degree in ((10, 1), (10, 3), (10, 5), (10, 8), (10, 10), (1000, 20)):
+            with self.subTest(high=high, degree=degree):
+                rows = self.sample(high, [degree] * 500, block_size=256)
+                for row in rows:
+                    self.assertEqual(degree, len(np.unique(row)))
+                    self.assertTrue(np.all((row >= 0) & (row < high)))
+
+    def test_variable_degrees(self):
+        degrees = np.random.default_rng(1).integers(0, 13, size=1000)
+        rows = self.sample(12, degrees, block_size=64)
+        self.assertEqual(list(degrees), [len(np.unique(row)) for row in rows])
+
+    def test_uniform_subsets(self):
+        # Every subset of the candidates must be equally likely, whether it is drawn
+        # with replacement and repaired, or with Floyd's algorithm.
+        from scipy.stats import chisquare
+
+        for high, degree in ((40, 2), (6, 2), (6, 4)):
+            with self.subTest(high=high, degree=degree):
+                rows = np.array(self.sample(high, [degree] * 30000))
+                _, counts = np.unique(rows, axis=0, return_counts=True)
+                self.assertEqual(len(counts), math.comb(high, degree))
+                self.assertGreater(chisquare(counts).pvalue, 0.001)
+
 
 class TestFixedOutdegree(
     RandomStorageFixture, NetworkFixture, unittest.TestCase, engine_name="hdf5"
@@ -2,6 +2,7 @@ import unittest
 
 import numpy as np
 from bsb_test import NetworkFixture, RandomStorageFixture, get_data_path
+from scipy.spatial.transform import Rotation
 
 from bsb import (
     MPI,
@@ -178,3 +179,19 @@ class TestVolumetricRotations(
         )
         # orientation field x component should be close to 0.
         self.assertTrue(np.all(np.absolute(rotations[pos_w_rot][:, 0]) < 0.5))
+
+    def test_loop_engine(self):
+        distributor = self.network.placement.a.distribute.rotations
+        # Also sample positions outside of the 10x8x8 voxels of 25um of the field.
+        positions = np.random.default_rng(0).uniform(-50, 300, (1000, 3))
+        vectorized = np.array(distributor.distribute(positions, None))
+        distributor.engine = "loop"
+        loop = np.array(distributor.distribute(positions, None))
+        self.assertTrue(np.any(loop != 0), "expected some rotated positions")
+        self.assertTrue(
+            np.allclose(
+                Rotation.from_euler("xyz", loop, degrees=True).as_matrix(),
+                Rotation.from_euler("xyz", vectorized, degrees=True).as_matrix(),
+            ),
+            "engines should rotate the positions alike",
+        )
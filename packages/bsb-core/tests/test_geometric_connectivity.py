@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 from bsb_test import (
     FixedPosConfigFixture,
     MorphologiesFixture,
@@ -214,3 +215,48 @@ class TestShapeConnectivity(
         con = cs.load_connections().all()[0]
         intersection_points = len(con)
         self.assertClose(0, intersection_points, "expected no intersection points")
+
+    def test_batch_engine(self):
+        # The batch engine should find the same contacts as the loop engine.
+        ball_shape = {
+            "voxel_size": 25,
+            "shapes": [dict(type="sphere", radius=40.0, origin=[0, 0, 0])],
+            "labels": [["sphere"]],
+        }
+        for engine in ("loop", "batch"):
+            self.network.connectivity[f"morpho_to_shape_{engine}"] = (
+                MorphologyToShapeIntersection(
+                    postsynaptic=dict(
+                        cell_types=["test_cell_pc_2"], shapes_composition=ball_shape
+                    ),
+                    presynaptic=dict(cell_types=["test_cell_morpho"]),
+                    affinity=1,
+                    pruning_ratio=1,
+                    engine=engine,
+                )
+            )
+            self.network.connectivity[f"shape_to_shape_{engine}"] = (
+                ShapeToShapeIntersection(
+                    presynaptic=dict(
+                        cell_types=["test_cell_pc_1"], shapes_composition=ball_shape
+                    ),
+                    postsynaptic=dict(
+                        cell_types=["test_cell_pc_1"], shapes_composition=ball_shape
+                    ),
+                    affinity=1,
+                    pruning_ratio=1,
+                    engine=engine,
+                )
+            )
+        self.network.compile(skip_placement=True, append=True)
+        for name in ("morpho_to_shape", "shape_to_shape"):
+            with self.subTest(strategy=name):
+                loop, batch = (
+                    self.network.get_connectivity_set(f"{name}_{engine}")
+                    .load_connections()
+                    .all()
+                    for engine in ("loop", "batch")
+                )
+                self.assertGreater(len(loop[0]), 0, "expected contacts")
+                for a, b in zip(loop, batch, strict=True):
+                    self.assertClose(np.sort(a, axis=0), np.sort(b, axis=0))
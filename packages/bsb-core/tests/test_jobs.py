@@ -6,7 +6,9 @@ from graphlib import CycleError
 from time import sleep
 from unittest.mock import patch
 
+import numpy as np
 from bsb_test import (
+    FixedPosConfigFixture,
     NetworkFixture,
     NumpyTestCase,
     RandomStorageFixture,
@@ -54,6 +56,21 @@ def sleep_fail(scaffold, x, y):
     return x / 0
 
 
+def timed_pid(scaffold, y):
+    start = time.time()
+    sleep(y)
+    return os.getpid(), start, time.time()
+
+
+@config.node
+class SlowPlacement(PlacementStrategy):
+    def queue(self, pool, chunk_size):
+        pool.queue_placement(self, Chunk([0, 0, 0], chunk_size))
+
+    def place(self, chunk, indicators):
+        sleep(2)
+
+
 class TestDependencyOrder(unittest.TestCase):
     def test_sort_order(self):
         a = RandomPlacement(cell_types=[], partitions=[], name="A")
@@ -436,6 +453,188 @@ class TestParallelScheduler(
             self.assertEqual(0.1, pool._max_wait, "_max_wait not properly set.")
 
 
+@skip_parallel
+class TestProcessScheduler(
+    RandomStorageFixture, NetworkFixture, unittest.TestCase, engine_name="hdf5"
+):
+    def setUp(self):
+        self.cfg = create_config()
+        super().setUp()
+
+    @timeout(10)
+    def test_worker_processes(self):
+        with self.network.create_job_pool(quiet=True, workers=2) as pool:
+            jobs = [pool.queue(timed_pid, (0.3,)) for _ in range(4)]
+            results = pool.execute(return_results=True)
+        pids = {results[job][0] for job in jobs}
+        self.assertNotIn(os.getpid(), pids, "jobs should run on worker processes")
+        self.assertEqual(2, len(pids), "jobs should be spread over 2 workers")
+
+    @timeout(10)
+    def test_dependencies(self):
+        with self.network.create_job_pool(quiet=True, workers=2) as pool:
+            job = pool.queue(timed_pid, (0.2,))
+            job2 = pool.queue(timed_pid, (0,), deps=[job])
+            results = pool.execute(return_results=True)
+        self.assertLessEqual(results[job][2], results[job2][1], "dep should finish first")
+
+    @timeout(10)
+    def test_dependency_failure(self):
+        with self.network.create_job_pool(fail_fast=False, quiet=True, workers=2) as pool:
+            job = pool.queue(sleep_fail, (4, 0.1))
+            job2 = pool.queue(sleep_y, (5, 0.1), deps=[job])
+            job3 = pool.queue(sleep_y, (4, 0.1))
+            with self.assertRaises(WorkflowError):
+                pool.execute()
+        self.assertEqual(JobStatus.FAILED, job.status)
+        self.assertEqual(JobStatus.CANCELLED, job2.status)
+        self.assertEqual(JobStatus.SUCCESS, job3.status)
+
+    @timeout(10)
+    def test_await_jobs(self):
+        with self.network.create_job_pool(quiet=True, workers=2) as pool:
+            job = pool.queue(timed_pid, (0.3,))
+            jobs = []
+
+            def scheduler(node):
+                pool.await_jobs([job])
+                jobs.append(pool.queue(timed_pid, (0,)))
+
+            pool.schedule(["node"], scheduler)
+            results = pool.execute(return_results=True)
+        self.assertLessEqual(
+            results[job][2], results[jobs[0]][1], "should queue after job completed"
+        )
+
+    @timeout(10)
+    def test_scheduler_enqueue_race(self):
+        """
+        Test that jobs that a scheduler thread queues are completed, even when they
+        finish before the scheduler thread is done submitting them.
+        """
+
+        class SlowDoneQueue:
+            # Holds up the thread that reports a done future, so that the main loop
+            # handles the future before that thread moves on.
+            def __init__(self, done):
+                self._done = done
+                self.get = done.get
+                self.get_nowait = done.get_nowait
+
+            def put(self, future):
+                self._done.put(future)
+                sleep(0.2)
+
+        with self.network.create_job_pool(quiet=True, workers=2) as pool:
+            pool._done_futures = SlowDoneQueue(pool._done_futures)
+            submit = pool._processes.submit
+
+            def submit_and_wait(*args, **kwargs):
+                # The job is done before its submission returns, so the done callback
+                # runs on the submitting scheduler thread.
+                future = submit(*args, **kwargs)
+                future.exception()
+                return future
+
+            pool._processes.submit = submit_and_wait
+            first = pool.queue(sleep_y, (0, 0))
+            jobs = []
+
+            def scheduler(node):
+                # Queue our jobs while the pool is executing.
+                pool.await_jobs([first])
+                jobs.extend(pool.queue(sleep_y, (node, 0)) for _ in range(3))
+
+            pool.schedule([1, 2], scheduler)
+            results = pool.execute(return_results=True)
+        self.assertEqual(6, len(jobs))
+        self.assertEqual([1, 1, 1, 2, 2, 2], sorted(results[job] for job in jobs))
+
+    @timeout(10)
+    def test_storage_lock_restored(self):
+        engine = self.network.storage._engine
+        lock = engine.lock
+        with self.network.create_job_pool(quiet=True, workers=2) as pool:
+            pool.queue(sleep_y, (4, 0))
+            pool.execute()
+        self.assertIs(lock, engine.lock, "engine lock should be restored")
+
+
+@skip_parallel
+class TestProcessCompile(
+    FixedPosConfigFixture,
+    RandomStorageFixture,
+    NumpyTestCase,
+    unittest.TestCase,
+    engine_name="hdf5",
+):
+    @timeout(30)
+    def test_compile(self):
+        self.cfg.connectivity.add(
+            "all_to_all",
+            dict(
+                strategy="bsb.connectivity.AllToAll",
+                presynaptic=dict(cell_types=["test_cell"]),
+                postsynaptic=dict(cell_types=["test_cell"]),
+            ),
+        )
+        network = Scaffold(self.cfg, self.storage)
+        network.compile(clear=True, workers=3)
+        ps = network.get_placement_set("test_cell")
+        self.assertEqual(100, len(ps))
+        expected = self.cfg.placement.ch4_c25.positions
+        positions = ps.load_positions()
+        self.assertClose(
+            expected[np.lexsort(expected.T)], positions[np.lexsort(positions.T)]
+        )
+        cs = network.get_connectivity_set("all_to_all")
+        self.assertEqual(100 * 100, len(cs))
+        stats = network.storage.get_chunk_stats()
+        self.assertEqual(100, sum(s["placed"] for s in stats.values()))
+        self.assertEqual(100 * 100, sum(s["connections"]["out"] for s in stats.values()))
+
+    def _add_slow_placement(self):
+        self.cfg.cell_types.add("slow_cell", dict(spatial=dict(radius=2, count=1)))
+        self.cfg.placement.add(
+            "slow", SlowPlacement(strategy="", cell_types=["slow_cell"], partitions=[])
+        )
+        self.cfg.connectivity.add(
+            "all_to_all",
+            dict(
+                strategy="bsb.connectivity.AllToAll",
+                presynaptic=dict(cell_types=["test_cell"]),
+                postsynaptic=dict(cell_types=["test_cell"]),
+            ),
+        )
+
+    @timeout(30)
+    def test_unified_compile(self):
+        self._add_slow_placement()
+        network = Scaffold(self.cfg, self.storage)
+        finished = []
+
+        def listener(progress):
+            if progress.reason == PoolProgressReason.JOB_STATUS_CHANGE and (
+                progress.status == JobStatus.SUCCESS
+            ):
+                finished.append(progress.job.submitter.name)
+
+        network.register_listener(listener)
+        network.compile(clear=True, workers=3, unified=True)
+        self.assertEqual(100 * 100, len(network.get_connectivity_set("all_to_all")))
+        self.assertEqual(
+            "slow", finished[-1], "connectivity should not wait for unrelated placement"
+        )
+
+    def test_unified_serial(self):
+        self._add_slow_placement()
+        self.cfg.placement.slow.place = lambda chunk, indicators: None
+        network = Scaffold(self.cfg, self.storage)
+        with self.assertWarns(UserWarning):
+            network.compile(clear=True, unified=True)
+        self.assertEqual(100 * 100, len(network.get_connectivity_set("all_to_all")))
+
+
 @skip_parallel
 class TestSerialScheduler(
     RandomStorageFixture, NetworkFixture, unittest.TestCase, engine_name="hdf5"
@@ -520,6 +719,16 @@ class TestSubmissionContext(
                 self.assertEqual(1, len(pool.jobs))
                 self.assertEqual("{root}.connectivity.test", pool.jobs[0].name)
 
+    def test_submissions_of(self):
+        with self.network.create_job_pool() as pool:
+            if pool.is_main():
+                placement = self.network.placement.test
+                jobs = [pool.queue_placement(placement, [0, 0, 0]) for _ in range(3)]
+                job = pool.queue(sleep_y, (4, 0), submitter=sleep_fail)
+                self.assertEqual(jobs, pool.get_submissions_of(placement))
+                self.assertEqual([job], pool.get_submissions_of(sleep_fail))
+                self.assertEqual([], pool.get_submissions_of(sleep_y))
+
     @timeout(3)
     def test_no_submitter_submission(self):
         """
@@ -621,6 +830,21 @@ class TestPoolCache(RandomStorageFixture, unittest.TestCase, engine_name="hdf5")
                 pool.get_required_cache_items(),
             )
 
+    @skip_parallel
+    @timeout(3)
+    def test_pool_released_cache(self):
+        """
+        Test that the cache items are released when the jobs that require them are done.
+        """
+        with self.network.create_job_pool(quiet=True) as pool:
+            job = pool.queue_placement(self.network.placement.withcache, [0, 0, 0])
+            job2 = pool.queue_placement(
+                self.network.placement.withcache, [0, 0, 0], deps=[job]
+            )
+            job.cancel()
+            self.assertEqual(JobStatus.CANCELLED, job2.status)
+            self.assertEqual(set(), pool.get_required_cache_items())
+
     @patch(
         "bsb.services.pool.free_stale_pool_cache",
         lambda scaffold, required_cache_items: mock_free_cache(
@@ -136,6 +136,32 @@ class TestIO(NumpyTestCase, unittest.TestCase):
             m = Morphology([b])
             m.to_graph_array()
 
+    def test_swc_engines(self):
+        file = get_morphology_path("PurkinjeCell.swc")
+        with open(str(file)) as f:
+            data = BsbParser()._swc_parse(f.read())
+        # Give the samples irregular ids, and list the children before their parents.
+        ids = np.random.default_rng(0).permutation(len(data) * 2)[: len(data)] + 1
+        shuffled = data.copy()
+        shuffled[:, 0] = ids
+        shuffled[:, 6] = np.where(data[:, 6] == -1, -1, ids[data[:, 6].astype(int) - 1])
+        shuffled = shuffled[::-1]
+        for kwargs in ({}, {"skip_boundary_labels": ["soma"], "tags": {16: "soma"}}):
+            for swc in (data, shuffled):
+                with self.subTest(**kwargs, shuffled=swc is shuffled):
+                    loop = BsbParser(engine="loop", **kwargs)._swc_data_to_morpho(swc)
+                    m = BsbParser(**kwargs)._swc_data_to_morpho(swc)
+                    self.assertClose(loop.points, m.points)
+                    self.assertClose(loop.radii, m.radii)
+                    self.assertClose(loop.tags, m.tags)
+                    self.assertClose(loop.labels.raw, m.labels.raw)
+                    self.assertEqual(loop.labels.labels, m.labels.labels)
+                    self.assertEqual(
+                        [loop.branches.index(b.parent) for b in loop.branches[1:]],
+                        [m.branches.index(b.parent) for b in m.branches[1:]],
+                        "branches should be ordered and attached alike",
+                    )
+
 
 def _branch(len=3):
     return Branch(np.ones((len, 3)), np.ones(len), EncodedLabels.none(len), {})
@@ -196,6 +222,28 @@ class TestMorphologies(NumpyTestCase, unittest.TestCase):
                 properties={"a": np.array([0, 1])},  # not one value per point
             )
 
+    def test_from_buffers(self):
+        points = np.arange(21.0).reshape(7, 3).copy()
+        radii = np.ones(7)
+        labels = EncodedLabels(
+            7, buffer=np.array([1, 1, 0, 0, 0, 0, 0]), labels={1: ["a"]}
+        )
+        m = Morphology.from_buffers((points, radii, labels, {}), [2, 5, 7], [-1, 0, 0])
+        self.assertIsNone(m._roots, "branches should be created lazily")
+        self.assertEqual(7, len(m))
+        self.assertClose(points, m.points)
+        copied = m.copy()
+        self.assertIsNone(copied._roots, "copy should stay lazy")
+        self.assertIsNot(points, copied.points, "copy should copy the buffers")
+        self.assertEqual(1, len(m.roots))
+        self.assertEqual([2, 3, 2], [len(b) for b in m.branches])
+        self.assertEqual(m.branches[1:], m.roots[0].children)
+        self.assertTrue(m._check_shared(), "branches should share the buffers")
+        self.assertEqual(["a"], m.branches[0].list_labels())
+        self.assertEqual(m, copied)
+        m.branches[2].attach_child(_branch(3))
+        self.assertFalse(m._is_shared, "mutating the branches should unshare")
+
     def test_optimize(self):
         b1 = _branch(3)
         b1.set_properties(smth=np.ones(len(b1)))
@@ -761,6 +809,24 @@ class TestMorphologySet(NumpyTestCase, unittest.TestCase):
         self.assertEqual(2, len(m), "expected filtered morpho")
         self.assertClose([[1, 1, 1], [2, 2, 2]], m.points, "expected B labelled points")
 
+    def test_softcache_voxelize(self):
+        ms = MorphologySet([self._label_loader("ello")], [0, 0, 0])
+        rot = Rotation.from_euler("z", 90, degrees=True)
+        v1 = ms.voxelize(0, 4)
+        self.assertIs(v1, ms.voxelize(2, 4), "expected cached voxels")
+        self.assertIsNot(v1, ms.voxelize(0, 8), "expected other voxels for other N")
+        rotated = ms.voxelize(0, 4, rot)
+        self.assertIs(
+            rotated,
+            ms.voxelize(1, 4, Rotation.from_euler("xyz", [0, 0, 90], degrees=True)),
+            "expected cached voxels for same rotation",
+        )
+        expected = ms.get(0).rotate(rot).voxelize(4)
+        self.assertClose(expected.as_boxes(), rotated.as_boxes())
+        self.assertIsNot(v1, ms.voxelize(0, 4, cache=False), "expected uncached voxels")
+        ms.set_label_filter(["A"])
+        self.assertIsNot(v1, ms.voxelize(0, 4), "expected invalidated soft cache")
+
 
 class TestMorphometry(NumpyTestCase, unittest.TestCase):
     def setUp(self):
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from time import sleep
 
@@ -382,6 +384,34 @@ class TestPlacementStrategies(
         pspos_sort = pspos[np.argsort(pspos[:, 0])]
         self.assertClose(pos_sort, pspos_sort, "expected fixed positions")
 
+    def test_csv_import(self):
+        cs = 100
+        positions = np.random.default_rng(0).uniform(-cs, cs, size=(50, 3))
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+            f.write("x,y,z,radius\n")
+            f.writelines(f"{x},{y},{z},{i}\n" for i, (x, y, z) in enumerate(positions))
+        self.addCleanup(os.unlink, f.name)
+        cfg = Configuration.default(
+            cell_types=dict(test_cell=dict(spatial=dict(radius=2, count=1))),
+            placement=dict(
+                csv=dict(
+                    strategy="bsb.placement.CsvImportPlacement",
+                    source=f.name,
+                    cell_types=["test_cell"],
+                    progress_bar=False,
+                )
+            ),
+        )
+        network = Scaffold(cfg, self.storage)
+        network.compile(clear=True)
+        ps = network.get_placement_set("test_cell")
+        self.assertEqual(8, len(ps.get_all_chunks()), "should split into 8 chunks")
+        ids = ps.load_additional("radius").astype(int)
+        self.assertClose(positions[ids], ps.load_positions())
+        for chunk in ps.get_all_chunks():
+            ps.set_chunk_filter([chunk])
+            self.assertClose(chunk, ps.load_positions() // cs, "should be chunked")
+
     def test_parallel_arrays(self):
         cfg = get_test_config("single")
         network = Scaffold(cfg, self.storage)
@@ -494,6 +524,35 @@ class TestVoxelDensities(RandomStorageFixture, unittest.TestCase, engine_name="h
         self.assertGreater(len(ps), 125)  # rounded down values -1
         self.assertLess(len(ps), 132)  # rounded up values + 1
 
+    def test_particle_vd_grid(self):
+        cfg = Configuration.default(
+            cell_types=dict(
+                test_cell=CellType(spatial=dict(radius=2, density=2, density_key="inhib"))
+            ),
+            regions=dict(test_region=dict(children=["test_part"])),
+            partitions=dict(test_part=dict(type="test")),
+            placement=dict(
+                voxel_density=dict(
+                    strategy="bsb.placement.RandomPlacement",
+                    partitions=["test_part"],
+                    cell_types=["test_cell"],
+                    engine="grid",
+                )
+            ),
+        )
+        network = Scaffold(cfg, self.storage)
+        network.compile(clear=True)
+        positions = network.get_placement_set("test_cell").load_positions()
+        self.assertGreater(len(positions), 125)
+        self.assertLess(len(positions), 132)
+        distances = np.linalg.norm(positions[:, None] - positions[None], axis=2)
+        np.fill_diagonal(distances, np.inf)
+        self.assertGreaterEqual(np.min(distances), 4, "cells should not overlap")
+        vs = network.partitions.test_part.vs
+        self.assertFalse(
+            np.any(np.isnan(vs.index_of(positions))), "cells should be placed in voxels"
+        )
+
     def _config_packing_fact(self):
         return Configuration.default(
             network={
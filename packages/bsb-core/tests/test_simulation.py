@@ -1,13 +1,18 @@
+import os
+import tempfile
 import unittest
 
 import numpy as np
+import quantities as pq
 from bsb_arbor import SpikeRecorder
 from bsb_test import FixedPosConfigFixture, NumpyTestCase, RandomStorageFixture
 
 from bsb import (
     MPI,
     AttributeMissingError,
+    ResultFile,
     Scaffold,
+    SimulationResult,
     config,
     get_simulation_adapter,
     options,
@@ -285,6 +290,79 @@ class TestTargetting(
         self.assertEqual(len(sorted_ids), 4)
 
 
+@unittest.skipIf(MPI.get_size() > 1, "Skipped during parallel testing.")
+class TestResultStream(
+    FixedPosConfigFixture,
+    RandomStorageFixture,
+    NumpyTestCase,
+    unittest.TestCase,
+    engine_name="hdf5",
+):
+    def setUp(self):
+        super().setUp()
+        self.network = Scaffold(self.cfg, self.storage)
+        self.network.simulations.add(
+            "test",
+            simulator="arbor",
+            duration=30,
+            resolution=1.0,
+            cell_models=dict(),
+            connection_models=dict(),
+            devices=dict(),
+        )
+
+    def test_stream(self):
+        from neo import AnalogSignal, SpikeTrain
+
+        result = SimulationResult(self.network.simulations.test)
+        flushes = [
+            (np.array([1.0, 5.0]), np.array([3, 4]), np.arange(10.0)),
+            (np.array([]), np.array([], dtype=int), np.arange(10.0, 20)),
+            (np.array([25.0]), np.array([7]), np.arange(20.0, 30)),
+        ]
+        data = iter(flushes)
+
+        def recorder(segment):
+            times, senders, signal = next(data)
+            segment.spiketrains.append(
+                SpikeTrain(
+                    times,
+                    units="ms",
+                    t_stop=30,
+                    array_annotations={"senders": senders},
+                    device="spikes",
+                )
+            )
+            segment.analogsignals.append(
+                AnalogSignal(
+                    signal, units="mV", sampling_period=1 * pq.ms, cell_id=np.int64(3)
+                )
+            )
+
+        result.create_recorder(recorder)
+        with tempfile.TemporaryDirectory() as dirpath:
+            result.stream(os.path.join(dirpath, "results.hdf5"))
+            self.assertTrue(result.streaming)
+            for _ in flushes:
+                result.flush()
+            result.close()
+            self.assertEqual(0, len(result.block.segments), "should not be in memory")
+            self.assertEqual(1, len(result.spiketrains))
+            spiketrain = result.spiketrains[0]
+            self.assertClose([1, 5, 25], spiketrain.magnitude)
+            self.assertClose([3, 4, 7], spiketrain.array_annotations["senders"])
+            self.assertEqual("spikes", spiketrain.annotations["device"])
+            self.assertEqual(30, spiketrain.t_stop)
+            self.assertEqual(1, len(result.analogsignals))
+            signal = result.analogsignals[0]
+            self.assertClose(np.arange(30.0), signal.magnitude.ravel())
+            self.assertEqual(3, signal.annotations["cell_id"])
+            self.assertEqual(pq.mV, signal.units)
+            block = ResultFile(os.path.join(dirpath, "results.hdf5")).read_block()
+            self.assertEqual("test", block.name)
+            self.assertEqual(30, block.annotations["config"]["duration"])
+
+
 @config.node
 class SpikeController(
     SpikeRecorder,
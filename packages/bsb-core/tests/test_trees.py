@@ -1,9 +1,11 @@
 import inspect
 import unittest
+from unittest import mock
 
 import bsb_test
+import numpy as np
 
-from bsb import VoxelSet
+from bsb import BoxTree, VoxelSet
 
 
 class TestVoxelSet(bsb_test.NumpyTestCase, unittest.TestCase):
@@ -34,3 +36,65 @@ class TestVoxelSet(bsb_test.NumpyTestCase, unittest.TestCase):
         )
         res = list(gen)
         self.assertEqual([0, 1, 2], res, "incorrect results")
+
+    def test_boxtree_query_many(self):
+        tree = self.regulars[0].as_boxtree()
+        boxes = [(0, 0, 0, 3, 0, 0), (300, 0, 0, 300, 0, 0), (3, 0, 0, 6, 0, 0)]
+        offsets, hits = tree.query_many(boxes)
+        self.assertClose([0, 2, 2, 4], offsets, "incorrect offsets")
+        self.assertEqual(
+            [sorted(q) for q in tree.query(boxes)],
+            [sorted(hits[a:b]) for a, b in zip(offsets[:-1], offsets[1:], strict=True)],
+            "query_many should match query",
+        )
+        offsets, hits = BoxTree([]).query_many(boxes)
+        self.assertClose(0, offsets, "empty tree should have no hits")
+        self.assertEqual(0, len(hits), "empty tree should have no hits")
+
+    def test_boxtree_bulk_load(self):
+        rng = np.random.default_rng(0)
+        mins = rng.random((1000, 3)) * 100
+        boxes = np.column_stack((mins, mins + rng.random((1000, 3)) * 5))
+        queries = boxes[:50] + [-1, -1, -1, 1, 1, 1]
+        results = []
+        for bulk_arrays in (True, False):
+            with mock.patch("bsb.trees._bulk_arrays", bulk_arrays):
+                tree = BoxTree(boxes)
+                self.assertEqual(1000, len(tree), "expected all boxes in tree")
+                results.append([sorted(q) for q in tree.query(queries)])
+        expected = [
+            sorted(
+                np.nonzero(np.all((boxes[:, :3] <= q[3:]) & (q[:3] <= boxes[:, 3:]), 1))[
+                    0
+                ]
+            )
+            for q in queries
+        ]
+        self.assertEqual(expected, results[0], "incorrect bulk loaded results")
+        self.assertEqual(expected, results[1], "incorrect streamed results")
+
+    def test_boxtree_query_many_bulk(self):
+        rng = np.random.default_rng(0)
+        mins = rng.random((1000, 3)) * 100
+        boxes = np.column_stack((mins, mins + rng.random((1000, 3)) * 5))
+        # Small and large queries, so that the results outgrow the result buffer.
+        queries = np.concatenate(
+            (
+                boxes[:50] + [-1, -1, -1, 1, 1, 1],
+                np.tile([-1, -1, -1, 200, 200, 200], (10, 1)),
+            )
+        )
+        tree = BoxTree(boxes)
+        results = []
+        for bulk_arrays in (True, False):
+            with mock.patch("bsb.trees._bulk_arrays", bulk_arrays):
+                offsets, hits = tree.query_many(queries)
+            results.append(
+                [
+                    sorted(hits[a:b])
+                    for a, b in zip(offsets[:-1], offsets[1:], strict=True)
+                ]
+            )
+        self.assertEqual([sorted(q) for q in tree.query(queries)], results[0])
+        self.assertEqual(results[0], results[1], "bulk and per box queries differ")
+        self.assertEqual(list(range(1000)), results[0][-1], "expected all boxes")
@@ -31,6 +31,7 @@ from bsb.voxels import (
     voxel_data_of,
     voxel_orient,
     voxel_rotation_of,
+    voxel_rotations_of,
 )
 from tests.test_topology import skip_test_allen_api
 
@@ -707,6 +708,14 @@ class TestNrrdDependencyNode(
         self.assertAll(tested_voxel == voxel)
         rotation = voxel_rotation_of(orientations, voxel).as_euler("xyz", degrees=True)
         self.assertAll(np.isclose([0, 0, 90], rotation, atol=10))
+        # The null vector at [0, 0, 0] and voxels outside of the field aren't rotated.
+        rotations = voxel_rotations_of(
+            orientations, np.array([voxel, [0, 0, 0], [-1, 0, 0], [10, 0, 0]])
+        )
+        self.assertClose(
+            voxel_rotation_of(orientations, voxel).as_matrix(), rotations[0].as_matrix()
+        )
+        self.assertClose(np.eye(3), rotations[1:].as_matrix())
 
     def test_compatibility(self):
         self.assertTrue(self.annotations.is_compatible(self.orientations))
@@ -0,0 +1,64 @@
+"""
+Benchmark the insert throughput of the ``sorted`` and ``log`` connectivity layouts.
+
+Connections are written in blocks between a grid of local and global chunks, in an
+interleaved order, as parallel connectivity jobs would. The ``log`` timing includes its
+compaction into the sorted layout.
+
+.. code-block:: bash
+
+  python benchmarks/bench_connectivity_layout.py -n 1e6 1e7 1e8 --max-sorted 1e7
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from bsb import Chunk, Storage
+
+
+def write_connections(layout, n, chunks, block_size):
+    pre = SimpleNamespace(name="pre")
+    post = SimpleNamespace(name="post")
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage("hdf5", os.path.join(tmp, "bench.hdf5"))
+        engine = storage._engine
+        cs = storage._ConnectivitySet.create(engine, pre, post, "bench", layout=layout)
+        grid = [Chunk((i, 0, 0), None) for i in range(chunks)]
+        pairs = [(src, dst) for src in grid for dst in grid]
+        rng = np.random.default_rng(0)
+        locs = rng.integers(0, 1000, size=(block_size, 3))
+        start = time.perf_counter()
+        with engine.write_scope():
+            written = 0
+            while written < n:
+                src, dst = pairs[(written // block_size) % len(pairs)]
+                size = min(block_size, n - written)
+                cs.chunk_connect(src, dst, locs[:size], locs[:size])
+                written += size
+            if layout == "log":
+                cs.compact()
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e6])
+    parser.add_argument("--chunks", type=int, default=8)
+    parser.add_argument("--block-size", type=int, default=10_000)
+    parser.add_argument("--max-sorted", type=float, default=1e7)
+    args = parser.parse_args()
+    print(f"{'connections':>12} {'layout':>7} {'time (s)':>10} {'conn/s':>12}")
+    for n in map(int, args.n):
+        for layout in ("sorted", "log"):
+            if layout == "sorted" and n > args.max_sorted:
+                continue
+            elapsed = write_connections(layout, n, args.chunks, args.block_size)
+            print(f"{n:>12} {layout:>7} {elapsed:>10.2f} {n / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
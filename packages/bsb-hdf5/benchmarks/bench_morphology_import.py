@@ -0,0 +1,67 @@
+"""
+Benchmark importing many SWC morphologies into the morphology repository.
+
+Generates ``-n`` small random SWC files, parses them, and stores them once one by one
+with ``save`` and once in bulk with ``save_many``. Parsing is timed separately.
+
+.. code-block:: bash
+
+  python benchmarks/bench_morphology_import.py -n 10000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from bsb import Storage, parse_morphology_file
+
+
+def write_swc(path, rng, points):
+    parents = np.concatenate(([-1], rng.integers(0, np.arange(1, points))))
+    coords = rng.random((points, 3)) * 100
+    with open(path, "w") as f:
+        for i, (parent, (x, y, z)) in enumerate(zip(parents, coords, strict=True)):
+            tag = 1 if i == 0 else 3
+            f.write(f"{i + 1} {tag} {x:.3f} {y:.3f} {z:.3f} 1.0 {parent + 1 or -1}\n")
+
+
+def import_morphologies(tmp, names, morphologies, bulk):
+    storage = Storage("hdf5", os.path.join(tmp, f"bench_{bulk}.hdf5"))
+    mr = storage.morphologies
+    start = time.perf_counter()
+    if bulk:
+        mr.save_many(names, morphologies)
+    else:
+        with storage._engine.write_scope():
+            for name, morphology in zip(names, morphologies, strict=True):
+                mr.save(name, morphology)
+    elapsed = time.perf_counter() - start
+    assert len(mr.get_all_meta()) == len(names)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, default=1e4)
+    parser.add_argument("--points", type=int, default=50)
+    args = parser.parse_args()
+    n = int(args.n)
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"m{i}.swc") for i in range(n)]
+        for path in paths:
+            write_swc(path, rng, args.points)
+        start = time.perf_counter()
+        morphologies = [parse_morphology_file(path) for path in paths]
+        print(f"{'parse':>10} {time.perf_counter() - start:>10.2f} s")
+        names = [f"m{i}" for i in range(n)]
+        for bulk in (False, True):
+            elapsed = import_morphologies(tmp, names, morphologies, bulk)
+            label = "save_many" if bulk else "save"
+            print(f"{label:>10} {elapsed:>10.2f} s {n / elapsed:>10.0f} morpho/s")
+
+
+if __name__ == "__main__":
+    main()
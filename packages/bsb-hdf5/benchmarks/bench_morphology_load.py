@@ -0,0 +1,75 @@
+"""
+Benchmark loading morphologies from the morphology repository.
+
+Stores ``-n`` random morphologies of ``--branches`` branches of ``--points`` points
+each, and times loading all of them, creating their branches, and taking ``--copies``
+copies of each, the way a ``MorphologySet`` hands them out to cells.
+
+.. code-block:: bash
+
+  python benchmarks/bench_morphology_load.py -n 500 --branches 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from bsb import Branch, Morphology, Storage
+
+
+def random_morphology(rng, branches, points):
+    roots = [Branch(rng.random((points, 3)) * 100, rng.random(points))]
+    all_branches = list(roots)
+    for _ in range(branches - 1):
+        branch = Branch(rng.random((points, 3)) * 100, rng.random(points))
+        all_branches[rng.integers(len(all_branches))].attach_child(branch)
+        all_branches.append(branch)
+    for i, branch in enumerate(all_branches):
+        branch.label([f"l{i % 4}"])
+    return Morphology(roots)
+
+
+def timed(f):
+    start = time.perf_counter()
+    result = f()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=500)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--points", type=int, default=10)
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    names = [f"m{i}" for i in range(args.n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage("hdf5", os.path.join(tmp, "bench.hdf5"))
+        mr = storage.morphologies
+        mr.save_many(
+            names,
+            [random_morphology(rng, args.branches, args.points) for _ in names],
+        )
+        loaders = mr.all()
+        loaded, t_load = timed(lambda: [loader.load() for loader in loaders])
+        _, t_branches = timed(lambda: [len(m.branches) for m in loaded])
+        loaded = [loader.load() for loader in loaders]
+        # Copies are dropped right away, like those of cells that are done with.
+        _, t_copies = timed(
+            lambda: [len(m.copy()) for m in loaded for _ in range(args.copies)]
+        )
+        _, t_full = timed(
+            lambda: [len(m.copy().branches) for m in loaded for _ in range(args.copies)]
+        )
+    print(f"{'step':>18} {'time (s)':>9}")
+    print(f"{'load':>18} {t_load:>9.3f}")
+    print(f"{'create branches':>18} {t_branches:>9.3f}")
+    print(f"{'copy':>18} {t_copies:>9.3f}")
+    print(f"{'copy + branches':>18} {t_full:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark ``len()`` of a placement set against counting its loaded positions.
+
+The cells are spread over a grid of chunks. ``len()`` and ``count_in_chunks`` are served
+from the per-chunk count table, the baseline loads every position dataset to count rows.
+
+.. code-block:: bash
+
+  python benchmarks/bench_placement_len.py -n 1e7 --chunks 64
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from bsb import Chunk, Storage
+
+
+def timeit(f, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = f()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, default=1e7)
+    parser.add_argument("--chunks", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    n = int(args.n)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage("hdf5", os.path.join(tmp, "bench.hdf5"))
+        ps = storage._PlacementSet.create(storage._engine, SimpleNamespace(name="bench"))
+        grid = [Chunk((i, 0, 0), (100, 100, 100)) for i in range(args.chunks)]
+        rng = np.random.default_rng(0)
+        sizes = np.diff(np.linspace(0, n, len(grid) + 1, dtype=int))
+        for chunk, size in zip(grid, sizes, strict=True):
+            ps.append_data(chunk, rng.random((size, 3)))
+        print(f"{'method':>24} {'time (s)':>10} {'result':>10}")
+        for name, f in (
+            ("len(ps)", lambda: len(ps)),
+            ("count_in_chunks", lambda: int(np.sum(ps.count_in_chunks(grid)))),
+            ("len(ps.load_positions())", lambda: len(ps.load_positions())),
+        ):
+            elapsed, result = timeit(f, args.repeat)
+            print(f"{name:>24} {elapsed:>10.5f} {result:>10}")
+
+
+if __name__ == "__main__":
+    main()
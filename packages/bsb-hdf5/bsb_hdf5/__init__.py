@@ -10,11 +10,13 @@ import time
 from datetime import datetime
 
 import h5py
+import numpy as np
 import shortuuid
-from bsb import Engine, MPILock, ScaffoldWarning, config, report, warn
+from bsb import Engine, MPILock, ScaffoldWarning, config, report, types, warn
 from bsb import StorageNode as IStorageNode
 
 from ._telemetry import _hdf5_tracer
+from .chunks import ChunkTable
 from .connectivity_set import ConnectivitySet
 from .file_store import FileStore
 from .morphology_repository import MorphologyRepository
@@ -120,11 +122,30 @@ class _SpannedHandle:
             self._span_ctx.__exit__(*args)
 
 
+def _legacy_chunk_stats(handle, table):
+    # Files written before the chunk statistics table kept them in a JSON attribute.
+    stats = json.loads(handle.attrs.get("chunks", "{}"))
+    rows = [
+        (int(id), s["placed"], s["connections"]["inc"], s["connections"]["out"])
+        for id, s in stats.items()
+    ]
+    return np.sort(np.array(rows, dtype=table.dtype), order="chunk")
+
+
 class HDF5Engine(Engine):
     def __init__(self, root, comm):
         super().__init__(root, comm)
         self._lock = MPILock.sync(comm._comm)
         self._readonly = False
+        self._chunk_stats = ChunkTable(
+            "/chunk_stats", ("placed", "inc", "out"), legacy=_legacy_chunk_stats
+        )
+        self.connectivity_layout = "sorted"
+        """
+        Layout of newly created connectivity sets. ``sorted`` sets keep the rows of each
+        local chunk contiguous on every insert, ``log`` sets append their rows to a log
+        that is compacted into the sorted layout by :meth:`flush`.
+        """
 
     @on_main()
     @property
@@ -271,7 +292,7 @@ class HDF5Engine(Engine):
             del handle["placement"]
             del handle.attrs["chunk_size"]
             handle.require_group("placement")
-            self._write_chunk_stats(handle, {})
+            self._chunk_stats.write(handle, [])
 
     @on_main()
     def clear_connectivity(self):
@@ -279,12 +300,18 @@ class HDF5Engine(Engine):
             handle.require_group("connectivity")
             del handle["connectivity"]
             handle.require_group("connectivity")
-            stats = self._read_chunk_stats(handle)
-            stats = {
-                k: {"placed": v["placed"], "connections": {"inc": 0, "out": 0}}
-                for k, v in stats.items()
-            }
-            self._write_chunk_stats(handle, stats)
+            stats = self._chunk_stats.read(handle)
+            stats["inc"] = 0
+            stats["out"] = 0
+            self._chunk_stats.write(handle, stats)
+
+    @on_main()
+    def flush(self):
+        with self._handle("a") as handle:
+            for tag in ConnectivitySet.get_tags(self, handle=handle):
+                cs = ConnectivitySet(self, tag, handle=handle)
+                if not cs.is_compacted(handle=handle):
+                    cs.compact(handle=handle)
 
     @on_main()
     def get_chunk_stats(self):
@@ -292,10 +319,10 @@ class HDF5Engine(Engine):
             return self._read_chunk_stats(handle)
 
     def _read_chunk_stats(self, handle: h5py.File) -> object:
-        return json.loads(handle.attrs.get("chunks", "{}"))
-
-    def _write_chunk_stats(self, handle, stats):
-        handle.attrs["chunks"] = json.dumps(stats)
+        return {
+            str(id): {"placed": placed, "connections": {"inc": inc, "out": out}}
+            for id, placed, inc, out in self._chunk_stats.read(handle).tolist()
+        }
 
 
 def _get_default_root():
@@ -317,6 +344,17 @@ class StorageNode(IStorageNode):
     """
     Path to the HDF5 network storage file.
     """
+    connectivity_layout: str = config.attr(
+        type=types.in_(["sorted", "log"]), default="sorted"
+    )
+    """
+    Storage layout of the connectivity sets. The ``log`` layout appends connections
+    without moving previously written data, and compacts them once the connectivity
+    phase has finished.
+    """
+
+    def __boot__(self):
+        self.scaffold.storage._engine.connectivity_layout = self.connectivity_layout
 
 
 class HDF5SlowLockingWarning(ScaffoldWarning):
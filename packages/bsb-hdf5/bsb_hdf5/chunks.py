@@ -10,6 +10,7 @@ objects within them.
 """
 
 import contextlib
+import uuid
 
 import numpy as np
 from bsb import Chunk, chunklist
@@ -54,7 +55,8 @@ class ChunkLoader:
 
     @handles_handles("r")
     def get_all_chunks(self, handle=HANDLED):
-        chunks = list(handle[self._path].keys())
+        # Chunk groups are named after their id, other members are resource metadata.
+        chunks = [key for key in handle[self._path] if key.isdigit()]
         size = None
         if chunks:
             # If any chunks have been written, this HDF5 file is tagged with a
@@ -320,3 +322,133 @@ class ChunkedCollection(ChunkedProperty):
             key: super(type(self), self).load(key=key, handle=handle, **kwargs)
             for key in self.keys()
         }
+
+
+class ChunkTable:
+    """
+    Integer counters per chunk, stored as a structured dataset with a ``chunk`` id
+    column followed by one column per counter, sorted by chunk id. Rows of known chunks
+    are updated in place, so adding to the counters of a few chunks doesn't rewrite the
+    table. The id column is kept in memory, and only read again after the table is
+    rewritten, so that reading or updating a few chunks only reads their rows.
+
+    :param path: HDF5 path of the dataset.
+    :type path: str
+    :param columns: Names of the counter columns.
+    :type columns: Iterable[str]
+    :param legacy: Function that builds the table from older storage formats when the
+      dataset doesn't exist. It receives the handle and the empty table.
+    :type legacy: Callable
+    """
+
+    def __init__(self, path, columns, legacy=None):
+        self.path = path
+        self.columns = tuple(columns)
+        self.dtype = np.dtype([("chunk", np.int64)] + [(c, np.int64) for c in columns])
+        self.legacy = legacy
+        # Revision of the table and its chunk id column, see `_chunk_ids`.
+        self._ids = (None, None)
+
+    def read(self, handle):
+        """
+        Read the full table.
+
+        :rtype: numpy.ndarray
+        """
+        if self.path in handle:
+            return handle[self.path][()]
+        table = np.empty(0, dtype=self.dtype)
+        return self.legacy(handle, table) if self.legacy else table
+
+    def write(self, handle, table):
+        """
+        Replace the table.
+        """
+        table = np.sort(np.asarray(table, dtype=self.dtype), order="chunk")
+        if self.path in handle:
+            handle[self.path].resize(len(table), axis=0)
+            handle[self.path][:] = table
+        else:
+            handle.create_dataset(self.path, data=table, maxshape=(None,), chunks=(1024,))
+        # Any process that cached the previous id column has to read the new one.
+        handle[self.path].attrs["revision"] = uuid.uuid4().hex
+
+    def _chunk_ids(self, handle):
+        # The ids only change when the table is rewritten, which changes its revision.
+        dset = handle[self.path]
+        revision = dset.attrs.get("revision")
+        cached, ids = self._ids
+        if revision is None or revision != cached:
+            ids = dset.fields("chunk")[()]
+            self._ids = (revision, ids)
+        return ids
+
+    @staticmethod
+    def lookup(chunks, ids):
+        """
+        Find the rows of the given chunk ids in the sorted ``chunk`` column of a table.
+
+        :returns: Row index of each id, and whether the row exists.
+        :rtype: Tuple[numpy.ndarray[int], numpy.ndarray[bool]]
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(chunks):
+            return np.zeros(len(ids), dtype=int), np.zeros(len(ids), dtype=bool)
+        rows = np.minimum(np.searchsorted(chunks, ids), len(chunks) - 1)
+        return rows, chunks[rows] == ids
+
+    def get(self, handle, ids, column):
+        """
+        Read a counter of the given chunk ids. Missing chunks count as 0.
+        """
+        if self.path not in handle:
+            table = self.read(handle)
+            rows, found = self.lookup(table["chunk"], ids)
+            if not len(table):
+                return np.zeros(len(rows), dtype=int)
+            return np.where(found, table[column][rows], 0)
+        ids = np.asarray(ids, dtype=np.int64)
+        uniq, inverse = np.unique(ids, return_inverse=True)
+        rows, found = self.lookup(self._chunk_ids(handle), uniq)
+        values = np.zeros(len(uniq), dtype=np.int64)
+        if np.any(found):
+            # h5py reads fancy selections in increasing order, and `rows` is sorted.
+            values[found] = handle[self.path].fields(column)[rows[found]]
+        return values[inverse.reshape(-1)]
+
+    def add(self, handle, ids, **increments):
+        """
+        Add to the counters of the given chunk ids, inserting missing chunks.
+
+        :param ids: Chunk ids, may contain duplicates.
+        :param increments: Per column, an amount or array of amounts to add per id.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(ids):
+            return
+        uniq, inverse = np.unique(ids, return_inverse=True)
+        sums = {}
+        for column, amount in increments.items():
+            sums[column] = np.zeros(len(uniq), dtype=np.int64)
+            np.add.at(sums[column], inverse, np.broadcast_to(amount, ids.shape))
+        if self.path in handle:
+            # Look the chunks up on the id column, and if they all exist, only read and
+            # write their rows. `rows` is sorted since `uniq` is.
+            dset = handle[self.path]
+            rows, found = self.lookup(self._chunk_ids(handle), uniq)
+            if np.all(found):
+                updated = dset[rows]
+                for column, sum_ in sums.items():
+                    updated[column] += sum_
+                dset[rows] = updated
+                return
+        table = self.read(handle)
+        _, found = self.lookup(table["chunk"], uniq)
+        new = np.zeros(np.count_nonzero(~found), dtype=self.dtype)
+        new["chunk"] = uniq[~found]
+        table = np.concatenate((table, new))
+        table.sort(order="chunk")
+        rows, _ = self.lookup(table["chunk"], uniq)
+        for column, sum_ in sums.items():
+            table[column][rows] += sum_
+        self.write(handle, table)
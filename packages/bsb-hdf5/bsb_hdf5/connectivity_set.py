@@ -1,10 +1,12 @@
 import json
+from functools import partial
 
 import errr
 import numpy as np
-from bsb import CellType, Chunk, DatasetNotFoundError, chunklist
+from bsb import AdjacencyIndex, CellType, Chunk, DatasetNotFoundError, chunklist
 from bsb import ConnectivitySet as IConnectivitySet
 
+from .chunks import ChunkTable
 from .resource import (
     HANDLED,
     Resource,
@@ -14,6 +16,7 @@ from .resource import (
 )
 
 _root = "/connectivity/"
+_layouts = ("sorted", "log")
 
 
 class LocationOutOfBoundsError(Exception):
@@ -39,6 +42,11 @@ class ConnectivitySet(Resource, IConnectivitySet):
         self.pre_type = None
         self.post_type = None
         super().__init__(engine, _root + tag)
+        self._counts = ChunkTable(
+            self._path + "/chunk_counts",
+            ("inc", "out"),
+            legacy=partial(_legacy_counts, tag),
+        )
         if not self.exists(engine, tag, handle=handle):
             raise DatasetNotFoundError(
                 f"ConnectivitySet '{tag}' does not exist. Choose from: "
@@ -46,6 +54,7 @@ class ConnectivitySet(Resource, IConnectivitySet):
             )
         self.pre_type_name = handle[self._path].attrs["pre"]
         self.post_type_name = handle[self._path].attrs["post"]
+        self.layout = handle[self._path].attrs.get("layout", "sorted")
 
     def __len__(self):
         return sum(len(data[0]) for _, _, _, data in self.flat_iter_connections("inc"))
@@ -60,11 +69,15 @@ class ConnectivitySet(Resource, IConnectivitySet):
 
     @classmethod
     @handles_class_handles("a")
-    def create(cls, engine, pre_type, post_type, tag=None, handle=HANDLED):
+    def create(cls, engine, pre_type, post_type, tag=None, layout=None, handle=HANDLED):
         """
         Create the structure for this connectivity set in the HDF5 file.
 
         Connectivity sets are stored under ``/connectivity/<tag>``.
+
+        :param layout: Storage layout of the set, either ``sorted`` or ``log``. Defaults
+          to the engine's :attr:`~.HDF5Engine.connectivity_layout`.
+        :type layout: str
         """
         if tag is None:
             tag = f"{pre_type.name}_to_{post_type.name}"
@@ -72,6 +85,7 @@ class ConnectivitySet(Resource, IConnectivitySet):
         g = handle.create_group(path)
         g.attrs["pre"] = pre_type.name
         g.attrs["post"] = post_type.name
+        g.attrs["layout"] = _check_layout(layout or engine.connectivity_layout)
         g.require_group(f"{path}/inc")
         g.require_group(f"{path}/out")
         cs = cls(engine, tag, handle=handle)
@@ -99,7 +113,7 @@ class ConnectivitySet(Resource, IConnectivitySet):
 
     @classmethod
     @handles_class_handles("a")
-    def require(cls, engine, pre_type, post_type, tag=None, handle=HANDLED):
+    def require(cls, engine, pre_type, post_type, tag=None, layout=None, handle=HANDLED):
         """
         Get or create a :class:`~.connectivity_set.ConnectivitySet`.
 
@@ -112,6 +126,10 @@ class ConnectivitySet(Resource, IConnectivitySet):
         :param tag: Tag to store the set under. Defaults to
           ``{pre_type.name}_to_{post_type.name}``.
         :type tag: str
+        :param layout: Storage layout of the set, if it has to be created. Either
+          ``sorted`` or ``log``, defaults to the engine's
+          :attr:`~.HDF5Engine.connectivity_layout`.
+        :type layout: str
         :returns: Existing or new connectivity set.
         :rtype: :class:`~.connectivity_set.ConnectivitySet`
         """
@@ -129,6 +147,7 @@ class ConnectivitySet(Resource, IConnectivitySet):
                 "Given and stored type mismatch:"
                 + f" {post_type.name} vs {g.attrs['post']}"
             )
+        g.attrs.setdefault("layout", _check_layout(layout or engine.connectivity_layout))
         g.require_group(path + "/inc")
         g.require_group(path + "/out")
         cs = cls(engine, tag, handle=handle)
@@ -140,18 +159,19 @@ class ConnectivitySet(Resource, IConnectivitySet):
     def clear(self, handle=HANDLED):
         path = _root + self.tag
         g = handle.require_group(path)
-        stats = self._engine._read_chunk_stats(handle)
-        for chunk, data in g["inc"].items():
-            stats[chunk]["connections"]["inc"] -= len(data["global_locs"])
-        for chunk, data in g["out"].items():
-            stats[chunk]["connections"]["out"] -= len(data["global_locs"])
-        self._engine._write_chunk_stats(handle, stats)
+        stats = self._counts.read(handle)
+        self._engine._chunk_stats.add(
+            handle, stats["chunk"], inc=-stats["inc"], out=-stats["out"]
+        )
+        self._counts.write(handle, [])
         del g["inc"]
         del g["out"]
+        if "log" in g:
+            del g["log"]
+        if "adjacency" in g:
+            del g["adjacency"]
         g.create_group("inc")
         g.create_group("out")
-        g.attrs["len"] = 0
-        g.attrs["chunks"] = "{}"
 
     @handles_handles("a")
     def connect(self, pre_set, post_set, src_locs, dest_locs, handle=HANDLED):
@@ -262,19 +282,28 @@ class ConnectivitySet(Resource, IConnectivitySet):
         return chunks, ptrs[sorted]
 
     def _get_insert_pointers(self, group, chunk):
-        chunks = [Chunk(t, (0, 0, 0)) for t in group.attrs["chunk_list"]]
+        # Find the chunk among the raw coordinates, instead of creating a `Chunk` for
+        # every chunk in the list, which dominates reading blocks one by one.
+        coords = np.asarray(group.attrs["chunk_list"]).reshape(-1, 3)
         iptr = group.attrs[str(chunk.id)]
-        idx = chunks.index(chunk)
+        idx = np.flatnonzero((coords == np.asarray(chunk)).all(axis=1))[0]
         # Get the pointer of the next chunk or None if last chunk
-        eptr = None if idx + 1 == len(chunks) else group.attrs[str(chunks[idx + 1].id)]
+        if idx + 1 == len(coords):
+            eptr = None
+        else:
+            eptr = group.attrs[str(Chunk(coords[idx + 1], (0, 0, 0)).id)]
         return iptr, eptr
 
     @handles_handles("a")
     def chunk_connect(self, src_chunk, dst_chunk, src_locs, dst_locs, handle=HANDLED):
         if len(src_locs) != len(dst_locs):
             raise ValueError("Location matrices must be of same length.")
-        self._insert("inc", dst_chunk, src_chunk, dst_locs, src_locs, handle)
-        self._insert("out", src_chunk, dst_chunk, src_locs, dst_locs, handle)
+        if "adjacency" in handle[self._path]:
+            # The connections change, so the adjacency index has to be rebuilt.
+            del handle[self._path]["adjacency"]
+        insert = self._append_segment if self.layout == "log" else self._insert
+        insert("inc", dst_chunk, src_chunk, dst_locs, src_locs, handle)
+        insert("out", src_chunk, dst_chunk, src_locs, dst_locs, handle)
         self._track_add(handle, src_chunk, dst_chunk, len(src_locs))
 
     def _insert(self, tag, local_, global_, lloc, gloc, handle):
@@ -308,44 +337,230 @@ class ConnectivitySet(Resource, IConnectivitySet):
         gbl_ds[iptr:eptr] = np.concatenate((gbl_ds[iptr : (eptr - new_rows)], gloc))
         gbl_ds[eptr:] = gbl_end
 
-    def _track_add(self, handle, src_chunk, dst_chunk, count):
-        # Track addition in global chunk stats
-        global_stats = self._engine._read_chunk_stats(handle)
-        for tag, chunk in (("inc", dst_chunk), ("out", src_chunk)):
-            id = str(chunk.id)
-            chunk_stats = global_stats.setdefault(
-                id, {"placed": 0, "connections": {"inc": 0, "out": 0}}
+    def _append_segment(self, tag, local_, global_, lloc, gloc, handle):
+        # Log-structured counterpart of `_insert`: the rows are appended at the end of
+        # the log, and a segment row of the local chunk tags them with their global
+        # chunk. The segments are kept per local chunk, so that reading a local chunk
+        # doesn't have to scan the segments of the others.
+        grp = handle.require_group(f"{self._path}/log/{tag}")
+        if "local_locs" not in grp:
+            for ds in ("local_locs", "global_locs"):
+                grp.create_dataset(
+                    ds, shape=(0, 3), dtype=int, chunks=(1024, 3), maxshape=(None, 3)
+                )
+        seg_grp = grp.require_group("segments")
+        if str(local_.id) not in seg_grp:
+            seg_grp.create_dataset(
+                str(local_.id),
+                shape=(0, 3),
+                dtype=int,
+                chunks=(64, 3),
+                maxshape=(None, 3),
             )
-            chunk_stats["connections"][tag] += count
-            # Track addition in connectivity set
-            group = handle[self._path]
-            if tag == "out":
-                group.attrs["len"] = group.attrs.get("len", 0) + count
-            conn_stats = json.loads(group.attrs.get("chunks", "{}"))
-            conn_stats.setdefault(id, {"inc": 0, "out": 0})[tag] += count
-            group.attrs["chunks"] = json.dumps(conn_stats)
-        self._engine._write_chunk_stats(handle, global_stats)
+        seg_ds = seg_grp[str(local_.id)]
+        lcl_ds = grp["local_locs"]
+        gbl_ds = grp["global_locs"]
+        start = len(lcl_ds)
+        end = start + len(lloc)
+        lcl_ds.resize(end, axis=0)
+        gbl_ds.resize(end, axis=0)
+        lcl_ds[start:end] = lloc
+        gbl_ds[start:end] = gloc
+        seg_ds.resize(len(seg_ds) + 1, axis=0)
+        seg_ds[-1] = (global_.id, start, len(lloc))
+
+    def _get_log_chunks(self, direction, handle):
+        try:
+            return [int(k) for k in handle[f"{self._path}/log/{direction}/segments"]]
+        except KeyError:
+            return []
+
+    def _get_log_segments(self, direction, local_, handle):
+        try:
+            return handle[f"{self._path}/log/{direction}/segments/{local_.id}"][()]
+        except KeyError:
+            return np.empty((0, 3), dtype=int)
+
+    def _load_log_blocks(self, direction, local_, handle, global_=None):
+        # Collect the logged rows of a local chunk per global chunk, in the order in
+        # which the global chunks were first logged, and the rows in append order.
+        # Only the rows of `global_` are read, if given.
+        segments = self._get_log_segments(direction, local_, handle)
+        if global_ is not None:
+            segments = segments[segments[:, 0] == global_.id]
+        if not len(segments):
+            return {}
+        grp = handle[f"{self._path}/log/{direction}"]
+        lcl_ds = grp["local_locs"]
+        gbl_ds = grp["global_locs"]
+        blocks = {}
+        for global_id, start, count in segments:
+            lblocks, gblocks = blocks.setdefault(int(global_id), ([], []))
+            lblocks.append(lcl_ds[start : start + count])
+            gblocks.append(gbl_ds[start : start + count])
+        return {
+            Chunk.from_id(global_id, None): (
+                _better_than_concat(lblocks, 3, int),
+                _better_than_concat(gblocks, 3, int),
+            )
+            for global_id, (lblocks, gblocks) in blocks.items()
+        }
+
+    def _load_sorted_blocks(self, direction, local_, handle):
+        try:
+            local_grp = handle[self._path][f"{direction}/{local_.id}"]
+        except KeyError:
+            return {}
+        chunks, ptrs = self._get_sorted_pointers(local_grp)
+        ends = np.append(ptrs[1:], len(local_grp["local_locs"]))
+        local_locs = local_grp["local_locs"][()]
+        global_locs = local_grp["global_locs"][()]
+        return {
+            chunk: (local_locs[start:end], global_locs[start:end])
+            for chunk, start, end in zip(chunks, ptrs, ends, strict=True)
+        }
+
+    @handles_handles("r")
+    def is_compacted(self, handle=HANDLED):
+        """
+        Check whether all the connections of the set are stored in the sorted layout,
+        e.g. whether there are no more pending log segments to compact.
+
+        :returns: Whether the set is compacted.
+        :rtype: bool
+        """
+        return not any(self._get_log_chunks(d, handle) for d in ("inc", "out"))
+
+    @handles_handles("a")
+    def compact(self, handle=HANDLED):
+        """
+        Move the pending log segments of a ``log`` layout set into the sorted layout.
+        Every local chunk is rewritten once, with its connections grouped per global
+        chunk. Reading the connections yields the same data before and after compaction.
+        """
+        for direction in ("inc", "out"):
+            for local_id in self._get_log_chunks(direction, handle):
+                local_ = Chunk.from_id(local_id, None)
+                blocks = self._load_sorted_blocks(direction, local_, handle)
+                for chunk, (lloc, gloc) in self._load_log_blocks(
+                    direction, local_, handle
+                ).items():
+                    if chunk in blocks:
+                        lprev, gprev = blocks[chunk]
+                        lloc = np.concatenate((lprev, lloc))
+                        gloc = np.concatenate((gprev, gloc))
+                    blocks[chunk] = (lloc, gloc)
+                self._write_sorted_blocks(direction, local_, blocks, handle)
+        if "log" in handle[self._path]:
+            del handle[self._path]["log"]
+
+    def _write_sorted_blocks(self, direction, local_, blocks, handle):
+        path = f"{self._path}/{direction}/{local_.id}"
+        if path in handle:
+            del handle[path]
+        grp = handle.create_group(path)
+        ptr = 0
+        for chunk, (lloc, _) in blocks.items():
+            grp.attrs[str(chunk.id)] = ptr
+            ptr += len(lloc)
+        grp.attrs["chunk_list"] = list(blocks.keys())
+        for i, tag in enumerate(("local_locs", "global_locs")):
+            grp.create_dataset(
+                tag,
+                data=_better_than_concat([b[i] for b in blocks.values()], 3, int),
+                dtype=int,
+                chunks=(1024, 3),
+                maxshape=(None, 3),
+            )
+
+    def _track_add(self, handle, src_chunk, dst_chunk, count):
+        # Track addition in global chunk stats and in the count table of this set
+        ids = [dst_chunk.id, src_chunk.id]
+        self._engine._chunk_stats.add(handle, ids, inc=[count, 0], out=[0, count])
+        self._counts.add(handle, ids, inc=[count, 0], out=[0, count])
 
     @handles_handles("r")
     def get_chunk_stats(self, handle=HANDLED):
-        return json.loads(handle[self._path].attrs.get("chunks", "{}"))
+        return {
+            str(id): {"inc": inc, "out": out}
+            for id, inc, out in self._counts.read(handle).tolist()
+        }
+
+    def get_adjacency(self, direction="out"):
+        """
+        Get the compressed sparse row index of the cells connected by this set. The
+        index is built once, stored under ``/connectivity/<tag>/adjacency/<direction>``
+        and rebuilt after connections are added to or cleared from the set, or after
+        cells are placed or cleared. Only the row pointers are loaded in memory; the
+        neighbours are read from the file on demand.
+
+        :param direction: Either ``out`` or ``inc``.
+        :type direction: str
+        :rtype: ~bsb.storage.interfaces.AdjacencyIndex
+        """
+        if not self._has_adjacency(direction):
+            self._require_adjacency(direction, promote_from_read=True)
+        return StoredAdjacencyIndex(self, direction)
+
+    @handles_handles("r")
+    def _has_adjacency(self, direction, handle=HANDLED):
+        path = f"{self._path}/adjacency/{direction}"
+        if path not in handle:
+            return False
+        # The cell ids of the index are outdated if the placement changed.
+        stamp = list(handle[path].attrs.get("placement", []))
+        return stamp == self._get_placement_revisions(handle)
+
+    @handles_handles("a")
+    def _require_adjacency(self, direction, handle=HANDLED):
+        # Other processes may have stored the index while we waited for the write lock.
+        if not self._has_adjacency(direction, handle=handle):
+            self._store_adjacency(AdjacencyIndex.build(self, direction), handle=handle)
+
+    @handles_handles("a")
+    def _store_adjacency(self, adjacency, handle=HANDLED):
+        path = f"{self._path}/adjacency/{adjacency.direction}"
+        if path in handle:
+            del handle[path]
+        grp = handle.create_group(path)
+        grp.attrs["placement"] = self._get_placement_revisions(handle)
+        grp.create_dataset("indptr", data=adjacency.indptr, dtype=int)
+        grp.create_dataset("indices", data=adjacency.indices, dtype=int)
+
+    def _get_placement_revisions(self, handle):
+        return [
+            ct.get_placement_set()._get_revision(handle=handle)
+            for ct in (self.pre_type, self.post_type)
+        ]
+
+    @handles_handles("r")
+    def _load_adjacency(self, direction, key, starts=None, ends=None, handle=HANDLED):
+        ds = handle[f"{self._path}/adjacency/{direction}/{key}"]
+        if starts is None:
+            return ds[()]
+        return _better_than_concat(
+            [ds[start:end] for start, end in zip(starts, ends, strict=True)], 1, int
+        ).reshape(-1)
 
     @handles_handles("r")
     def get_local_chunks(self, direction, handle=HANDLED):
-        return chunklist(
-            Chunk.from_id(int(k), None) for k in handle[self._path][direction]
-        )
+        ids = {int(k) for k in handle[self._path][direction]}
+        ids.update(self._get_log_chunks(direction, handle))
+        return chunklist(Chunk.from_id(id_, None) for id_ in ids)
 
     @handles_handles("r")
     def get_global_chunks(self, direction, local_, handle=HANDLED):
+        logged = self._get_log_segments(direction, local_, handle)[:, 0]
+        chunks = [Chunk.from_id(int(id_), None) for id_ in np.unique(logged)]
         try:
             chunk_group = handle[self._path][f"{direction}/{local_.id}"]
         except KeyError:
-            # The local chunk does not exist, create empty chunklist.
-            return chunklist(())
+            # The local chunk does not exist, only return the logged chunks.
+            return chunklist(chunks)
         else:
             # The local chunk exists, return the list of chunks it has data of.
-            return chunklist(Chunk(k, None) for k in chunk_group.attrs["chunk_list"])
+            chunks.extend(Chunk(k, None) for k in chunk_group.attrs["chunk_list"])
+            return chunklist(chunks)
 
     def nested_iter_connections(self, direction=None, local_=None, global_=None):
         """
@@ -433,10 +648,17 @@ class ConnectivitySet(Resource, IConnectivitySet):
             start, end = self._get_insert_pointers(local_grp, global_)
         except KeyError:
             # If a local or global chunk isn't found, return empty data.
-            return (np.empty((0, 3), dtype=int), np.empty((0, 3), dtype=int))
-
-        idx = slice(start, end)
-        return (local_grp["local_locs"][idx], local_grp["global_locs"][idx])
+            block = (np.empty((0, 3), dtype=int), np.empty((0, 3), dtype=int))
+        else:
+            idx = slice(start, end)
+            block = (local_grp["local_locs"][idx], local_grp["global_locs"][idx])
+        if self.layout == "log":
+            logged = self._load_log_blocks(direction, local_, handle, global_).get(
+                global_
+            )
+            if logged is not None:
+                block = tuple(np.concatenate(d) for d in zip(block, logged, strict=True))
+        return block
 
     @handles_handles("r")
     def load_local_connections(self, direction, local_, handle=HANDLED):
@@ -455,6 +677,24 @@ class ConnectivitySet(Resource, IConnectivitySet):
           return value.
         :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
         """
+        if self.layout == "log" and not self.is_compacted(handle=handle):
+            blocks = self._load_sorted_blocks(direction, local_, handle)
+            for chunk, (lloc, gloc) in self._load_log_blocks(
+                direction, local_, handle
+            ).items():
+                lprev, gprev = blocks.get(chunk, (lloc[:0], gloc[:0]))
+                blocks[chunk] = (
+                    np.concatenate((lprev, lloc)),
+                    np.concatenate((gprev, gloc)),
+                )
+            if not blocks:
+                raise KeyError(f"No connections in local chunk {local_.id}.")
+            col = np.repeat([c.id for c in blocks], [len(b[0]) for b in blocks.values()])
+            return (
+                _better_than_concat([b[0] for b in blocks.values()], 3, int),
+                col,
+                _better_than_concat([b[1] for b in blocks.values()], 3, int),
+            )
         local_grp = handle[self._path][f"{direction}/{local_.id}"]
         global_locs = local_grp["global_locs"][()]
         chunks, ptrs = self._get_sorted_pointers(local_grp)
@@ -462,6 +702,25 @@ class ConnectivitySet(Resource, IConnectivitySet):
         return local_grp["local_locs"][()], col, global_locs
 
 
+class StoredAdjacencyIndex(AdjacencyIndex):
+    """
+    Adjacency index stored in the HDF5 file, that reads the neighbours of the requested
+    cells only.
+    """
+
+    def __init__(self, cs, direction):
+        self._cs = cs
+        self.direction = direction
+        self.indptr = cs._load_adjacency(direction, "indptr")
+
+    @property
+    def indices(self):
+        return self._cs._load_adjacency(self.direction, "indices")
+
+    def _load_rows(self, starts, ends):
+        return self._cs._load_adjacency(self.direction, "indices", starts, ends)
+
+
 def _better_than_concat(arrs, cols, dtype):
     if not len(arrs):
         return np.empty((0, cols), dtype=dtype)
@@ -528,6 +787,15 @@ class CSIterator:
             return iter(chunklist(global_))
 
 
+def _check_layout(layout):
+    if layout not in _layouts:
+        raise ValueError(
+            f"Unknown connectivity layout '{layout}'. Choose from: "
+            + errr.quotejoin(_layouts)
+        )
+    return layout
+
+
 def _point_to_2d(arr):
     arr = np.array(arr, copy=False, dtype=int)
     if arr.ndim == 1:
@@ -536,3 +804,10 @@ def _point_to_2d(arr):
         return ret
     else:
         return arr
+
+
+def _legacy_counts(tag, handle, table):
+    # Files written before the count table kept the counts in a JSON attribute.
+    stats = json.loads(handle[_root + tag].attrs.get("chunks", "{}"))
+    rows = [(int(id), s["inc"], s["out"]) for id, s in stats.items()]
+    return np.sort(np.array(rows, dtype=table.dtype), order="chunk")
@@ -1,9 +1,8 @@
-import itertools
 import json
 
+import h5py
 import numpy as np
 from bsb import (
-    Branch,
     MissingMorphologyError,
     Morphology,
     MorphologyRepositoryError,
@@ -15,6 +14,8 @@ from bsb._encoding import EncodedLabels
 from .resource import HANDLED, Resource, handles_handles
 
 _root = "/morphologies"
+_meta_table = "/morphology_table"
+_legacy_meta = "morphology_meta"
 
 
 class MetaEncoder(json.JSONEncoder):
@@ -69,34 +70,95 @@ class MorphologyRepository(Resource, IMorphologyRepository):
 
     @handles_handles("r")
     def get_meta(self, name, handle=HANDLED):
-        all_meta = self.get_all_meta(handle=handle)
-        try:
-            meta = all_meta[name]
-        except KeyError:
-            raise MissingMorphologyError(
-                f"`{self._engine.root}` contains no morphology named `{name}`."
-            ) from None
-        return meta
+        if _meta_table in handle:
+            row = self._find_rows(handle, [name])[name]
+            if row is not None:
+                return _decode_meta(handle[f"{_meta_table}/meta"].asstr()[row])
+        elif name in (all_meta := self.get_all_meta(handle=handle)):
+            return all_meta[name]
+        raise MissingMorphologyError(
+            f"`{self._engine.root}` contains no morphology named `{name}`."
+        )
 
     @handles_handles("r")
     def get_all_meta(self, handle=HANDLED):
-        if "morphology_meta" not in handle:
+        if _meta_table in handle:
+            names = handle[f"{_meta_table}/name"].asstr()[()]
+            metas = handle[f"{_meta_table}/meta"].asstr()[()]
+            return {n: _decode_meta(m) for n, m in zip(names, metas, strict=True)}
+        elif _legacy_meta in handle:
+            # Files written before the metadata table stored a single JSON object.
+            return json.loads(handle[_legacy_meta][()], object_hook=meta_object_hook)
+        else:
             return {}
-        return json.loads(handle["morphology_meta"][()], object_hook=meta_object_hook)
 
     @handles_handles("a")
     def update_all_meta(self, meta, handle=HANDLED):
-        all_meta = self.get_all_meta(handle=handle)
-        all_meta.update(meta)
-        self.set_all_meta(all_meta, handle=handle)
+        if _meta_table not in handle:
+            self.set_all_meta(self.get_all_meta(handle=handle) | meta, handle=handle)
+            return
+        rows = self._find_rows(handle, meta.keys())
+        meta_ds = handle[f"{_meta_table}/meta"]
+        # Overwrite the rows of known morphologies, append the new ones.
+        for name, row in rows.items():
+            if row is not None:
+                meta_ds[row] = _encode_meta(meta[name])
+        new = [name for name, row in rows.items() if row is None]
+        if new:
+            n = len(meta_ds)
+            for key, values in (
+                ("name", new),
+                ("meta", [_encode_meta(meta[name]) for name in new]),
+            ):
+                ds = handle[f"{_meta_table}/{key}"]
+                ds.resize(n + len(new), axis=0)
+                ds[n:] = values
+            self._set_rows(handle, new, n)
 
     @handles_handles("a")
     def set_all_meta(self, all_meta, handle=HANDLED):
-        if "morphology_meta" in handle:
-            del handle["morphology_meta"]
-        handle.create_dataset(
-            "morphology_meta", data=json.dumps(all_meta, cls=MetaEncoder)
-        )
+        if _meta_table in handle:
+            del handle[_meta_table]
+        if _legacy_meta in handle:
+            del handle[_legacy_meta]
+        table = handle.create_group(_meta_table)
+        for key, values in (
+            ("name", list(all_meta.keys())),
+            ("meta", [_encode_meta(m) for m in all_meta.values()]),
+        ):
+            table.create_dataset(
+                key, data=values, dtype=h5py.string_dtype(), maxshape=(None,)
+            )
+        self._set_rows(handle, all_meta.keys(), 0)
+
+    def _find_rows(self, handle, names):
+        # Each stored morphology points to its metadata row, or has no row yet if it has
+        # no pointer. Only metadata of names without a morphology group, or with a stale
+        # pointer, has to be looked up in the full name column.
+        me = handle[self._path]
+        name_ds = handle[f"{_meta_table}/name"]
+        rows = {}
+        lookup = []
+        for name in names:
+            row = me[name].attrs.get("meta_row") if name in me else None
+            if row is not None and row < len(name_ds) and name_ds.asstr()[row] == name:
+                rows[name] = int(row)
+            else:
+                rows[name] = None
+                if name not in me or row is not None:
+                    lookup.append(name)
+        if lookup:
+            column = name_ds.asstr()[()]
+            for name in lookup:
+                if len(found := np.flatnonzero(column == name)):
+                    rows[name] = int(found[0])
+        return rows
+
+    def _set_rows(self, handle, names, start):
+        me = handle[self._path]
+        for row, name in enumerate(names, start=start):
+            if name in me:
+                me[name].attrs["meta_row"] = row
 
     @handles_handles("r")
     def all(self, handle=HANDLED):
@@ -118,75 +180,112 @@ class MorphologyRepository(Resource, IMorphologyRepository):
             raise MissingMorphologyError(
                 f"`{self._engine.root}` contains no morphology named `{name}`."
             ) from None
-        data = root["data"][()]
-        points = data[:, :3].copy()
-        radii = data[:, 3].copy()
+        if "points" in root:
+            datasets = [root[k] for k in ("points", "radii", "labels", "properties")]
+            points, radii, labels, props = _map_datasets(handle, datasets) or [
+                ds[()] for ds in datasets
+            ]
+            labelsets = root["labels"].attrs["labels"]
+            prop_names = root["properties"].attrs["names"]
+        else:
+            # Files written before the compiled layout stored all point data in the
+            # columns of a single dataset.
+            data = root["data"][()]
+            points = data[:, :3].copy()
+            radii = data[:, 3].copy()
+            labels = data[:, 4].astype(int)
+            props = np.rollaxis(data[:, 5:], 1)
+            labelsets = root["data"].attrs["labels"]
+            prop_names = root["data"].attrs["properties"]
         # Turns the forced JSON str keys back into ints
-        labelsets = {
-            int(k): v for k, v in json.loads(root["data"].attrs["labels"]).items()
-        }
-        labels = EncodedLabels(
-            len(points), buffer=data[:, 4].astype(int), labels=labelsets
-        )
-        prop_names = root["data"].attrs["properties"]
-        props = dict(zip(prop_names, np.rollaxis(data[:, 5:], 1), strict=False))
-        parents = {-1: None}
-        branch_id = itertools.count()
-        roots = []
-        ptr = 0
-        for nptr, p in root["graph"][()]:
-            radii[ptr:nptr]
-            labels[ptr:nptr]
-            {k: v[ptr:nptr] for k, v in props.items()}
-            branch = Branch(
-                points[ptr:nptr],
-                radii[ptr:nptr],
-                labels[ptr:nptr],
-                {k: v[ptr:nptr] for k, v in props.items()},
-            )
-            parent = parents.get(p)
-            parents[next(branch_id)] = branch
-            if parent:
-                parent.attach_child(branch)
-            else:
-                roots.append(branch)
-            ptr = nptr
+        labelsets = {int(k): v for k, v in json.loads(labelsets).items()}
+        labels = EncodedLabels(len(points), buffer=labels, labels=labelsets)
+        props = dict(zip(prop_names, props, strict=True))
+        graph = root["graph"][()].reshape(-1, 2)
         if preloaded_meta is None:
             meta = self.get_meta(name, handle=handle)
         else:
             meta = preloaded_meta
-        morpho = Morphology(roots, meta, shared_buffers=(points, radii, labels, props))
-        assert morpho._check_shared(), "Morpho read with unshareable buffers"
-        return morpho
+        return Morphology.from_buffers(
+            (points, radii, labels, props), graph[:, 0], graph[:, 1], meta
+        )
 
     @handles_handles("a")
     def save(self, name, morphology, overwrite=False, update_meta=True, handle=HANDLED):
+        return self.save_many(
+            [name],
+            [morphology],
+            overwrite=overwrite,
+            update_meta=update_meta,
+            handle=handle,
+        )[0]
+
+    @handles_handles("a")
+    def save_many(
+        self, names, morphologies, overwrite=False, update_meta=True, handle=HANDLED
+    ):
+        """
+        Store several morphologies in a single write, and update their metadata at once.
+
+        :param names: Keys to store the morphologies under.
+        :type names: list[str]
+        :param morphologies: Morphologies to store.
+        :type morphologies: list[bsb.morphologies.Morphology]
+        :param overwrite: Overwrite any stored morphology that already exists under one
+          of the names.
+        :type overwrite: bool
+        :param update_meta: Store the metadata of the morphologies. If ``False``, they
+          are incompletely stored until their metadata is stored with
+          :meth:`update_all_meta`.
+        :type update_meta: bool
+        :returns: The stored morphologies
+        :rtype: list[~bsb.storage.interfaces.StoredMorphology]
+        """
+        names = list(names)
+        morphologies = list(morphologies)
+        if len(names) != len(morphologies):
+            raise ValueError("Each morphology needs exactly one name.")
+        stored = [
+            self._save_data(name, morphology, overwrite, handle)
+            for name, morphology in zip(names, morphologies, strict=True)
+        ]
+        if update_meta:
+            self.update_all_meta({sm.name: sm.get_meta() for sm in stored}, handle=handle)
+        return stored
+
+    def _save_data(self, name, morphology, overwrite, handle):
         me = handle[self._path]
-        if self.has(name):
+        row = None
+        if name in me:
             if overwrite:
-                self.remove(name)
+                row = me[name].attrs.get("meta_row")
+                del me[name]
             else:
                 root = self._engine.root
                 raise MorphologyRepositoryError(
                     f"A morphology called '{name}' already exists in `{root}`."
                 )
         root = me.create_group(name)
+        if row is not None:
+            # Keep pointing to the metadata row of the overwritten morphology.
+            root.attrs["meta_row"] = row
         # Optimizing a morphology goes through the same steps as what is required
         # to save it to disk; plus, now the user's object is optimized :)
         morphology.optimize()
         branches = morphology.branches
-        n_prop = len(morphology._shared._prop)
-        data = np.empty((len(morphology), 5 + n_prop))
-        data[:, :3] = morphology._shared._points
-        data[:, 3] = morphology._shared._radii
-        data[:, 4] = morphology._shared._labels
-        for i, prop in enumerate(morphology._shared._prop.values()):
-            data[:, 5 + i] = prop
-        dds = root.create_dataset("data", data=data)
-        dds.attrs["labels"] = json.dumps(
-            {k: list(v) for k, v in morphology._shared._labels.labels.items()}
+        shared = morphology._shared
+        # Store each buffer contiguously, so that `load` can map them from the file.
+        root.create_dataset("points", data=shared._points, dtype=float)
+        root.create_dataset("radii", data=shared._radii, dtype=float)
+        lds = root.create_dataset("labels", data=shared._labels, dtype=int)
+        lds.attrs["labels"] = json.dumps(
+            {k: list(v) for k, v in shared._labels.labels.items()}
         )
-        dds.attrs["properties"] = [*morphology._shared._prop.keys()]
+        props = np.empty((len(shared._prop), len(morphology)))
+        for i, prop in enumerate(shared._prop.values()):
+            props[i] = prop
+        pds = root.create_dataset("properties", data=props)
+        pds.attrs["names"] = [*shared._prop.keys()]
         graph = np.empty((len(branches), 2))
         parents = {None: -1}
         ptr = 0
@@ -202,10 +301,6 @@ class MorphologyRepository(Resource, IMorphologyRepository):
             morphology.meta["mdc"] = np.max(morphology._shared._points, axis=0)
         else:
             morphology.meta["ldc"] = morphology.meta["mdc"] = np.nan
-        if update_meta:
-            all_meta = self.get_all_meta(handle=handle)
-            all_meta[name] = morphology.meta
-            self.set_all_meta(all_meta)
         return StoredMorphology(name, lambda: morphology, morphology.meta)
 
     @handles_handles("a")
@@ -214,3 +309,39 @@ class MorphologyRepository(Resource, IMorphologyRepository):
             del handle[f"{self._path}/{name}"]
         except KeyError:
             raise MorphologyRepositoryError(f"'{name}' doesn't exist.") from None
+        all_meta = self.get_all_meta(handle=handle)
+        if all_meta.pop(name, None) is not None:
+            self.set_all_meta(all_meta, handle=handle)
+
+
+def _map_datasets(handle, datasets):
+    # Map the datasets of a file opened read only into memory, instead of reading them.
+    # The mapping is copy-on-write, so changes to the arrays stay private to them.
+    if handle.mode != "r" or handle.driver != "sec2":
+        return None
+    offsets = {ds.name: ds.id.get_offset() for ds in datasets if ds.size}
+    if (
+        not offsets
+        or any(ds.chunks is not None for ds in datasets)
+        or None in offsets.values()
+    ):
+        return None
+    start = min(offsets.values())
+    end = max(offsets[ds.name] + ds.nbytes for ds in datasets if ds.size)
+    mm = np.memmap(
+        handle.filename, dtype=np.uint8, mode="c", offset=start, shape=end - start
+    )
+    return [
+        np.ndarray(ds.shape, ds.dtype, buffer=mm, offset=offsets[ds.name] - start)
+        if ds.size
+        else np.empty(ds.shape, dtype=ds.dtype)
+        for ds in datasets
+    ]
+
+
+def _encode_meta(meta):
+    return json.dumps(meta, cls=MetaEncoder)
+
+
+def _decode_meta(meta):
+    return json.loads(meta, object_hook=meta_object_hook)
@@ -1,5 +1,6 @@
 import itertools
 import json
+import uuid
 from functools import partial
 
 import numpy as np
@@ -17,7 +18,7 @@ from bsb import (
 from bsb import PlacementSet as IPlacementSet
 from bsb._encoding import EncodedLabels
 
-from .chunks import ChunkedCollection, ChunkedProperty, ChunkLoader
+from .chunks import ChunkedCollection, ChunkedProperty, ChunkLoader, ChunkTable
 from .resource import (
     HANDLED,
     Resource,
@@ -91,6 +92,9 @@ class PlacementSet(
         Resource.__init__(self, engine, _root + tag)
         IPlacementSet.__init__(self, engine, cell_type)
         ChunkLoader.__init__(self)
+        self._counts = ChunkTable(
+            self._path + "/chunk_counts", ("count",), legacy=partial(_legacy_counts, tag)
+        )
         self._labels = None
         self._morphology_labels = None
         if not self.exists(engine, cell_type):
@@ -249,8 +253,28 @@ class PlacementSet(
     def __len__(self):
         if self._labels:
             return np.sum(self._labels_chunks.load().get_mask(self._labels))
+        elif self._chunks:
+            return int(np.sum(self.count_in_chunks(self._chunks)))
         else:
-            return len(self._position_chunks.load())
+            return int(np.sum(self._read_counts()["count"]))
+
+    @handles_handles("r")
+    def _read_counts(self, handle=HANDLED):
+        return self._counts.read(handle)
+
+    @handles_handles("r")
+    def count_in_chunks(self, chunks, handle=HANDLED):
+        """
+        Return the amount of cells placed in each of the given chunks, read from the
+        count table without touching the chunk data.
+
+        :param chunks: Chunks to count the cells of.
+        :type chunks: list[~bsb.storage._chunks.Chunk]
+        :returns: Cell count of each chunk, in the order they were given.
+        :rtype: numpy.ndarray[int]
+        """
+        ids = [(c if isinstance(c, Chunk) else Chunk(c, None)).id for c in chunks]
+        return self._counts.get(handle, ids, "count")
 
     @handles_handles("a")
     def append_data(
@@ -336,12 +360,19 @@ class PlacementSet(
     def clear(self, chunks=None, handle=HANDLED):
         path = _root + self.tag
         g = handle.require_group(path)
-        stats = self._engine._read_chunk_stats(handle)
-        for chunk, data in g.items():
-            if chunks is None or chunk in chunks:
-                stats[chunk]["placed"] -= len(data["position"])
-                del g[chunk]
-        self._engine._write_chunk_stats(handle, stats)
+        cleared = [
+            chunk
+            for chunk in self.get_all_chunks(handle=handle)
+            if chunks is None or chunk in chunks
+        ]
+        ids = [chunk.id for chunk in cleared]
+        counts = self._counts.get(handle, ids, "count")
+        self._engine._chunk_stats.add(handle, ids, placed=-counts)
+        table = self._counts.read(handle)
+        self._counts.write(handle, table[~np.isin(table["chunk"], ids)])
+        for chunk in cleared:
+            del g[str(chunk.id)]
+        self._stamp(handle)
 
     @handles_handles("a")
     def label_by_mask(self, labels, mask, handle=HANDLED):
@@ -454,9 +485,9 @@ class PlacementSet(
         """
         # recover ids before applying label filtering
         ids = self.load_ids()[ids]
-        for chunk in self.get_loaded_chunks():
+        chunks = self.get_loaded_chunks()
+        for chunk, ln in zip(chunks, self.count_in_chunks(chunks), strict=True):
             with self.chunk_context([chunk]):
-                ln = len(self._position_chunks.load())
                 idx = ids < ln
                 block = ids[idx]
                 yield chunk, block
@@ -464,22 +495,22 @@ class PlacementSet(
                 ids -= ln
 
     def _track_add(self, handle, chunk, count):
-        # Track addition in global chunk stats
-        global_stats = json.loads(handle.attrs.get("chunks", "{}"))
-        stats = global_stats.setdefault(
-            str(chunk.id), {"placed": 0, "connections": {"inc": 0, "out": 0}}
-        )
-        stats["placed"] += int(count)
-        handle.attrs["chunks"] = json.dumps(global_stats)
-        # Track addition in placement set
-        handle[self._path].attrs["len"] = handle[self._path].attrs.get("len", 0) + count
-        chunk_stats = json.loads(handle[self._path].attrs.get("chunks", "{}"))
-        chunk_stats[str(chunk.id)] = chunk_stats.get(str(chunk.id), 0) + int(count)
-        handle[self._path].attrs["chunks"] = json.dumps(chunk_stats)
+        # Track addition in global chunk stats and in the count table of this set
+        self._engine._chunk_stats.add(handle, [chunk.id], placed=count)
+        self._counts.add(handle, [chunk.id], count=count)
+        self._stamp(handle)
+
+    def _stamp(self, handle):
+        # Mark the cells as changed, for data derived from the cell ids to be rebuilt.
+        handle[self._path].attrs["revision"] = uuid.uuid4().hex
+
+    @handles_handles("r")
+    def _get_revision(self, handle=HANDLED):
+        return handle[self._path].attrs.get("revision", "")
 
     @handles_handles("r")
     def get_chunk_stats(self, handle=HANDLED):
-        return json.loads(handle[self._path].attrs["chunks"])
+        return {str(id): count for id, count in self._counts.read(handle).tolist()}
 
     @handles_handles("r")
     def load_ids(self, handle=HANDLED):
@@ -552,6 +583,13 @@ class PlacementSet(
         )
 
 
+def _legacy_counts(tag, handle, table):
+    # Files written before the count table kept the counts in a JSON attribute.
+    stats = json.loads(handle[_root + tag].attrs.get("chunks", "{}"))
+    rows = [(int(id), count) for id, count in stats.items()]
+    return np.sort(np.array(rows, dtype=table.dtype), order="chunk")
+
+
 def encode_labels(data, ds):
     if ds is None:
         return EncodedLabels.none(len(data))
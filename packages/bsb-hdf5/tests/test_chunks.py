@@ -5,6 +5,8 @@ from bsb import Chunk, Scaffold
 from bsb_test import NumpyTestCase, RandomStorageFixture, skip_parallel, timeout
 from bsb_test.configs import get_test_config
 
+from bsb_hdf5.chunks import ChunkTable
+
 
 class TestChunks(
     RandomStorageFixture, unittest.TestCase, NumpyTestCase, engine_name="hdf5"
@@ -53,3 +55,56 @@ class TestChunks(
         self.assertEqual(
             pos.tolist(), pos2.tolist(), "PlacementSet loaded extraneous chunk data"
         )
+
+
+class TestChunkTable(
+    RandomStorageFixture, unittest.TestCase, NumpyTestCase, engine_name="hdf5"
+):
+    def setUp(self):
+        super().setUp()
+        self.engine = self.storage._engine
+        self.table = ChunkTable("/test_table", ("a", "b"))
+
+    @skip_parallel
+    def test_add(self):
+        with self.engine._write(), self.engine._handle("a") as handle:
+            self.table.add(handle, [5, 2, 5], a=1, b=[1, 2, 3])
+            table = self.table.read(handle)
+            self.assertClose([2, 5], table["chunk"], "rows should be sorted by chunk")
+            self.assertClose([1, 2], table["a"], "duplicate ids should be summed")
+            self.assertClose([2, 4], table["b"])
+            self.table.add(handle, [5], a=-2)
+            self.table.add(handle, [3], b=7)
+            self.assertClose([2, 3, 5], self.table.read(handle)["chunk"])
+            self.assertClose([1, 0, 0], self.table.get(handle, [2, 3, 5], "a"))
+            self.assertClose([0, 7, 0], self.table.get(handle, [9, 3, 4], "b"))
+
+    @skip_parallel
+    def test_legacy(self):
+        def legacy(handle, table):
+            return np.array([(1, 2, 3)], dtype=table.dtype)
+
+        table = ChunkTable("/test_table", ("a", "b"), legacy=legacy)
+        with self.engine._write(), self.engine._handle("a") as handle:
+            self.assertClose([2], table.get(handle, [1], "a"), "should read legacy")
+            self.assertNotIn("/test_table", handle, "reading shouldn't migrate")
+            table.add(handle, [1], a=1)
+            self.assertClose([3], table.get(handle, [1], "a"), "should add to legacy")
+            self.assertIn("/test_table", handle, "writing should migrate")
+
+    @skip_parallel
+    def test_cached_ids(self):
+        # A second table object stands in for another process writing the same table.
+        other = ChunkTable("/test_table", ("a", "b"))
+        with self.engine._write(), self.engine._handle("a") as handle:
+            self.table.add(handle, [1, 2], a=1)
+            ids = self.table._chunk_ids(handle)
+            self.table.add(handle, [2], a=1)
+            self.assertIs(ids, self.table._chunk_ids(handle), "ids should be cached")
+            # Inserting a chunk before the others moves their rows.
+            other.add(handle, [0], a=1)
+            self.table.add(handle, [2], b=1)
+            self.assertClose([1, 1, 2], self.table.get(handle, [0, 1, 2], "a"))
+            self.assertClose([0, 0, 1], other.get(handle, [0, 1, 2], "b"))
+            self.table.write(handle, [])
+            self.assertClose([0], other.get(handle, [0], "a"), "rewrite should reload")
@@ -1,7 +1,13 @@
 import unittest
 
+import numpy as np
 from bsb import Scaffold, WorkflowError
-from bsb_test import FixedPosConfigFixture, NumpyTestCase, RandomStorageFixture
+from bsb_test import (
+    FixedPosConfigFixture,
+    NumpyTestCase,
+    RandomStorageFixture,
+    skip_parallel,
+)
 
 from bsb_hdf5.connectivity_set import LocationOutOfBoundsError
 
@@ -39,3 +45,150 @@ class TestConnectivitySet(
             self.assertEqual(
                 type(wfe.exception.exceptions[0].error), LocationOutOfBoundsError
             )
+
+    @skip_parallel
+    def test_stored_adjacency(self):
+        self.network.compile(append=True, skip_placement=True)
+        cs = self.network.get_connectivity_set("all_to_all")
+        adj = cs.get_adjacency("inc")
+        self.assertTrue(cs._has_adjacency("inc"), "index should be stored")
+        self.assertFalse(cs._has_adjacency("out"), "only requested index is built")
+        self.assertClose(adj.indices, cs.get_adjacency("inc").indices)
+        self.assertClose(100, adj.degree())
+        cs.connect(
+            self.network.get_placement_set("test_cell"),
+            self.network.get_placement_set("test_cell"),
+            [[4, -1, -1]],
+            [[2, -1, -1]],
+        )
+        self.assertFalse(cs._has_adjacency("inc"), "index should be invalidated")
+        self.assertEqual(101, cs.in_degree(2))
+        self.assertEqual(2, np.count_nonzero(cs.neighbours(2, "inc") == 4))
+
+    @skip_parallel
+    def test_stored_adjacency_placement(self):
+        self.network.compile(append=True, skip_placement=True)
+        cs = self.network.get_connectivity_set("all_to_all")
+        ps = self.network.get_placement_set("test_cell")
+        rows = len(cs.get_adjacency("out").indptr)
+        ps.append_data(ps.get_all_chunks()[0], [[0, 0, 0]])
+        self.assertFalse(cs._has_adjacency("out"), "index should be outdated")
+        adj = cs.get_adjacency("out")
+        self.assertEqual(rows + 1, len(adj.indptr))
+        self.assertEqual(len(cs), np.sum(adj.degree()))
+        # Re-placing the same number of cells also outdates the index.
+        chunk = ps.get_all_chunks()[0]
+        with ps.chunk_context([chunk]):
+            positions = ps.load_positions()
+        ps.clear([chunk])
+        ps.append_data(chunk, positions)
+        self.assertEqual(rows, len(ps), "cell count should be unchanged")
+        self.assertFalse(cs._has_adjacency("out"), "index should be outdated")
+
+
+class TestLogLayout(
+    FixedPosConfigFixture,
+    RandomStorageFixture,
+    NumpyTestCase,
+    unittest.TestCase,
+    engine_name="hdf5",
+):
+    def setUp(self):
+        super().setUp()
+        self.cfg.connectivity.add(
+            "all_to_all",
+            dict(
+                strategy="bsb.connectivity.AllToAll",
+                presynaptic=dict(cell_types=["test_cell"]),
+                postsynaptic=dict(cell_types=["test_cell"]),
+            ),
+        )
+        self.network = Scaffold(self.cfg, self.storage)
+        self.network.compile(clear=True)
+        self.sorted = self.network.get_connectivity_set("all_to_all")
+        ct = self.network.cell_types.test_cell
+        self.log = self.storage._ConnectivitySet.require(
+            self.storage._engine, ct, ct, "log", layout="log"
+        )
+        self.log.pre_type = self.log.post_type = ct
+
+    def _replay(self):
+        # Write the sorted data into the log set, split in several segments per block,
+        # in an interleaved order.
+        blocks = list(self.sorted.flat_iter_connections("out"))
+        for half in (slice(None, 300), slice(300, None)):
+            for _, lchunk, gchunk, (lloc, gloc) in reversed(blocks):
+                self.log.chunk_connect(lchunk, gchunk, lloc[half], gloc[half])
+
+    def _assert_same(self):
+        self.assertEqual(len(self.sorted), len(self.log))
+        for direction in ("inc", "out"):
+            self.assertEqual(
+                self.sorted.get_local_chunks(direction),
+                self.log.get_local_chunks(direction),
+            )
+            for lchunk in self.sorted.get_local_chunks(direction):
+                self.assertEqual(
+                    self.sorted.get_global_chunks(direction, lchunk),
+                    self.log.get_global_chunks(direction, lchunk),
+                )
+                for gchunk in self.sorted.get_global_chunks(direction, lchunk):
+                    expected = self.sorted.load_block_connections(
+                        direction, lchunk, gchunk
+                    )
+                    data = self.log.load_block_connections(direction, lchunk, gchunk)
+                    self.assertClose(expected[0], data[0])
+                    self.assertClose(expected[1], data[1])
+                lloc, gcol, gloc = self.log.load_local_connections(direction, lchunk)
+                _, expected_gcol, _ = self.sorted.load_local_connections(
+                    direction, lchunk
+                )
+                self.assertEqual(sorted(expected_gcol), sorted(gcol))
+        pre, post = self.log.load_connections().all()
+        expected_pre, expected_post = self.sorted.load_connections().all()
+        order = np.lexsort((*pre.T, *post.T))
+        expected_order = np.lexsort((*expected_pre.T, *expected_post.T))
+        self.assertClose(expected_pre[expected_order], pre[order])
+        self.assertClose(expected_post[expected_order], post[order])
+
+    @skip_parallel
+    def test_log_reads(self):
+        self._replay()
+        self.assertFalse(self.log.is_compacted())
+        self._assert_same()
+
+    @skip_parallel
+    def test_compact(self):
+        self._replay()
+        self.log.compact()
+        self.assertTrue(self.log.is_compacted())
+        self._assert_same()
+        # Append after compaction, and compact the mixed sorted and logged data.
+        self._replay()
+        self.sorted = self.storage._ConnectivitySet.require(
+            self.storage._engine,
+            self.log.pre_type,
+            self.log.post_type,
+            "double",
+            layout="sorted",
+        )
+        self.sorted.pre_type = self.sorted.post_type = self.log.pre_type
+        for _, lchunk, gchunk, (lloc, gloc) in self.network.get_connectivity_set(
+            "all_to_all"
+        ).flat_iter_connections("out"):
+            self.sorted.chunk_connect(lchunk, gchunk, lloc, gloc)
+            self.sorted.chunk_connect(lchunk, gchunk, lloc, gloc)
+        self._assert_same()
+        self.storage.flush()
+        self.assertTrue(self.log.is_compacted())
+        self._assert_same()
+
+    @skip_parallel
+    def test_clear(self):
+        self._replay()
+        self.log.clear()
+        self.assertEqual(0, len(self.log))
+        stats = self.storage.get_chunk_stats()
+        self.assertEqual(
+            len(self.sorted), sum(s["connections"]["out"] for s in stats.values())
+        )
@@ -1,6 +1,8 @@
+import json
 import unittest
 
 import numpy as np
+from bsb_test import skip_parallel
 from bsb_test.engines import TestConnectivitySet as _TestConnectivitySet
 from bsb_test.engines import TestMorphologyRepository as _TestMorphologyRepository
 from bsb_test.engines import TestPlacementSet as _TestPlacementSet
@@ -8,7 +10,18 @@ from bsb_test.engines import TestStorage as _TestStorage
 
 
 class TestStorage(_TestStorage, unittest.TestCase, engine_name="hdf5"):
-    pass
+    @skip_parallel
+    def test_chunk_stats_migration(self):
+        stats = {"3": {"placed": 4, "connections": {"inc": 5, "out": 6}}}
+        engine = self.storage._engine
+        with engine._write(), engine._handle("a") as handle:
+            handle.attrs["chunks"] = json.dumps(stats)
+        self.assertEqual(stats, self.storage.get_chunk_stats(), "should read old stats")
+        with engine._write(), engine._handle("a") as handle:
+            engine._chunk_stats.add(handle, [3, 4], placed=1)
+        stats["3"]["placed"] = 5
+        stats["4"] = {"placed": 1, "connections": {"inc": 0, "out": 0}}
+        self.assertEqual(stats, self.storage.get_chunk_stats(), "should migrate stats")
 
 
 class TestPlacementSet(_TestPlacementSet, unittest.TestCase, engine_name="hdf5"):
@@ -37,6 +50,33 @@ class TestPlacementSet(_TestPlacementSet, unittest.TestCase, engine_name="hdf5")
             "it should return an array of pop_size size filled with False values",
         )
 
+    @skip_parallel
+    def test_count_table_migration(self):
+        self.network.compile()
+        ps = self.network.get_placement_set("test_cell")
+        # Mimic a file written before the count table existed.
+        engine = self.network.storage._engine
+        with engine._write(), engine._handle("a") as handle:
+            del handle[ps._counts.path]
+            handle[ps._path].attrs["chunks"] = json.dumps(
+                {str(c.id): 25 for c in self.chunks}
+            )
+        self.assertEqual(100, len(ps), "counts should be rebuilt from old stats")
+        ps.append_data(self.chunks[0], [[0, 0, 0]])
+        with engine.read_scope() as handle:
+            self.assertIn(ps._counts.path, handle, "table should be written on append")
+        self.assertClose([26, 25, 25, 25], ps.count_in_chunks(self.chunks))
+        self.assertEqual(
+            sorted(self.chunks), sorted(ps.get_all_chunks()), "table isn't a chunk"
+        )
+
+    def test_entities_len(self):
+        self.network.compile()
+        ps = self.network.get_placement_set("test_cell")
+        ps.clear()
+        ps.append_entities(self.chunks[0], 12)
+        self.assertEqual(12, len(ps), "entities should be counted")
+
 
 class TestMorphologyRepository(
     _TestMorphologyRepository, unittest.TestCase, engine_name="hdf5"
@@ -46,3 +86,18 @@ class TestMorphologyRepository(
 
 class TestConnectivitySet(_TestConnectivitySet, unittest.TestCase, engine_name="hdf5"):
     pass
+
+
+class _LogLayoutFixture:
+    def setUp(self):
+        self.cfg.storage = dict(engine="hdf5", connectivity_layout="log")
+        super().setUp()
+
+
+class TestLogConnectivitySet(
+    _TestConnectivitySet, _LogLayoutFixture, unittest.TestCase, engine_name="hdf5"
+):
+    def test_compacted(self):
+        cs = self.network.get_connectivity_set("all_to_all")
+        self.assertEqual("log", cs.layout)
+        self.assertTrue(cs.is_compacted(), "log should be compacted after compile")
@@ -4,7 +4,8 @@ import unittest
 
 import h5py
 import numpy as np
-from bsb import MPI, Storage
+from bsb import MPI, Branch, MissingMorphologyError, Morphology, Storage
+from bsb_test import NumpyTestCase, RandomStorageFixture, skip_parallel
 
 
 class TestHandcrafted(unittest.TestCase):
@@ -143,3 +144,76 @@ class TestHandcrafted(unittest.TestCase):
         msg = "1 out of 5 branches was attached, 4 roots expected."
         self.assertEqual(4, len(m.roots), msg)
         self.assertEqual(5, len(m.branches), "Missing branch")
+
+
+class TestMetadata(RandomStorageFixture, unittest.TestCase, engine_name="hdf5"):
+    @skip_parallel
+    def test_legacy_meta(self):
+        mr = self.storage.morphologies
+        m = Morphology([Branch([[0, 0, 0], [1, 1, 1]], [1, 1])])
+        mr.save_many(["A", "B"], [m, m.copy()])
+        with self.storage._engine._write(), self.storage._engine._handle("a") as f:
+            # Mimic a file written before the metadata table existed
+            del f["morphology_table"]
+            f.create_dataset("morphology_meta", data=json.dumps({"A": {"x": 1}}))
+        self.assertEqual({"A": {"x": 1}}, mr.get_all_meta(), "should read old meta")
+        self.assertEqual({"x": 1}, mr.get_meta("A"))
+        mr.update_all_meta({"B": {"y": 2}})
+        self.assertEqual({"A": {"x": 1}, "B": {"y": 2}}, mr.get_all_meta())
+        with self.storage._engine.read_scope() as f:
+            self.assertNotIn("morphology_meta", f, "old meta should be migrated")
+
+    @skip_parallel
+    def test_remove(self):
+        mr = self.storage.morphologies
+        mr.save_many(["A", "B"], [Morphology.empty(), Morphology.empty()])
+        mr.remove("A")
+        self.assertEqual(["B"], list(mr.get_all_meta()), "meta should be removed")
+        with self.assertRaises(MissingMorphologyError):
+            mr.get_meta("A")
+
+
+class TestCompiled(
+    RandomStorageFixture, NumpyTestCase, unittest.TestCase, engine_name="hdf5"
+):
+    def setUp(self):
+        super().setUp()
+        root = Branch([[0, 0, 0], [1, 1, 1]], [1, 2])
+        root.attach_child(Branch([[1, 1, 1], [2, 2, 2], [3, 3, 3]], [1, 1, 1]))
+        root.attach_child(Branch([[1, 1, 1], [0, 2, 0]], [3, 3]))
+        root.label(["soma"])
+        root.children[1].label(["dend"])
+        for i, branch in enumerate(root.get_branches()):
+            branch.set_properties(tau=np.full(len(branch), float(i)))
+        self.morpho = Morphology([root])
+        if MPI.get_rank() == 0:
+            self.storage.morphologies.save("M", self.morpho)
+        MPI.barrier()
+
+    def test_mapped_load(self):
+        m = self.storage.morphologies.load("M")
+        self.assertIsNone(m._roots, "branches should be created lazily")
+        self.assertIsInstance(m.points.base, np.memmap, "points should be mapped")
+        self.assertClose(self.morpho.points, m.points)
+        self.assertClose([0, 0, 1, 1, 1, 2, 2], m.tau)
+        self.assertEqual(["dend", "soma"], m.list_labels())
+        self.assertIsNone(m.copy()._roots, "copies should stay lazy")
+        self.assertEqual(self.morpho, m)
+        self.assertEqual([2, 0, 0], [len(b.children) for b in m.branches])
+        self.assertTrue(m._check_shared(), "branches should share the mapped buffers")
+
+    def test_mapped_changes_private(self):
+        m = self.storage.morphologies.load("M")
+        m.translate([10, 0, 0])
+        m.branches[0].radii[:] = 0
+        m = self.storage.morphologies.load("M")
+        self.assertClose(self.morpho.points, m.points, "file should be unchanged")
+        self.assertClose(self.morpho.radii, m.radii, "file should be unchanged")
+
+    @skip_parallel
+    def test_load_in_write_scope(self):
+        with self.storage._engine.write_scope():
+            self.storage.morphologies.save("N", self.morpho.copy())
+            m = self.storage.morphologies.load("N")
+            self.assertNotIsInstance(m.points.base, np.memmap)
+            self.assertEqual(self.morpho, m)
@@ -0,0 +1,115 @@
+"""
+Benchmark the engines that load stored connections into NEST.
+
+Places ``--cells`` cells, stores ``-n`` random connections between them, and prepares a
+NEST simulation that creates them with the ``--engine`` engine. Reports the time to
+prepare the simulation, and the peak resident memory of each rank before and after.
+Run once per engine, since the peak memory of a process never goes down:
+
+.. code-block:: bash
+
+  mpirun -n 4 python benchmarks/bench_connect.py -n 1e6 --engine local
+  mpirun -n 4 python benchmarks/bench_connect.py -n 1e6 --engine predict
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import nest
+import numpy as np
+from bsb import MPI, Chunk, Configuration, Scaffold, Storage
+
+from bsb_nest import NestAdapter
+
+
+def peak_rss():
+    # Peak resident memory of this process, in MiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build(path, args):
+    cfg = Configuration.default(
+        network={"x": 400, "y": 400, "z": 400, "chunk_size": 100},
+        partitions={"space": {"type": "layer", "thickness": 400}},
+        cell_types={"cell": {"spatial": {"radius": 1, "count": args.cells}}},
+        placement={
+            "place": {
+                "strategy": "bsb.placement.RandomPlacement",
+                "cell_types": ["cell"],
+                "partitions": ["space"],
+            }
+        },
+        simulations={
+            "bench": {
+                "simulator": "nest",
+                "duration": 1,
+                "resolution": 0.1,
+                "cell_models": {"cell": {"model": "iaf_psc_alpha"}},
+                "connection_models": {
+                    "bench": {
+                        "engine": args.engine,
+                        "synapses": [{"weight": 1, "delay": 1}],
+                    }
+                },
+                "devices": {},
+            }
+        },
+    )
+    network = Scaffold(cfg, Storage("hdf5", path))
+    network.compile(clear=True)
+    if MPI.get_rank() == 0:
+        cell_type = network.cell_types.cell
+        size = network.network.chunk_size
+        stats = cell_type.get_placement_set().get_chunk_stats()
+        chunks = [(Chunk.from_id(int(id), size), n) for id, n in stats.items() if n]
+        cs = network.require_connectivity_set(cell_type, cell_type, "bench")
+        rng = np.random.default_rng(0)
+        per_block = max(args.n // len(chunks) ** 2, 1)
+        with network.storage._engine.write_scope():
+            for src, n_src in chunks:
+                for dst, n_dst in chunks:
+                    cs.chunk_connect(
+                        src, dst, locs(rng, n_src, per_block), locs(rng, n_dst, per_block)
+                    )
+    MPI.barrier()
+    return network
+
+
+def locs(rng, n, size):
+    return np.column_stack((rng.integers(n, size=size), np.full((size, 2), -1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, default=1e6, help="connections")
+    parser.add_argument("--cells", type=int, default=10_000)
+    parser.add_argument("--engine", choices=["local", "predict"], default="local")
+    args = parser.parse_args()
+    args.n = int(args.n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = MPI.bcast(os.path.join(tmp, "bench.hdf5"))
+        network = build(path, args)
+        before = peak_rss()
+        adapter = NestAdapter()
+        adapter.reset_kernel()
+        MPI.barrier()
+        start = time.perf_counter()
+        adapter.prepare(network.simulations.bench)
+        MPI.barrier()
+        elapsed = time.perf_counter() - start
+        peaks = MPI.gather((before, peak_rss()))
+        connections = nest.num_connections
+        adapter.reset_kernel()
+        MPI.barrier()
+    if MPI.get_rank() == 0:
+        print(f"{args.engine}: {connections} connections in {elapsed:.2f} s")
+        print(f"{'rank':>5} {'peak before (MiB)':>18} {'peak after (MiB)':>17}")
+        for rank, (before, after) in enumerate(peaks):
+            print(f"{rank:>5} {before:>18.0f} {after:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
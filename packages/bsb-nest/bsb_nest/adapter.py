@@ -40,10 +40,19 @@ class NestResult(SimulationResult):
                     **annotations,
                 )
             )
-            # Free the Memory -> not possible to free the memory while sim is running
+            self.clear_events(recorder)
 
         self.create_recorder(flush)
 
+    def clear_events(self, device):
+        """
+        Clear the events of a recording device after they were flushed, when the
+        results are streamed, so that only the new events are handed over on the next
+        flush. Otherwise, the events remain available on the device.
+        """
+        if self.streaming:
+            device.n_events = 0
+
 
 class NestAdapter(SimulatorAdapter):
     def __init__(self, comm=None):
@@ -119,6 +119,13 @@ class NestConnection(compose_nodes(NestConnectionSettings, ConnectionModel)):
 
     synapses = config.list(type=NestSynapseSettings, required=True)
     """List of synapse models to use for a connection."""
+    engine: str = config.attr(type=types.in_(["local", "predict"]), default="local")
+    """
+    How to load the stored connections, if no ``rule`` is given. ``local`` reads a share
+    of the connection blocks on each rank, and sends each connection to the rank that
+    simulates its postsynaptic cell. ``predict`` reads all the connections on every
+    rank, in parts that fit the available memory.
+    """
 
     def create_connections(self, simdata, pre_nodes, post_nodes, cs, comm):
         import nest
@@ -131,6 +138,26 @@ class NestConnection(compose_nodes(NestConnectionSettings, ConnectionModel)):
                 self.get_conn_spec(),
                 nest.CollocatedSynapses(*syn_specs),
             )
+        elif self.engine == "local":
+            local_nodes = nest.GetLocalNodeCollection(post_nodes).tolist()
+            post_ids = np.array(post_nodes.tolist())
+            pre, post, multiplicity = self.load_local_connections(
+                cs, np.isin(post_ids, local_nodes), comm
+            )
+            if len(pre):
+                pre_ids = np.array(pre_nodes.tolist())
+                for syn_spec in syn_specs:
+                    ssw = {**syn_spec}
+                    ssw["weight"] = syn_spec["weight"] * multiplicity
+                    if "delay" in syn_spec:
+                        ssw["delay"] = np.full(len(pre), syn_spec["delay"], dtype=float)
+                    nest.Connect(
+                        pre_ids[pre],
+                        post_ids[post],
+                        "one_to_one",
+                        ssw,
+                        return_synapsecollection=False,
+                    )
         else:
             comm.barrier()
             for pre_locs, post_locs in self.predict_mem_iterator(
@@ -164,6 +191,46 @@ class NestConnection(compose_nodes(NestConnectionSettings, ConnectionModel)):
             comm.barrier()
         return LazySynapseCollection(pre_nodes, post_nodes)
 
+    def load_local_connections(self, cs, local, comm):
+        """
+        Load the connections to the postsynaptic cells simulated on this rank. Each rank
+        reads the blocks of a share of the postsynaptic chunks, and sends each connection
+        to the rank that simulates its postsynaptic cell.
+
+        :param cs: Connectivity set to load.
+        :type cs: bsb.storage.interfaces.ConnectivitySet
+        :param local: Mask of the postsynaptic cells simulated on this rank.
+        :type local: numpy.ndarray[bool]
+        :param comm: MPI communicator of the simulation.
+        :type comm: bsb.services.mpi.MPIService
+        :returns: The presynaptic and postsynaptic cell ids of the unique cell pairs, and
+          the number of connections between each pair.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+        rank, size = comm.get_rank(), comm.get_size()
+        owner = np.zeros(len(local), dtype=int)
+        for r, cells in enumerate(comm.allgather(np.flatnonzero(local))):
+            owner[cells] = r
+        chunks = sorted(cs.get_local_chunks("inc"), key=lambda chunk: chunk.id)
+        itr = cs.load_connections().incoming().as_globals().to(chunks[rank::size])
+        blocks = [
+            np.column_stack((pre_locs[:, 0], post_locs[:, 0]))
+            for _, pre_locs, _, post_locs in itr.chunk_iter()
+        ]
+        pairs = np.concatenate(blocks) if blocks else np.empty((0, 2), dtype=int)
+        # Sort the pairs by destination rank, and send each rank its share.
+        dest = owner[pairs[:, 1]]
+        order = np.argsort(dest, kind="stable")
+        bounds = np.searchsorted(dest[order], np.arange(size + 1))
+        pairs = comm.alltoallv(
+            [pairs[order[bounds[r] : bounds[r + 1]]] for r in range(size)]
+        )
+        # Merge the multapses of each cell pair.
+        keys, multiplicity = np.unique(
+            pairs[:, 0] * len(local) + pairs[:, 1], return_counts=True
+        )
+        return keys // len(local), keys % len(local), multiplicity
+
     def predict_mem_iterator(self, pre_nodes, post_nodes, cs, comm):
         avmem = psutil.virtual_memory().available
         predicted_all_mem = (
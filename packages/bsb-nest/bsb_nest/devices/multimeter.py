@@ -40,13 +40,14 @@ class Multimeter(NestDevice, classmap_entry="multimeter"):
         self.connect_to_nodes(device, nodes)
 
         def recorder(segment):
-            senders = device.events["senders"]
+            events = device.events
+            senders = events["senders"]
             for sender in np.unique(senders):
                 sender_filter = senders == sender
                 for prop, unit in zip(self.properties, self.units, strict=False):
                     segment.analogsignals.append(
                         AnalogSignal(
-                            device.events[prop][sender_filter],
+                            events[prop][sender_filter],
                             units=pq.units.__dict__[unit],
                             sampling_period=self.simulation.resolution * pq.ms,
                             name=self.name,
@@ -55,5 +56,6 @@ class Multimeter(NestDevice, classmap_entry="multimeter"):
                             prop_recorded=prop,
                         )
                     )
+            simdata.result.clear_events(device)
 
         simdata.result.create_recorder(recorder)
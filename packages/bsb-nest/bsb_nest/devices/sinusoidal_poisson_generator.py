@@ -49,15 +49,17 @@ class SinusoidalPoissonGenerator(
         self.connect_to_nodes(device, nodes)
 
         def recorder(segment):
+            events = sr.events
             segment.spiketrains.append(
                 SpikeTrain(
-                    sr.events["times"],
+                    events["times"],
                     units="ms",
-                    array_annotations={"senders": sr.events["senders"]},
+                    array_annotations={"senders": events["senders"]},
                     t_stop=simulation.duration,
                     device=self.name,
                     pop_size=len(nodes),
                 )
             )
+            simdata.result.clear_events(sr)
 
         simdata.result.create_recorder(recorder)
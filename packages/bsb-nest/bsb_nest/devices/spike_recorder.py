@@ -15,15 +15,17 @@ class SpikeRecorder(NestDevice, classmap_entry="spike_recorder"):
         self.connect_to_nodes(device, nodes)
 
         def recorder(segment):
+            events = device.events
             segment.spiketrains.append(
                 SpikeTrain(
-                    device.events["times"],
+                    events["times"],
                     units="ms",
-                    array_annotations={"senders": device.events["senders"]},
+                    array_annotations={"senders": events["senders"]},
                     t_stop=simulation.duration,
                     device=self.name,
                     pop_size=len(nodes),
                 )
             )
+            simdata.result.clear_events(device)
 
         simdata.result.create_recorder(recorder)
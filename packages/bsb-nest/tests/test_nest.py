@@ -226,6 +226,23 @@ class TestNest(
         self.assertAlmostEqual(rate_in, 50, delta=1)
         self.assertAlmostEqual(rate_ex, 50, delta=1)
 
+    def test_connection_engines(self):
+        network = Scaffold(get_test_config("brunel_wbsb"), self.storage)
+        network.compile()
+        simulation = network.simulations.test_nest
+        connections = []
+        for engine in ("local", "predict"):
+            for connection_model in simulation.connection_models.values():
+                connection_model.engine = engine
+            adapter = NestAdapter()
+            adapter.reset_kernel()
+            adapter.prepare(simulation)
+            data = nest.GetConnections().get(["source", "target", "weight"])
+            data = np.column_stack((data["source"], data["target"], data["weight"]))
+            connections.append(data[np.lexsort(data.T[::-1])])
+        adapter.reset_kernel()
+        self.assertClose(*connections, "engines should create the same connections")
+
     def test_iaf_cond_alpha(self):
         """
         Create an iaf_cond_alpha in NEST, and with the BSB, with a base current, and check
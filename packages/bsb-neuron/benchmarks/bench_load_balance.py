@@ -0,0 +1,155 @@
+"""
+Benchmark the load balancers of the NEURON adapter, without simulating.
+
+Builds a layered network with a dense layer of small cells under a thin layer of large
+Purkinje-like cells, and connects the small cells to the large cells. ``--network``
+balances the first NEURON simulation of an existing network file instead. Reports the
+imbalance that each load balancer predicts for ``--ranks`` ranks: the load of the most
+loaded rank over the mean load, where the load of a rank is the estimated cost of its
+chunks. An imbalance of 1 means that no rank waits on another:
+
+.. code-block:: bash
+
+  python benchmarks/bench_load_balance.py --ranks 4 12 24
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from bsb import Branch, Chunk, Configuration, Morphology, Scaffold, Storage, from_storage
+
+from bsb_neuron import CostBalancer, LoadBalancer
+
+hh_soma = {
+    "cable_types": {
+        "soma": {"cable": {"Ra": 10, "cm": 1}, "mechanisms": {"pas": {}, "hh": {}}}
+    },
+    "synapse_types": {"ExpSyn": {}},
+}
+# Name, layer, density, points per morphology
+cells = [
+    ("granule", "granular", 4e-4, 4),
+    ("golgi", "granular", 4e-6, 400),
+    ("purkinje", "purkinje", 2e-5, 4000),
+    ("stellate", "molecular", 1e-5, 100),
+]
+
+
+def morphology(rng, points):
+    return Morphology([Branch(rng.random((points, 3)) * 10, np.ones(points))])
+
+
+def build(path, args):
+    rng = np.random.default_rng(0)
+    cfg = Configuration.default(
+        network={"x": args.size, "y": 600, "z": args.size, "chunk_size": args.chunk},
+        partitions={
+            "granular": {"type": "layer", "thickness": 300},
+            "purkinje": {"type": "layer", "thickness": 30},
+            "molecular": {"type": "layer", "thickness": 270},
+        },
+        regions={
+            "cortex": {"type": "stack", "children": ["granular", "purkinje", "molecular"]}
+        },
+        cell_types={
+            name: {
+                "spatial": {
+                    "radius": 1,
+                    "density": density,
+                    "morphologies": [{"names": [name]}],
+                }
+            }
+            for name, _, density, _ in cells
+        },
+        placement={
+            name: {
+                "strategy": "bsb.placement.RandomPlacement",
+                "cell_types": [name],
+                "partitions": [layer],
+            }
+            for name, layer, _, _ in cells
+        },
+        simulations={
+            "bench": {
+                "simulator": "neuron",
+                "duration": 1,
+                "temperature": 32,
+                "cell_models": {name: {"model": hh_soma} for name, *_ in cells},
+                "connection_models": {},
+                "devices": {},
+            }
+        },
+    )
+    storage = Storage("hdf5", path)
+    for name, _, _, points in cells:
+        storage.morphologies.save(name, morphology(rng, points), overwrite=True)
+    network = Scaffold(cfg, storage)
+    network.compile(clear=True)
+    # Each Purkinje cell receives `--indegree` connections from granule cells.
+    granule, purkinje = network.cell_types.granule, network.cell_types.purkinje
+    pre = granule.get_placement_set().get_chunk_stats()
+    post = purkinje.get_placement_set().get_chunk_stats()
+    pre = [(Chunk.from_id(int(id), [args.chunk] * 3), n) for id, n in pre.items() if n]
+    cs = network.require_connectivity_set(granule, purkinje, "bench")
+    with network.storage._engine.write_scope():
+        for id, n in post.items():
+            if not n:
+                continue
+            post_chunk = Chunk.from_id(int(id), [args.chunk] * 3)
+            count = n * args.indegree
+            sources = rng.integers(len(pre), size=count)
+            for i in np.unique(sources):
+                pre_chunk, n_pre = pre[i]
+                k = np.count_nonzero(sources == i)
+                cs.chunk_connect(
+                    pre_chunk, post_chunk, locs(rng, n_pre, k), locs(rng, n, k)
+                )
+    return network
+
+
+def locs(rng, n, size):
+    return np.column_stack((rng.integers(n, size=size), np.full((size, 2), -1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ranks", type=int, nargs="+", default=[4, 12, 24])
+    parser.add_argument("--size", type=float, default=400, help="network width (um)")
+    parser.add_argument("--chunk", type=float, default=70, help="chunk size (um)")
+    parser.add_argument("--indegree", type=int, default=1000)
+    parser.add_argument("--network", help="network file to balance instead")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.network:
+            network = from_storage(args.network)
+        else:
+            network = build(os.path.join(tmp, "bench.hdf5"), args)
+        simulation = next(
+            sim for sim in network.simulations.values() if sim.simulator == "neuron"
+        )
+        chunks, costs = CostBalancer().get_chunk_costs(simulation)
+        index = {chunk.id: i for i, chunk in enumerate(chunks)}
+        print(f"{len(chunks)} chunks, total cost {costs.sum():.3g}")
+        print(f"{'balancer':>12} {'ranks':>6} {'max/mean':>9} {'time (s)':>9}")
+        balancers = {
+            "round_robin": LoadBalancer(strategy="round_robin"),
+            "lpt": CostBalancer(partition="lpt"),
+            "curve": CostBalancer(partition="curve"),
+        }
+        for name, balancer in balancers.items():
+            for size in args.ranks:
+                start = time.perf_counter()
+                alloc = balancer.allocate(simulation, size)
+                elapsed = time.perf_counter() - start
+                loads = [sum(costs[index[chunk.id]] for chunk in rank) for rank in alloc]
+                print(
+                    f"{name:>12} {size:>6} {max(loads) / np.mean(loads):>9.2f}"
+                    f" {elapsed:>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
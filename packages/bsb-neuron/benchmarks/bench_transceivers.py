@@ -0,0 +1,111 @@
+"""
+Benchmark the transceiver mapping of the NEURON adapter.
+
+Places ``--cells`` cells, stores ``-n`` random connections between them, and times how
+long each rank takes to number the transmitters and look up the GIDs of its receivers,
+without instantiating any cells:
+
+.. code-block:: bash
+
+  python benchmarks/bench_transceivers.py -n 1e6
+  mpirun -n 4 python benchmarks/bench_transceivers.py -n 1e6
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from bsb import MPI, Chunk, Configuration, Scaffold, Storage
+
+from bsb_neuron import NeuronAdapter
+from bsb_neuron.adapter import NeuronSimulationData
+
+soma = {
+    "cable_types": {"soma": {"cable": {"Ra": 10, "cm": 1}, "mechanisms": {"pas": {}}}},
+    "synapse_types": {"ExpSyn": {}},
+}
+
+
+def build(path, args):
+    cfg = Configuration.default(
+        network={"x": 400, "y": 400, "z": 400, "chunk_size": 100},
+        partitions={"space": {"type": "layer", "thickness": 400}},
+        cell_types={"cell": {"spatial": {"radius": 1, "count": args.cells}}},
+        placement={
+            "place": {
+                "strategy": "bsb.placement.RandomPlacement",
+                "cell_types": ["cell"],
+                "partitions": ["space"],
+            }
+        },
+        simulations={
+            "bench": {
+                "simulator": "neuron",
+                "duration": 1,
+                "temperature": 32,
+                "cell_models": {"cell": {"model": soma}},
+                "connection_models": {"bench": {"synapses": ["ExpSyn"]}},
+                "devices": {},
+            }
+        },
+    )
+    network = Scaffold(cfg, Storage("hdf5", path))
+    network.compile(clear=True)
+    if MPI.get_rank() == 0:
+        cell_type = network.cell_types.cell
+        size = network.network.chunk_size
+        stats = cell_type.get_placement_set().get_chunk_stats()
+        chunks = [(Chunk.from_id(int(id), size), n) for id, n in stats.items() if n]
+        cs = network.require_connectivity_set(cell_type, cell_type, "bench")
+        rng = np.random.default_rng(0)
+        per_block = max(args.n // len(chunks) ** 2, 1)
+        with network.storage._engine.write_scope():
+            for src, n_src in chunks:
+                for dst, n_dst in chunks:
+                    cs.chunk_connect(
+                        src, dst, locs(rng, n_src, per_block), locs(rng, n_dst, per_block)
+                    )
+    MPI.barrier()
+    return network
+
+
+def locs(rng, n, size):
+    # Transmitters on one of 5 branches of each cell, receivers on the soma.
+    return np.column_stack(
+        (rng.integers(n, size=size), rng.integers(5, size=size), np.zeros(size))
+    ).astype(int)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, default=1e6, help="connections")
+    parser.add_argument("--cells", type=int, default=10_000)
+    args = parser.parse_args()
+    args.n = int(args.n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = MPI.bcast(os.path.join(tmp, "bench.hdf5"))
+        network = build(path, args)
+        simulation = network.simulations.bench
+        adapter = NeuronAdapter()
+        simdata = adapter.simdata[simulation] = NeuronSimulationData(simulation)
+        adapter.load_balance(simulation)
+        MPI.barrier()
+        start = time.perf_counter()
+        adapter._allocate_transmitters(simulation)
+        elapsed = time.perf_counter() - start
+        transmap = simdata.transmap[simulation.connection_models.bench]
+        timings = MPI.gather(
+            (elapsed, len(transmap["transmitters"]), len(transmap["receivers"]))
+        )
+        MPI.barrier()
+    if MPI.get_rank() == 0:
+        print(f"{args.n} connections, {adapter.next_gid} transmitters")
+        print(f"{'rank':>5} {'time (s)':>9} {'transmitters':>13} {'receivers':>10}")
+        for rank, (elapsed, transmitters, receivers) in enumerate(timings):
+            print(f"{rank:>5} {elapsed:>9.2f} {transmitters:>13} {receivers:>10}")
+
+
+if __name__ == "__main__":
+    main()
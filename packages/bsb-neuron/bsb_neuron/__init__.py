@@ -12,12 +12,16 @@ from .devices import (
     VoltageClamp,
     VoltageRecorder,
 )
+from .load_balance import CostBalancer, LoadBalancer, RoundRobinBalancer
 from .simulation import NeuronSimulation
 
 __plugin__ = SimulationBackendPlugin(Simulation=NeuronSimulation, Adapter=NeuronAdapter)
 
 __all__ = [
     "NeuronAdapter",
+    "CostBalancer",
+    "LoadBalancer",
+    "RoundRobinBalancer",
     "CurrentClamp",
     "SpikeGenerator",
     "SynapseRecorder",
@@ -4,7 +4,6 @@ import itertools
 import numpy as np
 from bsb import (
     AdapterError,
-    Chunk,
     DatasetNotFoundError,
     SimulationData,
     SimulationError,
@@ -113,10 +112,9 @@ class NeuronAdapter(SimulatorAdapter):
 
     def load_balance(self, simulation):
         simdata = self.simdata[simulation]
-        chunk_stats = simulation.scaffold.storage.get_chunk_stats()
-        size = self.comm.get_size()
-        all_chunks = [Chunk.from_id(int(chunk), None) for chunk in chunk_stats]
-        simdata.node_chunk_alloc = [all_chunks[rank::size] for rank in range(0, size)]
+        simdata.node_chunk_alloc = simulation.load_balancing.allocate(
+            simulation, self.comm.get_size()
+        )
         simdata.chunk_node_map = {}
         for node, chunks in enumerate(simdata.node_chunk_alloc):
             for chunk in chunks:
@@ -178,95 +176,114 @@ class NeuronAdapter(SimulatorAdapter):
     def _allocate_transmitters(self, simulation):
         simdata = self.simdata[simulation]
         first = self.next_gid
-        chunk_stats = simulation.scaffold.storage.get_chunk_stats()
-        max_trans = sum(stats["connections"]["out"] for stats in chunk_stats.values())
+        simdata.transmap, max_trans = self._map_transceivers(simulation, simdata)
         report(
             f"Allocated GIDs {first} to {first + max_trans}",
             level=3,
         )
         self.next_gid += max_trans
         simdata.alloc = (first, self.next_gid)
-        simdata.transmap = self._map_transceivers(simulation, simdata)
 
     def _map_transceivers(self, simulation, simdata):
+        # The transmitters of each presynaptic type get consecutive GIDs, in the order
+        # of their global cell id and branch. Each rank reads the outgoing connections of
+        # its own chunks, and numbers the transmitters on them: the transmitter counts of
+        # all chunks tell it where the GIDs of each of its chunks start. It then sends
+        # the GIDs to the ranks with cells that receive from them, in a single exchange.
+        rank_of = {chunk.id: node for chunk, node in simdata.chunk_node_map.items()}
+        conn_models = list(simulation.get_connectivity_sets().items())
+        pre_types = sorted(
+            {cs.pre_type for _, cs in conn_models}, key=lambda pre_type: pre_type.name
+        )
+        local = [
+            self._read_transmitters(simdata, rank_of, pre_type, conn_models)
+            for pre_type in pre_types
+        ]
+        gathered = self.comm.allgather([transmitters["counts"] for transmitters in local])
+        counts = [
+            np.sum(type_counts, axis=0) for type_counts in zip(*gathered, strict=True)
+        ]
+        transmap = {cm: {"transmitters": {}, "receivers": {}} for cm, _ in conn_models}
+        sends = [np.empty((0, 5), dtype=int)]
         offset = 0
-        transmap = {}
-
-        pre_types = set(cs.pre_type for cs in simulation.get_connectivity_sets().values())
-        for pre_type in sorted(pre_types, key=lambda pre_type: pre_type.name):
-            data = []
-            for _cm, cs in simulation.get_connectivity_sets().items():
-                if cs.pre_type != pre_type:
-                    continue
-                pre, _ = cs.load_connections().as_globals().all()
-                data.append(pre[:, :2])
-
-            data = self.better_concat(data)
-            # Save all transmitters of the same pre_type across connectivity sets
-            all_cm_transmitters = np.unique(data, axis=0)
-            for cm, cs in simulation.get_connectivity_sets().items():
+        for pre_type, transmitters, type_counts in zip(
+            pre_types, local, counts, strict=True
+        ):
+            # GID of each transmitter: the start of its type, plus the transmitters in
+            # the chunks before its chunk, plus those before it in its chunk.
+            chunk = transmitters["chunk"]
+            starts = np.cumsum(type_counts) - type_counts
+            gids = offset + starts[chunk] + np.arange(len(chunk))
+            gids -= np.searchsorted(chunk, chunk)
+            offset += int(np.sum(type_counts))
+            keys, cells = transmitters["keys"], transmitters["cells"]
+            for i, (cm, cs) in enumerate(conn_models):
                 if cs.pre_type != pre_type:
                     continue
-
-                # Now look up which transmitters are on our chunks
-                pre_t, _ = cs.load_connections().from_(simdata.chunks).as_globals().all()
-                our_cm_transmitters = np.unique(pre_t[:, :2], axis=0)
-                # Look up the local ids of those transmitters
-                pre_lc, _ = cs.load_connections().from_(simdata.chunks).all()
-                local_cm_transmitters = np.unique(pre_lc[:, :2], axis=0)
-
-                # Find the common indexes between all the transmitters, and the
-                # transmitters on our chunk.
-                dtype = ", ".join([str(all_cm_transmitters.dtype)] * 2)
-                _, _, idx_tm = np.intersect1d(
-                    our_cm_transmitters.view(dtype),
-                    all_cm_transmitters.view(dtype),
-                    assume_unique=True,
-                    return_indices=True,
-                )
-
-                # Look up which transmitters have receivers on our chunks
-                pre_gc, _ = cs.load_connections().incoming().to(simdata.chunks).all()
-                local_cm_receivers = np.unique(pre_gc[:, :2], axis=0)
-                _, _, idx_rcv = np.intersect1d(
-                    local_cm_receivers.view(dtype),
-                    all_cm_transmitters.view(dtype),
-                    assume_unique=True,
-                    return_indices=True,
+                idx = np.unique(transmitters["index"][transmitters["model"] == i])
+                transmap[cm]["transmitters"] = dict(
+                    zip(
+                        map(tuple, cells[idx].tolist()),
+                        gids[idx].tolist(),
+                        strict=True,
+                    )
                 )
-
-                # Store a map of the local chunk transmitters to their GIDs
-                transmap[cm] = {
-                    "transmitters": dict(
-                        zip(
-                            map(tuple, local_cm_transmitters),
-                            map(int, idx_tm + offset),
-                            strict=False,
-                        )
-                    ),
-                    "receivers": dict(
-                        zip(
-                            map(tuple, local_cm_receivers),
-                            map(int, idx_rcv + offset),
-                            strict=False,
-                        )
-                    ),
-                }
-
-            # Offset by the total amount of transmitter GIDs used by this ConnSet.
-            offset += len(all_cm_transmitters)
-        return transmap
-
-    def better_concat(self, items):
-        if not items:
-            raise RuntimeError("Can not concat 0 items")
-        l_ = sum(len(x) for x in items)
-        r = np.empty((l_, items[0].shape[1]), dtype=items[0].dtype)
-        ptr = 0
-        for x in items:
-            r[ptr : ptr + len(x)] = x
-            ptr += len(x)
-        return r
+            dest, model, idx = transmitters["routes"].T
+            sends.append(np.column_stack((dest, model, keys[idx], gids[idx])))
+        # Route the GIDs to the ranks with receivers, grouped by destination.
+        sends = np.concatenate(sends)
+        sends = sends[np.argsort(sends[:, 0], kind="stable")]
+        bounds = np.searchsorted(sends[:, 0], np.arange(self.comm.get_size() + 1))
+        received = self.comm.alltoallv(
+            [sends[start:stop, 1:] for start, stop in itertools.pairwise(bounds)]
+        )
+        for i, (cm, _) in enumerate(conn_models):
+            rows = received[received[:, 0] == i]
+            transmap[cm]["receivers"] = dict(
+                zip(map(tuple, rows[:, 1:3].tolist()), rows[:, 3].tolist(), strict=True)
+            )
+        return transmap, offset
+
+    def _read_transmitters(self, simdata, rank_of, pre_type, conn_models):
+        # Stream over the outgoing connections of our chunks and collect the unique
+        # transmitters of `pre_type`, which connection models they belong to and which
+        # ranks they must be sent to. Only the blocks from our own chunks are read.
+        stats = pre_type.get_placement_set().get_chunk_stats()
+        chunk_ids = np.array(sorted(int(chunk) for chunk in stats), dtype=np.int64)
+        sizes = np.array([stats[str(id)] for id in chunk_ids], dtype=int)
+        ours = np.isin(chunk_ids, [chunk.id for chunk in simdata.chunks]) * sizes
+        global_starts = np.cumsum(sizes) - sizes
+        # The scoped ids of our cells count only the cells of our chunks.
+        shifts = global_starts - (np.cumsum(ours) - ours)
+        blocks = [np.empty((0, 2), dtype=int)]
+        models = [np.empty(0, dtype=int)]
+        dests = [np.empty(0, dtype=int)]
+        for i, (_, cs) in enumerate(conn_models):
+            if cs.pre_type != pre_type:
+                continue
+            for _, pre_locs, post_chunk, _ in (
+                cs.load_connections().from_(simdata.chunks).as_globals().chunk_iter()
+            ):
+                block = np.unique(pre_locs[:, :2], axis=0)
+                blocks.append(block)
+                models.append(np.full(len(block), i))
+                dests.append(np.full(len(block), rank_of[post_chunk.id]))
+        keys, index = np.unique(np.concatenate(blocks), axis=0, return_inverse=True)
+        index = index.reshape(-1)
+        model = np.concatenate(models, dtype=int)
+        chunk = np.searchsorted(global_starts, keys[:, 0], side="right") - 1
+        return {
+            "keys": keys,
+            "cells": np.column_stack((keys[:, 0] - shifts[chunk], keys[:, 1])),
+            "chunk": chunk,
+            "counts": np.bincount(chunk, minlength=len(chunk_ids)),
+            "index": index,
+            "model": model,
+            "routes": np.unique(
+                np.column_stack((np.concatenate(dests, dtype=int), model, index)),
+                axis=0,
+            ),
+        }
 
     def _create_population(self, simdata, cell_model, ps, offset):
         data = []
@@ -0,0 +1,152 @@
+import abc
+import heapq
+import typing
+
+import numpy as np
+from bsb import Chunk, DatasetNotFoundError, config, types
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from .simulation import NeuronSimulation
+
+
+@config.dynamic(attr_name="strategy", default="cost", auto_classmap=True)
+class LoadBalancer(abc.ABC):
+    """
+    Distributes the chunks of the network over the MPI ranks of a NEURON simulation.
+    Each rank instantiates the cells, and receives the connections, of its chunks.
+    """
+
+    @abc.abstractmethod
+    def allocate(self, simulation: "NeuronSimulation", size: int) -> list[list[Chunk]]:
+        """
+        Allocate the chunks of the network to ``size`` ranks.
+
+        :param simulation: The simulation to balance.
+        :param size: Number of ranks.
+        :returns: The sorted list of chunks of each rank.
+        """
+        pass
+
+    def get_chunks(self, simulation):
+        chunk_stats = simulation.scaffold.storage.get_chunk_stats()
+        return sorted(
+            (Chunk.from_id(int(chunk), None) for chunk in chunk_stats),
+            key=lambda chunk: chunk.id,
+        )
+
+
+@config.node
+class RoundRobinBalancer(LoadBalancer, classmap_entry="round_robin"):
+    """
+    Deal the chunks out to the ranks one by one, regardless of their contents.
+    """
+
+    def allocate(self, simulation, size):
+        chunks = self.get_chunks(simulation)
+        return [chunks[rank::size] for rank in range(size)]
+
+
+@config.node
+class CostBalancer(LoadBalancer, classmap_entry="cost"):
+    """
+    Estimate the cost of simulating each chunk, and give each rank an equal share of the
+    total cost. The cost of a chunk is the number of compartments of its cells, plus
+    ``synapse_cost`` times the number of connections onto its cells.
+    """
+
+    partition: typing.Literal["lpt", "curve"] = config.attr(
+        type=types.in_(["lpt", "curve"]), default="lpt"
+    )
+    """
+    How to divide the chunks: ``lpt`` hands out the most expensive remaining chunk to the
+    least loaded rank, ``curve`` orders the chunks along a Z-order curve and cuts it into
+    contiguous pieces of equal cost, which keeps most connections between neighbouring
+    chunks on the same rank at the expense of a less even division.
+    """
+    synapse_cost: float = config.attr(type=types.float(min=0.0), default=1.0)
+    """Cost of an incoming connection, relative to that of a compartment."""
+
+    def allocate(self, simulation, size):
+        chunks, costs = self.get_chunk_costs(simulation)
+        if self.partition == "lpt":
+            ranks = _lpt(costs, size)
+        else:
+            ranks = _curve(chunks, costs, size)
+        return [
+            [chunks[i] for i in np.flatnonzero(ranks == rank)] for rank in range(size)
+        ]
+
+    def get_chunk_costs(self, simulation):
+        """
+        Estimate the cost of each chunk of the network.
+
+        :returns: The sorted chunks of the network, and their costs.
+        :rtype: tuple[list[bsb.storage._chunks.Chunk], numpy.ndarray]
+        """
+        chunk_stats = simulation.scaffold.storage.get_chunk_stats()
+        ids = np.array(sorted(int(chunk) for chunk in chunk_stats), dtype=np.int64)
+        chunks = [Chunk.from_id(int(id), None) for id in ids]
+        costs = self.synapse_cost * np.array(
+            [chunk_stats[str(id)]["connections"]["inc"] for id in ids], dtype=float
+        )
+        for model in simulation.cell_models.values():
+            ps = model.cell_type.get_placement_set()
+            stats = ps.get_chunk_stats()
+            # Only chunks with cells of this type, in the order of the global chunks.
+            rows = np.flatnonzero([stats.get(str(id), 0) for id in ids])
+            if not len(rows):
+                continue
+            counts = np.array([stats[str(ids[row])] for row in rows], dtype=int)
+            with ps.chunk_context([chunks[row] for row in rows]):
+                compartments = _count_compartments(ps)
+            if compartments is None:
+                costs[rows] += counts
+            else:
+                costs[rows] += np.add.reduceat(compartments, np.cumsum(counts) - counts)
+        return chunks, costs
+
+
+def _count_compartments(ps):
+    # Returns the number of compartments of each cell, or `None` for cells without
+    # morphologies, which we count as a single compartment.
+    try:
+        ms = ps.load_morphologies()
+    except DatasetNotFoundError:
+        return None
+    if not len(ms):
+        return None
+    sizes = np.array([len(loader.load()) for loader in ms._loaders], dtype=float)
+    return sizes[ms.get_indices(copy=False)]
+
+
+def _lpt(costs, size):
+    # Longest processing time first: each chunk, from most to least expensive, goes to
+    # the rank with the lowest load so far. Ties go to the lowest rank.
+    ranks = np.empty(len(costs), dtype=int)
+    heap = [(0.0, rank) for rank in range(size)]
+    for i in np.argsort(-costs, kind="stable"):
+        load, rank = heapq.heappop(heap)
+        ranks[i] = rank
+        heapq.heappush(heap, (load + costs[i], rank))
+    return ranks
+
+
+def _curve(chunks, costs, size):
+    # Order the chunks along a Z-order curve, and cut the curve where the running cost
+    # crosses a multiple of the mean load.
+    coords = np.array(chunks, dtype=np.int64).reshape(-1, 3)
+    coords -= coords.min(axis=0, initial=0)
+    keys = np.zeros(len(coords), dtype=np.int64)
+    for bit in range(16):
+        for dim in range(3):
+            keys |= ((coords[:, dim] >> bit) & 1) << (3 * bit + dim)
+    order = np.argsort(keys, kind="stable")
+    # Each chunk goes to the rank that its midpoint on the curve falls in.
+    running = np.cumsum(costs[order]) - costs[order] / 2
+    total = costs.sum()
+    ranks = np.empty(len(costs), dtype=int)
+    if total:
+        ranks[order] = np.minimum((running * size / total).astype(int), size - 1)
+    else:
+        ranks[order] = np.arange(len(costs)) * size // max(len(costs), 1)
+    return ranks
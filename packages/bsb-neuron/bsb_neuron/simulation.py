@@ -3,6 +3,7 @@ from bsb import Simulation, config, types
 from .cell import NeuronCell
 from .connection import NeuronConnection
 from .device import NeuronDevice
+from .load_balance import LoadBalancer
 
 
 @config.node
@@ -17,6 +18,10 @@ class NeuronSimulation(Simulation):
     """Simulation time step size in milliseconds."""
     temperature = config.attr(type=float, required=True)
     """Temperature of the circuit during simulation."""
+    load_balancing: LoadBalancer = config.attr(
+        type=LoadBalancer, default=dict, call_default=True
+    )
+    """Strategy that distributes the chunks of the network over the MPI ranks."""
     cell_models: config._attrs.cfgdict[NeuronCell] = config.dict(
         type=NeuronCell, required=True
     )
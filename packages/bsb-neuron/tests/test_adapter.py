@@ -1,7 +1,8 @@
+import itertools
 import unittest
 
 import numpy as np
-from bsb import get_simulation_adapter
+from bsb import MPI, get_simulation_adapter
 from bsb_test import (
     ConfigFixture,
     MorphologiesFixture,
@@ -13,6 +14,7 @@ from patch import p
 
 from bsb_neuron.cell import ArborizedModel
 from bsb_neuron.connection import TransceiverModel
+from bsb_neuron.load_balance import CostBalancer, RoundRobinBalancer
 
 
 class TestNeuronPopulation(
@@ -92,3 +94,66 @@ class TestNeuronPopulation(
         float_test = np.array(list_test, dtype=np.float32)
         with self.assertRaises(TypeError):
             pop[float_test]
+
+    def test_transceiver_map(self):
+        """
+        Test that the transmitters are numbered consecutively across ranks, and that each
+        rank knows the GIDs of the transmitters that its cells receive from.
+        """
+        self.network.compile()
+        sim = self.network.simulations.test
+        adapter = get_simulation_adapter(sim.simulator)
+        simdata = adapter.prepare(sim)
+        first, last = simdata.alloc
+        gids = set(
+            itertools.chain.from_iterable(
+                MPI.allgather(
+                    [
+                        gid
+                        for maps in simdata.transmap.values()
+                        for gid in maps["transmitters"].values()
+                    ]
+                )
+            )
+        )
+        self.assertEqual(set(range(last - first)), gids)
+        for cm, cs in sim.get_connectivity_sets().items():
+            receivers = simdata.transmap[cm]["receivers"]
+            pre, _ = cs.load_connections().incoming().to(simdata.chunks).all()
+            self.assertEqual(
+                set(map(tuple, np.unique(pre[:, :2], axis=0).tolist())), set(receivers)
+            )
+            self.assertLessEqual(set(receivers.values()), gids)
+
+    def test_load_balancing(self):
+        """
+        Test that each load balancer hands out every chunk to exactly one rank, and that
+        the cost estimate counts the compartments and incoming connections of a chunk.
+        """
+        self.network.compile()
+        sim = self.network.simulations.test
+        chunks, costs = CostBalancer().get_chunk_costs(sim)
+        stats = self.network.storage.get_chunk_stats()
+        for chunk, cost in zip(chunks, costs, strict=True):
+            compartments = sum(
+                len(m)
+                for model in sim.cell_models.values()
+                for m in model.cell_type.get_placement_set(chunks=[chunk])
+                .load_morphologies()
+                .iter_morphologies()
+            )
+            self.assertEqual(
+                compartments + stats[str(chunk.id)]["connections"]["inc"], cost
+            )
+        for balancer in (
+            RoundRobinBalancer(),
+            CostBalancer(partition="lpt"),
+            CostBalancer(partition="curve"),
+        ):
+            with self.subTest(balancer=balancer):
+                alloc = balancer.allocate(sim, 3)
+                self.assertEqual(3, len(alloc))
+                self.assertEqual(
+                    sorted(chunk.id for chunk in chunks),
+                    sorted(chunk.id for rank in alloc for chunk in rank),
+                )
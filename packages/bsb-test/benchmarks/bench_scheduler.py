@@ -0,0 +1,100 @@
+"""
+Benchmark the bookkeeping of the JobPool scheduler on synthetic jobs.
+
+Jobs are queued in layers, as placement and connectivity strategies queue their chunk
+jobs: every job depends on a few random jobs of the previous layer, requires the cache
+items of its strategy, and looks up the submissions of the previous strategy. The jobs
+are submitted to a single thread that sleeps for ``--job-time`` seconds per job, so that
+they complete one by one, as they would on MPI workers. Any time that the main process
+spends to schedule and complete the jobs on top of ``--job-time`` delays the next job.
+
+.. code-block:: bash
+
+  python benchmarks/bench_scheduler.py -n 1e4 1e5 1e6 --job-time 1e-4
+"""
+
+import argparse
+import concurrent.futures
+import os
+import tempfile
+import time
+
+import numpy as np
+from bsb import Configuration, Scaffold, Storage
+from bsb.services.pool import FunctionJob
+
+
+class SleepExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self, job_time):
+        super().__init__(max_workers=1)
+        self._job_time = job_time
+
+    @property
+    def open(self):
+        return not self._shutdown
+
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(time.sleep, self._job_time)
+
+
+class Strategy:
+    def __init__(self, name):
+        self.name = name
+
+    def get_node_name(self):
+        return self.name
+
+
+def noop(scaffold):
+    pass
+
+
+def run_jobs(network, n, layers, deps, job_time):
+    rng = np.random.default_rng(0)
+    strategies = [Strategy(f"strategy_{i}") for i in range(layers)]
+    size = n // layers
+    with network.create_job_pool(quiet=True) as pool:
+        start = time.perf_counter()
+        previous = []
+        for layer, strategy in enumerate(strategies):
+            if layer:
+                previous = pool.get_submissions_of(strategies[layer - 1])
+            for _ in range(size):
+                job = FunctionJob(
+                    pool,
+                    noop,
+                    (),
+                    {},
+                    deps=[previous[i] for i in rng.integers(len(previous), size=deps)]
+                    if previous
+                    else None,
+                    cache_items=[layer],
+                    submitter=strategy,
+                )
+                pool._put(job)
+        queued = time.perf_counter()
+        with SleepExecutor(job_time) as pool._executor:
+            pool._execute_on_main()
+        executed = time.perf_counter()
+    return queued - start, executed - queued
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=float, nargs="+", default=[1e4, 1e5])
+    parser.add_argument("--layers", type=int, default=10)
+    parser.add_argument("--deps", type=int, default=2)
+    parser.add_argument("--job-time", type=float, default=0)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        network = Scaffold(
+            Configuration.default(), Storage("hdf5", os.path.join(tmp, "bench.hdf5"))
+        )
+        print(f"{'jobs':>10} {'queue (s)':>10} {'execute (s)':>12} {'us/job':>8}")
+        for n in map(int, args.n):
+            queue, execute = run_jobs(network, n, args.layers, args.deps, args.job_time)
+            print(f"{n:>10} {queue:>10.2f} {execute:>12.2f} {execute / n * 1e6:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
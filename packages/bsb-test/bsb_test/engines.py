@@ -223,6 +223,20 @@ class TestPlacementSet(
         MPI.barrier()
         self.assertEqual(0, len(ps), "expected 0 cells after clearing all chunks")
 
+    def test_count_in_chunks(self):
+        self.network.compile()
+        ps = self.network.get_placement_set("test_cell")
+        counts = ps.count_in_chunks(self.chunks)
+        self.assertClose(25, counts, "expected 25 cells in each chunk")
+        self.assertClose([0], ps.count_in_chunks([(5, 5, 5)]), "chunk should be empty")
+        self.assertEqual(
+            {str(c.id): 25 for c in self.chunks},
+            ps.get_chunk_stats(),
+            "chunk stats should match the counts",
+        )
+        ps.set_chunk_filter(self.chunks[:2])
+        self.assertEqual(50, len(ps), "expected 50 cells in 2 chunks")
+
     def test_get_all_chunks(self):
         self.network.compile()
         ps = self.network.get_placement_set("test_cell")
@@ -627,6 +641,20 @@ class TestMorphologyRepository(NumpyTestCase, RandomStorageFixture, engine_name=
                     )
                     self.assertClose(b1.points, b2.points, f"branch {i} points changed")
 
+    @skip_parallel
+    def test_save_many(self):
+        paths = sorted(get_all_morphology_paths(".swc"))[:3]
+        ms = [parse_morphology_file(path) for path in paths]
+        names = [f"M{i}" for i in range(len(ms))]
+        stored = self.mr.save_many(names, ms, overwrite=True)
+        self.assertEqual(names, [sm.name for sm in stored], "names changed")
+        meta = self.mr.get_all_meta()
+        for name, m in zip(names, ms, strict=True):
+            self.assertIn(name, meta, "missing metadata")
+            self.assertClose(m.points, self.mr.load(name).points, "points changed")
+            self.assertClose(meta[name]["ldc"], self.mr.get_meta(name)["ldc"])
+        self.assertLessEqual(set(names), set(self.mr.list()), "missing morphologies")
+
     @skip_parallel
     def test_swc_ldc_mdc(self):
         for path in get_all_morphology_paths(".swc"):
@@ -899,6 +927,37 @@ class TestConnectivitySet(
             "expected each block to have 625 global locs",
         )
 
+    def test_load_globals_from(self):
+        cs = self.network.get_connectivity_set("all_to_all")
+        ids = [
+            np.unique(cs.load_connections().as_globals().from_(chunk).all()[0][:, 0])
+            for chunk in cs.get_local_chunks("out")
+        ]
+        self.assertClose(
+            np.arange(100),
+            np.sort(np.concatenate(ids)),
+            "expected the global ids of each chunk's cells",
+        )
+
+    def test_adjacency(self):
+        cs = self.network.get_connectivity_set("all_to_all")
+        pre, post = cs.load_connections().as_globals().all()
+        for direction, rows, cols in (("out", pre, post), ("inc", post, pre)):
+            with self.subTest(direction=direction):
+                adj = cs.get_adjacency(direction)
+                self.assertEqual(100, len(adj), "expected a row per cell")
+                self.assertClose(np.bincount(rows[:, 0], minlength=100), adj.degree())
+                for cell in (0, 42, 99):
+                    self.assertClose(
+                        np.sort(cols[rows[:, 0] == cell, 0]),
+                        np.sort(adj.neighbours(cell)),
+                    )
+                nb = adj.neighbours([3, 1])
+                self.assertEqual(200, len(nb), "expected 100 neighbours per cell")
+        self.assertClose(100, cs.in_degree([5, 6]))
+        self.assertClose(100, cs.out_degree())
+        self.assertClose(np.arange(100), np.unique(cs.neighbours(7, "inc")))
+
     def test_labelled_cells(self):
         # setting seed necessary for parallel testing
         np.random.seed(0)